@@ -0,0 +1,10 @@
+__all__ = [
+    'bench_bootstrap',
+    'bench_matrix',
+    'bench_probability',
+    'bench_regression',
+    'bench_scaler',
+    'bench_stats',
+    'bench_vector',
+    'harness'
+]
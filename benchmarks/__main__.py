@@ -0,0 +1,76 @@
+"""
+Command line interface of the benchmark suite. Run from the repository
+root:
+
+    python -m benchmarks list
+    python -m benchmarks run [-k PATTERN] [--quick] [--output FILE] [--baseline FILE]
+    python -m benchmarks compare BASELINE CURRENT [--threshold 0.1]
+
+run --output stores the results as JSON, e.g. a baseline before a change,
+and compare (or run --baseline) exits with status 1 if any benchmark got
+slower than the baseline by more than the threshold.
+"""
+import argparse
+import sys
+
+from . import harness
+from . import (bench_bootstrap, bench_matrix, bench_probability,  # noqa: F401
+               bench_regression, bench_scaler, bench_stats, bench_vector)
+
+
+def _report_regressions(baseline, current, threshold: float) -> int:
+    """Print the regressions between two reports, returning the exit status."""
+    regressions = harness.compare(baseline, current, threshold)
+    if not regressions:
+        print(f'No regressions above {threshold:.0%}.')
+        return 0
+    print(f'{len(regressions)} regression(s) above {threshold:.0%}:')
+    for name, old, new, ratio in regressions:
+        print(f'  {name}: {old * 1e6:.2f} us -> {new * 1e6:.2f} us ({ratio:.2f}x)')
+    return 1
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks',
+                                     description='wizardml benchmark suite')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    commands.add_parser('list', help='list the benchmarks and their sizes')
+
+    run = commands.add_parser('run', help='run the benchmarks')
+    run.add_argument('-k', dest='pattern', default='',
+                     help='only run benchmarks whose name contains this')
+    run.add_argument('--quick', action='store_true',
+                     help='only run the smallest size of each benchmark')
+    run.add_argument('--repeats', type=int, default=harness.REPEATS)
+    run.add_argument('--output', help='save the results to this JSON file')
+    run.add_argument('--baseline', help='compare the results with this JSON file')
+    run.add_argument('--threshold', type=float, default=harness.DEFAULT_THRESHOLD)
+
+    compare = commands.add_parser('compare', help='compare two saved results')
+    compare.add_argument('baseline')
+    compare.add_argument('current')
+    compare.add_argument('--threshold', type=float, default=harness.DEFAULT_THRESHOLD)
+
+    args = parser.parse_args(argv)
+    if args.command == 'list':
+        for name, sizes in harness.registered().items():
+            print(f'{name} {sizes}')
+        return 0
+    if args.command == 'compare':
+        baseline, current = harness.load(args.baseline), harness.load(args.current)
+        print(harness.format_report(current, baseline))
+        return _report_regressions(baseline, current, args.threshold)
+
+    report = harness.run(args.pattern, args.quick, args.repeats)
+    baseline = harness.load(args.baseline) if args.baseline else None
+    print(harness.format_report(report, baseline))
+    if args.output:
+        harness.save(report, args.output)
+    if baseline is not None:
+        return _report_regressions(baseline, report, args.threshold)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
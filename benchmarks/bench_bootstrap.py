@@ -0,0 +1,27 @@
+import random
+
+from src.wizardml.math.stats import bootstrap as b
+from src.wizardml.math.stats import stats as s
+from .harness import benchmark
+
+SIZES = [100, 10_000]
+
+# Resamples per benchmark call
+NUM_SAMPLES = 20
+
+
+def _values(n: int) -> list:
+    rng = random.Random(0)
+    return [rng.gauss(0, 1) for _ in range(n)]
+
+
+@benchmark('bootstrap.statistic_median', SIZES)
+def statistic_median(n):
+    x = _values(n)
+    return lambda: b.bootstrap_statistic(x, s.median, NUM_SAMPLES, seed=0)
+
+
+@benchmark('bootstrap.linear_variance', SIZES)
+def linear_variance(n):
+    x = _values(n)
+    return lambda: b.bootstrap_linear_statistic(s.variance, NUM_SAMPLES, x, seed=0)
@@ -0,0 +1,47 @@
+import random
+
+from src.wizardml.math.linear_algebra import matrix as m
+from src.wizardml.math.linear_algebra.decomposition import cholesky
+from .harness import benchmark
+
+SIZES = [16, 64, 128]
+
+
+def _matrix(n: int, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    return [[rng.random() for _ in range(n)] for _ in range(n)]
+
+
+@benchmark('matrix.matmul', SIZES)
+def matmul(n):
+    a, b = _matrix(n, 0), _matrix(n, 1)
+    return lambda: m.matmul(a, b)
+
+
+@benchmark('matrix.matmul_dense', SIZES)
+def matmul_dense(n):
+    a, b = m.DenseMatrix.from_rows(_matrix(n, 0)), m.DenseMatrix.from_rows(_matrix(n, 1))
+    return lambda: m.matmul(a, b)
+
+
+@benchmark('matrix.transpose', SIZES)
+def transpose(n):
+    a = m.DenseMatrix.from_rows(_matrix(n))
+    return lambda: m.transpose(a)
+
+
+@benchmark('matrix.matvec', SIZES)
+def matvec(n):
+    a = m.DenseMatrix.from_rows(_matrix(n))
+    x = [1.0] * n
+    return lambda: m.matvec(a, x)
+
+
+@benchmark('matrix.cholesky', SIZES)
+def cholesky_factor(n):
+    a = m.DenseMatrix.from_rows(_matrix(n))
+    # A^T A + n I is symmetric positive definite
+    spd = m.matmul(m.transpose(a), a)
+    for i in range(n):
+        spd[i, i] += n
+    return lambda: cholesky(spd)
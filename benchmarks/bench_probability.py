@@ -0,0 +1,77 @@
+import random
+
+from src.wizardml.math.linear_algebra import vector as v
+from src.wizardml.math.stats import probability as p
+from .harness import benchmark
+
+SIZES = [1_000, 100_000]
+
+
+def _points(n: int) -> list:
+    rng = random.Random(0)
+    return [rng.uniform(-4, 4) for _ in range(n)]
+
+
+@benchmark('probability.normal_pdf', SIZES)
+def normal_pdf(n):
+    xs = _points(n)
+    return lambda: [p.normal_pdf(x) for x in xs]
+
+
+@benchmark('probability.normal_cdf', SIZES)
+def normal_cdf(n):
+    xs = _points(n)
+    return lambda: [p.normal_cdf(x) for x in xs]
+
+
+@benchmark('probability.uniform_cdf', SIZES)
+def uniform_cdf(n):
+    xs = _points(n)
+    return lambda: [p.uniform_cdf(x) for x in xs]
+
+
+@benchmark('probability.normal_pdf_many', SIZES)
+def normal_pdf_many(n):
+    xs = _points(n)
+    return lambda: p.normal_pdf_many(xs)
+
+
+@benchmark('probability.normal_pdf_many_array', SIZES)
+def normal_pdf_many_array(n):
+    xs = v.as_array(_points(n))
+    return lambda: p.normal_pdf_many(xs)
+
+
+@benchmark('probability.normal_cdf_many', SIZES)
+def normal_cdf_many(n):
+    xs = _points(n)
+    return lambda: p.normal_cdf_many(xs)
+
+
+@benchmark('probability.normal_cdf_many_array', SIZES)
+def normal_cdf_many_array(n):
+    xs = v.as_array(_points(n))
+    return lambda: p.normal_cdf_many(xs)
+
+
+@benchmark('probability.uniform_cdf_many', SIZES)
+def uniform_cdf_many(n):
+    xs = _points(n)
+    return lambda: p.uniform_cdf_many(xs)
+
+
+def _probabilities(n: int) -> list:
+    rng = random.Random(0)
+    return [rng.random() for _ in range(n)]
+
+
+@benchmark('probability.inverse_normal_cdf', SIZES)
+def inverse_normal_cdf(n):
+    ps = _probabilities(n)
+    return lambda: [p.inverse_normal_cdf(q) for q in ps]
+
+
+@benchmark('probability.inverse_normal_cdf_many_array', SIZES)
+def inverse_normal_cdf_many_array(n):
+    ps = v.as_array(_probabilities(n))
+    return lambda: p.inverse_normal_cdf_many(ps)
@@ -0,0 +1,32 @@
+import random
+
+from src.wizardml.classifiers.linear_models import linear_regression as lr
+from .harness import benchmark
+
+SIZES = [100, 1_000, 10_000]
+
+
+def _data(n: int, columns: int = 5):
+    rng = random.Random(0)
+    x = [[rng.random() for _ in range(columns)] for _ in range(n)]
+    y = [sum(x_i) + rng.gauss(0, 0.1) for x_i in x]
+    return x, y
+
+
+@benchmark('regression.fit_gradient', SIZES)
+def fit_gradient(n):
+    x, y = _data(n)
+    return lambda: lr.fit_least_squares_gradient(x, y, learning_rate=0.01,
+                                                 num_steps=5, batch_size=32)
+
+
+@benchmark('regression.fit_exact', SIZES)
+def fit_exact(n):
+    x, y = _data(n)
+    return lambda: lr.fit_least_squares_exact(x, y)
+
+
+@benchmark('regression.fit_ridge_exact', SIZES)
+def fit_ridge_exact(n):
+    x, y = _data(n)
+    return lambda: lr.fit_least_squares_ridge_exact(x, y, alpha=0.1)
@@ -0,0 +1,38 @@
+import random
+
+from src.wizardml.math.linear_algebra.matrix import DenseMatrix
+from src.wizardml.preprocessing import scaler as sc
+from .harness import benchmark
+
+SIZES = [1_000, 10_000]
+
+
+def _rows(n: int, columns: int = 10) -> list:
+    rng = random.Random(0)
+    return [[rng.gauss(5, 2) for _ in range(columns)] for _ in range(n)]
+
+
+@benchmark('scaler.rescale', SIZES)
+def rescale(n):
+    rows = _rows(n)
+    return lambda: sc.rescale(rows)
+
+
+@benchmark('scaler.standard_fit_transform', SIZES)
+def standard_fit_transform(n):
+    rows = _rows(n)
+    return lambda: sc.StandardScaler().fit_transform(rows)
+
+
+@benchmark('scaler.standard_transform_dense', SIZES)
+def standard_transform_dense(n):
+    data = DenseMatrix.from_rows(_rows(n))
+    scaler = sc.StandardScaler().fit(data)
+    out = DenseMatrix(data.rows, data.columns)
+    return lambda: scaler.transform(data, out=out)
+
+
+@benchmark('scaler.robust_fit', SIZES)
+def robust_fit(n):
+    rows = _rows(n)
+    return lambda: sc.RobustScaler().fit(rows)
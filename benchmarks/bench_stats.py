@@ -0,0 +1,78 @@
+import random
+
+from src.wizardml.math.stats import stats as s
+from src.wizardml.math.stats.sketches import QuantileSketch, FrequencySketch
+from src.wizardml.math.stats.summary import describe
+from .harness import benchmark
+
+SIZES = [1_000, 100_000]
+
+
+def _values(n: int, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    return [rng.gauss(0, 1) for _ in range(n)]
+
+
+def _rows(n: int, columns: int = 10) -> list:
+    rng = random.Random(0)
+    return [[rng.gauss(0, 1) for _ in range(columns)] for _ in range(n)]
+
+
+@benchmark('stats.mean', SIZES)
+def mean(n):
+    x = _values(n)
+    return lambda: s.mean(x)
+
+
+@benchmark('stats.median', SIZES)
+def median(n):
+    x = _values(n)
+    return lambda: s.median(x)
+
+
+@benchmark('stats.iqr', SIZES)
+def iqr(n):
+    x = _values(n)
+    return lambda: s.iqr(x)
+
+
+@benchmark('stats.variance', SIZES)
+def variance(n):
+    x = _values(n)
+    return lambda: s.variance(x)
+
+
+@benchmark('stats.corr', SIZES)
+def corr(n):
+    x, y = _values(n, 0), _values(n, 1)
+    return lambda: s.corr(x, y)
+
+
+@benchmark('stats.mode', SIZES)
+def mode(n):
+    x = [int(abs(xi) * 100) for xi in _values(n)]
+    return lambda: s.mode(x)
+
+
+@benchmark('stats.corr_matrix', [1_000, 10_000])
+def corr_matrix(n):
+    rows = _rows(n)
+    return lambda: s.corr_matrix(rows)
+
+
+@benchmark('stats.describe', [1_000, 10_000])
+def describe_rows(n):
+    rows = _rows(n)
+    return lambda: describe(rows)
+
+
+@benchmark('stats.quantile_sketch', [1_000, 10_000])
+def quantile_sketch(n):
+    x = _values(n)
+    return lambda: QuantileSketch(seed=0).update_many(x).quantile(0.5)
+
+
+@benchmark('stats.frequency_sketch', [1_000, 10_000])
+def frequency_sketch(n):
+    x = [int(abs(xi) * 100) for xi in _values(n)]
+    return lambda: FrequencySketch(50).update_many(x).mode()
@@ -0,0 +1,41 @@
+import random
+
+from src.wizardml.math.linear_algebra import vector as v
+from .harness import benchmark
+
+SIZES = [100, 10_000, 100_000]
+
+
+def _vector(n: int, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    return [rng.random() for _ in range(n)]
+
+
+@benchmark('vector.dot', SIZES)
+def dot(n):
+    x, y = _vector(n, 0), _vector(n, 1)
+    return lambda: v.dot(x, y)
+
+
+@benchmark('vector.dot_array', SIZES)
+def dot_array(n):
+    x, y = v.as_array(_vector(n, 0)), v.as_array(_vector(n, 1))
+    return lambda: v.dot(x, y)
+
+
+@benchmark('vector.add', SIZES)
+def add(n):
+    x, y = _vector(n, 0), _vector(n, 1)
+    return lambda: v.add(x, y)
+
+
+@benchmark('vector.vector_sum', [10, 1_000, 10_000])
+def vector_sum(n):
+    vectors = [_vector(100, seed) for seed in range(n)]
+    return lambda: v.vector_sum(vectors)
+
+
+@benchmark('vector.distance', SIZES)
+def distance(n):
+    x, y = _vector(n, 0), _vector(n, 1)
+    return lambda: v.distance(x, y)
@@ -0,0 +1,157 @@
+import json
+import platform
+import time
+import timeit
+from typing import Callable, Dict, List, Tuple
+
+from src.wizardml.math.linear_algebra.vector import np
+
+# Fractional slowdown above which compare flags a benchmark
+DEFAULT_THRESHOLD = 0.10
+
+# Number of timing repeats; the fastest is kept, as it has the least noise
+REPEATS = 5
+
+# Registered benchmarks: name -> (setup function, sizes)
+_registry: Dict[str, Tuple[Callable[[int], Callable[[], object]], List[int]]] = {}
+
+
+def benchmark(name: str, sizes: List[int]) -> Callable:
+    """
+    Registers a benchmark, run once for each input size.
+
+    The decorated function is the setup: called with a size it builds the
+    inputs and returns a function of no arguments, which is what is timed.
+    Building inputs is therefore never part of the measurement.
+
+    Parameters
+    ----------
+    name : str
+        The name of the benchmark, e.g. 'vector.dot'.
+    sizes : List[int]
+        The input sizes, smallest first.
+
+    Returns
+    -------
+    Callable
+        The decorator.
+    """
+    def register(setup: Callable[[int], Callable[[], object]]):
+        assert name not in _registry, f'Benchmark {name} is already registered.'
+        _registry[name] = (setup, list(sizes))
+        return setup
+    return register
+
+
+def registered() -> Dict[str, List[int]]:
+    """The names of the registered benchmarks and their sizes."""
+    return {name: sizes for name, (_, sizes) in _registry.items()}
+
+
+def time_call(func: Callable[[], object], repeats: int = REPEATS) -> float:
+    """
+    Measures the time of one call of func, in seconds.
+
+    The number of calls per repeat is chosen so a repeat takes at least
+    0.2 seconds, and the fastest of the repeats is returned.
+    """
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeats, number=number)) / number
+
+
+def run(pattern: str = '', quick: bool = False,
+        repeats: int = REPEATS) -> Dict[str, object]:
+    """
+    Runs the registered benchmarks.
+
+    Parameters
+    ----------
+    pattern : str, optional
+        Only run benchmarks whose name contains this, e.g. 'stats.'.
+    quick : bool, optional
+        If true, only run the smallest size of each benchmark, e.g. as a
+        smoke test.
+    repeats : int, optional
+        Number of timing repeats, by default REPEATS.
+
+    Returns
+    -------
+    Dict[str, object]
+        'results' maps 'name[size]' to seconds per call, and 'machine'
+        describes where the results were taken.
+    """
+    results = {}
+    for name, (setup, sizes) in _registry.items():
+        if pattern not in name:
+            continue
+        for size in sizes[:1] if quick else sizes:
+            results[f'{name}[{size}]'] = time_call(setup(size), repeats)
+    return {
+        'machine': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'numpy': np.__version__ if np is not None else None,
+            'date': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        },
+        'results': results,
+    }
+
+
+def save(report: Dict[str, object], path: str) -> None:
+    """Writes a report from run to a JSON file."""
+    with open(path, 'w') as file:
+        json.dump(report, file, indent=2, sort_keys=True)
+
+
+def load(path: str) -> Dict[str, object]:
+    """Reads a report written by save."""
+    with open(path) as file:
+        return json.load(file)
+
+
+def compare(baseline: Dict[str, object], current: Dict[str, object],
+            threshold: float = DEFAULT_THRESHOLD) -> List[Tuple[str, float, float, float]]:
+    """
+    Compares two reports benchmark by benchmark.
+
+    Parameters
+    ----------
+    baseline : Dict[str, object]
+        The reference report.
+    current : Dict[str, object]
+        The report to check.
+    threshold : float, optional
+        Fractional slowdown to flag, by default DEFAULT_THRESHOLD (10%).
+
+    Returns
+    -------
+    List[Tuple[str, float, float, float]]
+        (name, baseline seconds, current seconds, ratio) for every
+        benchmark in both reports whose ratio exceeds 1 + threshold,
+        largest ratio first and then by name.
+    """
+    old, new = baseline['results'], current['results']
+    regressions = []
+    for name in sorted(old.keys() & new.keys()):
+        ratio = new[name] / old[name]
+        if ratio > 1 + threshold:
+            regressions.append((name, old[name], new[name], ratio))
+    return sorted(regressions, key=lambda r: -r[3])
+
+
+def format_report(report: Dict[str, object], baseline: Dict[str, object] = None) -> str:
+    """Formats a report as a table, with the ratio to a baseline if given."""
+    results = report['results']
+    width = max((len(name) for name in results), default=0)
+    lines = []
+    for name, seconds in results.items():
+        line = f'{name:<{width}}  {seconds * 1e6:>14.2f} us'
+        if baseline is not None and name in baseline['results']:
+            line += f'  {seconds / baseline["results"][name]:>6.2f}x'
+        lines.append(line)
+    return '\n'.join(lines)
+
+
+if __name__ == '__main__':
+    pass
@@ -1,14 +1,24 @@
+import math
+import operator
 import random
-from typing import List
-from ...math.linear_algebra.vector import Vector
+import time
+from typing import Callable, Iterable, List, Tuple
+from ...math.linear_algebra.vector import Vector, np
 from ...math.linear_algebra import vector as v
+from ...math.linear_algebra.matrix import DenseMatrix, matvec, rmatvec
+from ...math.linear_algebra.decomposition import cholesky, cholesky_solve, qr_solve
 from ...math.stats.stats import corr, std, mean, subtract_mean
 from ...math.gradient_descent import gradient_descent as g
+from ...math.gradient_descent.optimizers import Optimizer, SGD, Convergence
+from ...math.gradient_descent.instrumentation import Instrumentation
+from ...math.gradient_descent.callbacks import Callback, History, TrainingState
 
 # TODO
-# Replace use linear algebra to solve regression instead of the gradient descent
 # Add lasso regression
 
+# Number of rows converted to a block at a time by the exact solvers
+CHUNK_SIZE = 4096
+
 def predict(x: Vector, beta: Vector) -> float:
     """
     Predicts y values for a vector of x values using linear regression.
@@ -92,12 +102,199 @@ def squared_error_gradient(x: Vector, y: Vector, beta: float) -> float:
     error_val = error(x, y, beta)
     return [2 * error_val * x_i for x_i in x]
 
+def squared_error_gradient_batch(x_batch: DenseMatrix,
+                                y_batch: Vector,
+                                beta: Vector) -> v.ArrayVector:
+    """
+    Calculates the mean gradient of the squared errors over a batch of data
+    points as 2/|b| X_b^T (X_b beta - y_b), using matrix products instead of
+    one gradient vector per data point.
+
+    Parameters
+    ----------
+    x_batch : DenseMatrix
+        A matrix with one data point x_i per row.
+    y_batch : Vector
+        The known values y_i for each row of x_batch.
+    beta : Vector
+        Vector with parameter values for the linear model.
+
+    Returns
+    -------
+    ArrayVector
+        The mean gradient vector of the squared errors.
+    """
+    residuals = v.subtract(matvec(x_batch, beta), y_batch)
+    return v.scalar_multiply(rmatvec(x_batch, residuals), 2 / x_batch.rows)
+
+
+def _design_matrix(x_vals: List[Vector], fit_intercept: bool = True) -> DenseMatrix:
+    """
+    Copy x_vals into a DenseMatrix, with a "1" column for the intercept.
+    A DenseMatrix, e.g. a memory-mapped dataset, is used as is when there
+    is no intercept column to add.
+    """
+    if isinstance(x_vals, DenseMatrix):
+        if not fit_intercept:
+            return x_vals
+        rows, columns = x_vals.shape
+        if np is not None:
+            data = np.column_stack([x_vals.data.reshape(rows, columns), np.ones(rows)])
+            return DenseMatrix(rows, columns + 1, data.reshape(rows * (columns + 1)))
+        design = DenseMatrix(rows, columns + 1)
+        design.data[columns::columns + 1] = v.as_array([1.0] * rows)
+        for j in range(columns):
+            design.data[j::columns + 1] = v.as_array(x_vals.data[j::columns])
+        return design
+    if fit_intercept:
+        return DenseMatrix.from_rows([list(x) + [1.0] for x in x_vals])
+    return DenseMatrix.from_rows(x_vals)
+
+
+def _mean_squared_error(design: DenseMatrix, targets: Vector, beta: Vector) -> float:
+    """The mean squared error of beta over every row of design."""
+    residuals = v.subtract(matvec(design, beta), targets)
+    return v.dot(residuals, residuals) / len(targets)
+
+
+def _profiled_epoch(profile: Instrumentation,
+                    sampler: g.MinibatchSampler,
+                    design: DenseMatrix,
+                    targets: v.ArrayVector,
+                    beta_est: v.ArrayVector,
+                    gradient_func: Callable[[DenseMatrix, Vector, Vector], Vector],
+                    optimizer: Optimizer,
+                    convergence: Convergence,
+                    state: TrainingState = None) -> Tuple[bool, float]:
+    """
+    Runs one pass of _fit_gradient with every phase timed, then records the
+    epoch with the mean squared error over the whole data set as its loss.
+    Returns whether the fit has converged, and the loss.
+    """
+    start = time.perf_counter()
+    batches = sampler.batches(design, targets)
+    while True:
+        with profile.phase('batch'):
+            batch = next(batches, None)
+        if batch is None:
+            break
+        batch_x, batch_y = batch
+        with profile.phase('gradient'):
+            gradient = gradient_func(batch_x, batch_y, beta_est)
+        with profile.phase('step'):
+            optimizer.step(beta_est, gradient)
+        profile.count('batches')
+        profile.count('samples', len(batch_y))
+        if state is not None:
+            state.end_batch(len(batch_y))
+    seconds = time.perf_counter() - start
+    with profile.phase('loss'):
+        loss = _mean_squared_error(design, targets, beta_est)
+    converged = False
+    if convergence.grad_tol is not None:
+        with profile.phase('convergence'):
+            converged = convergence.check(gradient_func(design, targets, beta_est))
+    profile.end_epoch(len(targets), seconds, loss)
+    return converged, loss
+
+
+def _fit_gradient(x_vals: List[Vector],
+                  y_vals: List[float],
+                  gradient_func: Callable[[DenseMatrix, Vector, Vector], Vector],
+                  learning_rate: float,
+                  num_steps: int,
+                  batch_size: float | int,
+                  fit_intercept: bool,
+                  optimizer: Optimizer = None,
+                  tol: float = None,
+                  instrumentation: Instrumentation = None,
+                  callbacks: List[Callback] = None,
+                  validation_data: Tuple[List[Vector], List[float]] = None,
+                  return_history: bool = False) -> Vector | Tuple[Vector, History]:
+    """
+    Runs minibatch gradient descent for up to num_steps passes over the data,
+    calling gradient_func(x_batch, y_batch, beta) once per batch. With a tol,
+    the full gradient is checked after each pass and the fit stops once its
+    magnitude falls below tol. With an instrumentation, each pass runs
+    through _profiled_epoch instead of the plain loop. With callbacks,
+    validation data or a history requested, the loss of each pass is
+    recorded in a History and the callbacks may stop the fit early.
+    """
+    assert len(x_vals) == len(y_vals), "X and Y vectors must be of equal length."
+    profile = instrumentation
+    if profile is not None:
+        with profile.phase('setup'):
+            design = _design_matrix(x_vals, fit_intercept)
+            targets = v.as_array(y_vals)
+    else:
+        design = _design_matrix(x_vals, fit_intercept)
+        targets = v.as_array(y_vals)
+
+    optimizer = optimizer if optimizer is not None else SGD(learning_rate)
+    convergence = Convergence(grad_tol=tol)
+
+    # Guess a random starting point
+    beta_est = v.as_array([random.random() for _ in range(design.columns)])
+
+    state = None
+    if callbacks or validation_data is not None or return_history:
+        state = TrainingState(beta_est, optimizer, callbacks)
+        if validation_data is not None:
+            x_val, y_val = validation_data
+            assert len(x_val) == len(y_val), "X and Y vectors must be of equal length."
+            val_design = _design_matrix(x_val, fit_intercept)
+            val_targets = v.as_array(y_val)
+        state.begin()
+
+    # One shuffled index permutation per pass keeps X and Y batches aligned
+    sampler = g.MinibatchSampler(design.rows, batch_size)
+    for epoch in range(num_steps):
+        if state is not None:
+            state.begin_epoch(epoch)
+        if profile is not None:
+            converged, loss = _profiled_epoch(profile, sampler, design, targets, beta_est,
+                                              gradient_func, optimizer, convergence, state)
+        else:
+            for batch_x, batch_y in sampler.batches(design, targets):
+                gradient = gradient_func(batch_x, batch_y, beta_est)
+                optimizer.step(beta_est, gradient)
+                if state is not None:
+                    state.end_batch(len(batch_y))
+            converged = tol is not None and convergence.check(
+                gradient_func(design, targets, beta_est))
+            loss = None
+        if state is not None:
+            if loss is None:
+                loss = _mean_squared_error(design, targets, beta_est)
+            val_loss = None
+            if validation_data is not None:
+                val_loss = _mean_squared_error(val_design, val_targets, beta_est)
+            if state.end_epoch(loss, val_loss):
+                break
+        if converged:
+            if state is not None:
+                state.history.converged = True
+            break
+
+    if state is not None:
+        history = state.end()
+        if return_history:
+            return beta_est.tolist(), history
+    return beta_est.tolist()
+
+
 def fit_least_squares_gradient(x_vals: List[Vector],
-                               y_vals: List[Vector],
+                               y_vals: List[float],
                                learning_rate: float = 0.001,
                                num_steps: int = 1000,
                                batch_size: float | int = 1,
-                               fit_intercept: bool = True) -> Vector:
+                               fit_intercept: bool = True,
+                               optimizer: Optimizer = None,
+                               tol: float = None,
+                               instrumentation: Instrumentation = None,
+                               callbacks: List[Callback] = None,
+                               validation_data: Tuple[List[Vector], List[float]] = None,
+                               return_history: bool = False) -> Vector | Tuple[Vector, History]:
     """
     Estimates the parameters for a linear regression using gradient descent.
     
@@ -105,40 +302,42 @@ def fit_least_squares_gradient(x_vals: List[Vector],
     ----------
     x_vals : List[Vector]
         A list of vectors x_i for each point in the data set.
-    y_vals : List[Vector]
-        A list of vectors y_i for each point in the data set.
+    y_vals : List[float]
+        A list of values y_i for each point in the data set.
     learning_rate: float = 0.001
-        The size of each gradient step.
+        The size of each gradient step, used when no optimizer is given.
     num_steps: int = 1000
-        The number of gradient steps to make.
+        The maximum number of passes over the data set.
     batch_size: float | int = 1
-        The number of minibatches for use in the gradient descent.
+        The size of the minibatches for use in the gradient descent.
     fit_intercept: bool = True
-        If true, appends a "1" to each vector in x_vals for the intercept.
+        If true, fits a constant term, returned as the last element of beta.
+    optimizer: Optimizer = None
+        The optimizer used for each step, by default SGD(learning_rate).
+    tol: float = None
+        If given, stop once the magnitude of the full gradient is below tol.
+    instrumentation: Instrumentation = None
+        If given, records the time spent in each phase of the fit and the
+        loss and throughput of each pass.
+    callbacks: List[Callback] = None
+        Called at the start and end of the fit, of each pass and after each
+        batch, e.g. EarlyStopping, LearningRateScheduler or Checkpoint.
+    validation_data: Tuple[List[Vector], List[float]] = None
+        Held out (x, y) data whose mean squared error is recorded as
+        val_loss after each pass, e.g. for EarlyStopping.
+    return_history: bool = False
+        If true, also return the History of the fit.
 
     Returns
     -------
     Vector
-        A vector of estimated parameters for the linear regression model.
+        A vector of estimated parameters for the linear regression model,
+        followed by its History if return_history is true.
     """
-    assert len(x_vals) == len(y_vals), "X and Y vectors must be of equal length."
-    # If we are fitting an intercept, add "1" to vals
-    if fit_intercept:
-        for val in x_vals:
-            val.append(1.0)
-    
-    # Guess a random starting point
-    beta_est = [random.random() for val in x_vals]
-    
-    # Perform a minibatch gradient descent for num_steps to estimate beta
-    for _ in num_steps:
-        batch_x = g.minibatch(x_vals, batch_size)
-        batch_y = g.minibatch(y_vals, batch_size)
-        while batch_x:
-            gradient = v.vector_mean([squared_error_gradient(x, y, beta_est) for x, y in zip(batch_x, batch_y)])
-            beta_est = g.gradient_step(beta_est, gradient, -learning_rate)
-            
-    return beta_est
+    return _fit_gradient(x_vals, y_vals, squared_error_gradient_batch,
+                         learning_rate, num_steps, batch_size, fit_intercept,
+                         optimizer, tol, instrumentation, callbacks,
+                         validation_data, return_history)
 
 def ridge_penalty(beta: Vector, alpha: float, fit_intercept: bool = True) -> float:
     """
@@ -207,7 +406,8 @@ def ridge_penalty_gradient(beta: Vector, alpha: float, fit_intercept: bool = Tru
     """
     if fit_intercept:
         beta = beta[:-1]  # Don't use the constant term
-    return [0.] + [2 * alpha * beta_i for beta_i in beta]
+        return [2 * alpha * beta_i for beta_i in beta] + [0.]
+    return [2 * alpha * beta_i for beta_i in beta]
 
 def ridge_squared_error_gradient(x: Vector, y:Vector, beta: Vector, alpha: float, fit_intercept: bool = True) -> Vector:
     """
@@ -231,14 +431,52 @@ def ridge_squared_error_gradient(x: Vector, y:Vector, beta: Vector, alpha: float
     Vector
         The gradient of the squared errors and ridge penalty.
     """
-    return v.add(squared_error_gradient(x, y, beta) + ridge_penalty_gradient(beta, alpha, fit_intercept))
+    return v.add(squared_error_gradient(x, y, beta), ridge_penalty_gradient(beta, alpha, fit_intercept))
+
+def ridge_squared_error_gradient_batch(x_batch: DenseMatrix,
+                                      y_batch: Vector,
+                                      beta: Vector,
+                                      alpha: float,
+                                      fit_intercept: bool = True) -> v.ArrayVector:
+    """
+    Calculates the mean gradient of the squared errors over a batch of data
+    points plus the gradient of the ridge penalty.
+
+    Parameters
+    ----------
+    x_batch : DenseMatrix
+        A matrix with one data point x_i per row.
+    y_batch : Vector
+        The known values y_i for each row of x_batch.
+    beta : Vector
+        Vector with parameter values for the linear model.
+    alpha : float
+        Hyperparameter determing how harsh the ridge penalty is.
+    fit_intercept : bool, optional
+        If true, ignore the last value (constant) of the beta vector.
+
+    Returns
+    -------
+    ArrayVector
+        The gradient of the squared errors and ridge penalty.
+    """
+    return v.add(squared_error_gradient_batch(x_batch, y_batch, beta),
+                 v.as_array(ridge_penalty_gradient(list(beta), alpha, fit_intercept)))
+
 
 def fit_least_squares_ridge(x_vals: List[Vector],
-                            y_vals: List[Vector],
+                            y_vals: List[float],
                             learning_rate: float = 0.001,
                             num_steps: int = 1000,
                             batch_size: float | int = 1,
-                            fit_intercept: bool = True) -> Vector:
+                            fit_intercept: bool = True,
+                            alpha: float = 1.0,
+                            optimizer: Optimizer = None,
+                            tol: float = None,
+                            instrumentation: Instrumentation = None,
+                            callbacks: List[Callback] = None,
+                            validation_data: Tuple[List[Vector], List[float]] = None,
+                            return_history: bool = False) -> Vector | Tuple[Vector, History]:
     """
     Estimates the parameters for a linear regression using gradient descent.
     This version uses ridge regression which adds an error penalty proportional
@@ -248,40 +486,360 @@ def fit_least_squares_ridge(x_vals: List[Vector],
     ----------
     x_vals : List[Vector]
         A list of vectors x_i for each point in the data set.
-    y_vals : List[Vector]
-        A list of vectors y_i for each point in the data set.
+    y_vals : List[float]
+        A list of values y_i for each point in the data set.
     learning_rate: float = 0.001
-        The size of each gradient step.
+        The size of each gradient step, used when no optimizer is given.
     num_steps: int = 1000
-        The number of gradient steps to make.
+        The maximum number of passes over the data set.
     batch_size: float | int = 1
-        The number of minibatches for use in the gradient descent.
+        The size of the minibatches for use in the gradient descent.
     fit_intercept: bool = True
-        If true, appends a "1" to each vector in x_vals for the intercept.
+        If true, fits a constant term, returned as the last element of beta.
+    alpha : float, optional
+        Hyperparameter determing how harsh the ridge penalty is.
+    optimizer: Optimizer = None
+        The optimizer used for each step, by default SGD(learning_rate).
+    tol: float = None
+        If given, stop once the magnitude of the full gradient is below tol.
+    instrumentation: Instrumentation = None
+        If given, records the time spent in each phase of the fit and the
+        loss (without the penalty) and throughput of each pass.
+    callbacks: List[Callback] = None
+        Called at the start and end of the fit, of each pass and after each
+        batch, e.g. EarlyStopping, LearningRateScheduler or Checkpoint.
+    validation_data: Tuple[List[Vector], List[float]] = None
+        Held out (x, y) data whose mean squared error (without the penalty) is recorded as
+        val_loss after each pass, e.g. for EarlyStopping.
+    return_history: bool = False
+        If true, also return the History of the fit.
+
+    Returns
+    -------
+    Vector
+        A vector of estimated parameters for the linear regression model,
+        followed by its History if return_history is true.
+    """
+    def gradient_func(x_batch, y_batch, beta):
+        return ridge_squared_error_gradient_batch(x_batch, y_batch, beta, alpha, fit_intercept)
+
+    return _fit_gradient(x_vals, y_vals, gradient_func,
+                         learning_rate, num_steps, batch_size, fit_intercept,
+                         optimizer, tol, instrumentation, callbacks,
+                         validation_data, return_history)
+
+
+class SufficientStatistics:
+    """
+    Running totals of X^T X, X^T y and y^T y for a linear regression.
+
+    Chunks of data are added with partial_fit and then discarded, so memory
+    stays O(d^2) in the number of columns d however many rows are seen.
+    Statistics built on separate shards of a dataset can be combined with
+    merge before calling solve.
+
+    Parameters
+    ----------
+    fit_intercept: bool = True
+        If true, a constant "1" column is appended to each x_i.
+    """
+
+    def __init__(self, fit_intercept: bool = True):
+        self.fit_intercept = fit_intercept
+        self.count = 0
+        self.yty = 0.0
+        self._xtx = None
+        self._xty = None
+
+    @property
+    def dimension(self) -> int:
+        """The number of parameters, including the intercept."""
+        return len(self._xty) if self._xty is not None else 0
+
+    def _allocate(self, columns: int) -> None:
+        """Allocate zeroed totals for rows with the given number of columns."""
+        d = columns + (1 if self.fit_intercept else 0)
+        if np is not None:
+            self._xtx = np.zeros((d, d))
+            self._xty = np.zeros(d)
+        else:
+            self._xtx = [[0.0] * d for _ in range(d)]
+            self._xty = [0.0] * d
+
+    def partial_fit(self, x_chunk: List[Vector],
+                    y_chunk: List[float]) -> 'SufficientStatistics':
+        """
+        Adds a chunk of data points to the totals.
+
+        Rows are converted to a block CHUNK_SIZE at a time and x_chunk is not
+        modified when fitting an intercept. A DenseMatrix chunk, e.g. a batch
+        of a memory-mapped dataset, is read in place.
+
+        Parameters
+        ----------
+        x_chunk : List[Vector] | DenseMatrix
+            A list of vectors x_i.
+        y_chunk : List[float]
+            A list of values y_i.
+
+        Returns
+        -------
+        SufficientStatistics
+            The updated statistics (self).
+        """
+        assert len(x_chunk) == len(y_chunk), "X and Y vectors must be of equal length."
+        if len(x_chunk) == 0:
+            return self
+        if self._xty is None:
+            self._allocate(len(x_chunk[0]))
+        columns = self.dimension - (1 if self.fit_intercept else 0)
+        assert len(x_chunk[0]) == columns, 'Vectors must all be of equal size.'
+        for start in range(0, len(x_chunk), CHUNK_SIZE):
+            if isinstance(x_chunk, DenseMatrix):
+                x_block = x_chunk.row_block(start, start + CHUNK_SIZE)
+            else:
+                x_block = x_chunk[start:start + CHUNK_SIZE]
+            self._add_block(x_block, y_chunk[start:start + CHUNK_SIZE])
+        self.count += len(x_chunk)
+        return self
+
+    def _add_block(self, x_block: List[Vector], y_block: List[float]) -> None:
+        """Add one block of at most CHUNK_SIZE rows to the totals."""
+        d = self.dimension
+        dense = isinstance(x_block, DenseMatrix)
+        if np is not None:
+            if dense:
+                block = x_block.data.reshape(x_block.shape)
+            else:
+                block = np.array(x_block, dtype=np.float64)
+            if self.fit_intercept:
+                block = np.column_stack([block, np.ones(len(block))])
+            y_block = np.asarray(y_block, dtype=np.float64)
+            self._xtx += block.T @ block
+            self._xty += block.T @ y_block
+            self.yty += float(y_block @ y_block)
+            return
+
+        mul = operator.mul
+        if dense:
+            columns = [x_block.column(j).tolist() for j in range(x_block.columns)]
+        else:
+            columns = [list(column) for column in zip(*x_block)]
+        y_block = list(y_block)
+        if self.fit_intercept:
+            columns.append([1.0] * len(y_block))
+        assert len(columns) == d, 'Vectors must all be of equal size.'
+        for i in range(d):
+            self._xty[i] += sum(map(mul, columns[i], y_block))
+            row = self._xtx[i]
+            # Only the upper triangle is accumulated, see xtx
+            for j in range(i, d):
+                row[j] += sum(map(mul, columns[i], columns[j]))
+        self.yty += sum(map(mul, y_block, y_block))
+
+    def merge(self, other: 'SufficientStatistics') -> 'SufficientStatistics':
+        """
+        Adds the totals from another set of statistics, e.g. another shard.
+
+        Parameters
+        ----------
+        other : SufficientStatistics
+            Statistics over a disjoint set of data points.
+
+        Returns
+        -------
+        SufficientStatistics
+            The updated statistics (self).
+        """
+        assert self.fit_intercept == other.fit_intercept, 'Statistics must agree on fit_intercept.'
+        if other._xty is None:
+            return self
+        if self._xty is None:
+            self._allocate(other.dimension - (1 if other.fit_intercept else 0))
+        assert self.dimension == other.dimension, 'Vectors must all be of equal size.'
+        if np is not None:
+            self._xtx += other._xtx
+            self._xty += other._xty
+        else:
+            for row, other_row in zip(self._xtx, other._xtx):
+                row[:] = v.add(row, other_row)
+            self._xty = v.add(self._xty, other._xty)
+        self.count += other.count
+        self.yty += other.yty
+        return self
+
+    @property
+    def xtx(self) -> DenseMatrix:
+        """The matrix X^T X."""
+        d = self.dimension
+        if np is not None:
+            return DenseMatrix(d, d, self._xtx.reshape(d * d).copy())
+        rows = [row[:] for row in self._xtx]
+        for i in range(d):
+            for j in range(i):
+                rows[i][j] = rows[j][i]
+        return DenseMatrix.from_rows(rows)
+
+    @property
+    def xty(self) -> Vector:
+        """The vector X^T y."""
+        return list(self._xty)
+
+    def solve(self, alpha: float = 0.0) -> Vector:
+        """
+        Solves the ridge normal equations (X^T X + alpha I) beta = X^T y with
+        a Cholesky factorization. The intercept is not penalized.
+
+        Parameters
+        ----------
+        alpha : float, optional
+            Hyperparameter determing how harsh the ridge penalty is.
+
+        Returns
+        -------
+        Vector
+            A vector of estimated parameters for the linear regression model.
+
+        Raises
+        ------
+        ValueError
+            If X^T X + alpha I is not positive definite.
+        """
+        assert self.count > 0, 'Must fit at least one data point.'
+        return cholesky_solve(cholesky(self._penalized_xtx(alpha)), self.xty).tolist()
+
+    def _penalized_xtx(self, alpha: float) -> DenseMatrix:
+        """Return X^T X with alpha added to the penalized diagonal elements."""
+        xtx = self.xtx
+        penalized = self.dimension - (1 if self.fit_intercept else 0)
+        for i in range(penalized):
+            xtx[i, i] += alpha
+        return xtx
+
+    def sum_of_squared_errors(self, beta: Vector) -> float:
+        """
+        Sum of squared errors of beta over every data point seen, computed
+        as y^T y - 2 beta^T X^T y + beta^T X^T X beta.
+
+        Parameters
+        ----------
+        beta : Vector
+            Vector with parameter values for the linear model.
+
+        Returns
+        -------
+        float
+            The sum of squared errors.
+        """
+        xtx_beta = matvec(self.xtx, beta)
+        return self.yty - 2 * v.dot(beta, self.xty) + v.dot(beta, xtx_beta)
+
+
+def fit_stream(chunks: Iterable[Tuple[List[Vector], List[float]]],
+               alpha: float = 0.0,
+               fit_intercept: bool = True) -> Vector:
+    """
+    Solves a linear or ridge regression from an iterator of data chunks,
+    holding only one chunk in memory at a time.
+
+    Parameters
+    ----------
+    chunks : Iterable[Tuple[List[Vector], List[float]]]
+        Pairs (x_chunk, y_chunk) of data points.
+    alpha : float, optional
+        Hyperparameter determing how harsh the ridge penalty is.
+    fit_intercept: bool = True
+        If true, fits a constant term, returned as the last element of beta.
+
+    Returns
+    -------
+    Vector
+        A vector of estimated parameters for the linear regression model.
+    """
+    stats = SufficientStatistics(fit_intercept)
+    for x_chunk, y_chunk in chunks:
+        stats.partial_fit(x_chunk, y_chunk)
+    return stats.solve(alpha)
+
+
+def fit_least_squares_ridge_exact(x_vals: List[Vector],
+                                  y_vals: List[float],
+                                  alpha: float = 1.0,
+                                  fit_intercept: bool = True) -> Vector:
+    """
+    Solves a ridge regression exactly, minimizing the sum of squared errors
+    plus alpha times the sum of the squares of beta_i.
+
+    The normal equations (X^T X + alpha I) beta = X^T y are built in one pass
+    over the data and solved with a Cholesky factorization. If X^T X is too
+    ill-conditioned to factor, the equivalent least squares problem is solved
+    with a QR factorization of X instead.
+
+    Parameters
+    ----------
+    x_vals : List[Vector]
+        A list of vectors x_i for each point in the data set.
+    y_vals : List[float]
+        A list of values y_i for each point in the data set.
+    alpha : float, optional
+        Hyperparameter determing how harsh the ridge penalty is.
+    fit_intercept: bool = True
+        If true, fits a constant term, returned as the last element of beta.
+        The constant term is not penalized.
 
     Returns
     -------
     Vector
         A vector of estimated parameters for the linear regression model.
+
+    Raises
+    ------
+    ValueError
+        If the parameters are not identifiable, e.g. collinear columns
+        with alpha = 0.
     """
     assert len(x_vals) == len(y_vals), "X and Y vectors must be of equal length."
-    # If we are fitting an intercept, add "1" to vals
-    if fit_intercept:
-        for val in x_vals:
-            val.append(1.0)
-    
-    # Guess a random starting point
-    beta_est = [random.random() for val in x_vals]
-    
-    # Perform a minibatch gradient descent for num_steps to estimate beta
-    for _ in num_steps:
-        batch_x = g.minibatch(x_vals, batch_size)
-        batch_y = g.minibatch(y_vals, batch_size)
-        while batch_x:
-            gradient = v.vector_mean([ridge_squared_error_gradient(x, y, beta_est, fit_intercept) for x, y in zip(batch_x, batch_y)])
-            beta_est = g.gradient_step(beta_est, gradient, -learning_rate)
-            
-    return beta_est
+    assert len(x_vals) > 0, "Must pass a non-empty dataset."
+    stats = SufficientStatistics(fit_intercept).partial_fit(x_vals, y_vals)
+    try:
+        return stats.solve(alpha)
+    except ValueError:
+        # Ridge regression is least squares on X stacked over sqrt(alpha) I
+        d = stats.dimension
+        penalized = d - 1 if fit_intercept else d
+        design = [list(x) + [1.0] if fit_intercept else list(x) for x in x_vals]
+        target = list(y_vals)
+        root_alpha = math.sqrt(alpha)
+        for i in range(penalized):
+            design.append([root_alpha if j == i else 0.0 for j in range(d)])
+            target.append(0.0)
+        return qr_solve(design, target).tolist()
+
+
+def fit_least_squares_exact(x_vals: List[Vector],
+                            y_vals: List[float],
+                            fit_intercept: bool = True) -> Vector:
+    """
+    Solves a linear regression exactly with the normal equations.
+
+    See fit_least_squares_ridge_exact, which this calls with alpha = 0.
+
+    Parameters
+    ----------
+    x_vals : List[Vector]
+        A list of vectors x_i for each point in the data set.
+    y_vals : List[float]
+        A list of values y_i for each point in the data set.
+    fit_intercept: bool = True
+        If true, fits a constant term, returned as the last element of beta.
+
+    Returns
+    -------
+    Vector
+        A vector of estimated parameters for the linear regression model.
+    """
+    return fit_least_squares_ridge_exact(x_vals, y_vals, 0.0, fit_intercept)
+
 
 def total_sum_of_squares(y: Vector) -> float:
     """
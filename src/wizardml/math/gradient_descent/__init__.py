@@ -0,0 +1,6 @@
+__all__ = [
+    'callbacks',
+    'gradient_descent',
+    'instrumentation',
+    'optimizers'
+]
\ No newline at end of file
@@ -0,0 +1,347 @@
+import json
+import math
+import os
+from typing import Callable, Dict, List
+
+from ..linear_algebra.vector import ArrayVector
+from .optimizers import Optimizer, _assign
+
+# Learning rate schedule: maps the epoch (counting from 0) to a learning rate
+Schedule = Callable[[int], float]
+
+
+class History:
+    """
+    The record of a fit, one entry per pass over the data.
+
+    Each record holds the epoch (counting from 0), the loss (mean squared
+    error over the training data), val_loss if the fit had validation data
+    and the learning_rate used.
+
+    Attributes
+    ----------
+    epochs : List[Dict[str, float]]
+        The epoch records, in order.
+    stopped_epoch : int
+        The epoch after which a callback stopped the fit, or None.
+    converged : bool
+        True if the fit stopped because it met its tolerance.
+    """
+
+    def __init__(self):
+        self.epochs: List[Dict[str, float]] = []
+        self.stopped_epoch: int = None
+        self.converged = False
+
+    def __len__(self) -> int:
+        return len(self.epochs)
+
+    def __getitem__(self, key: str) -> List[float]:
+        """The values of one field of every record, e.g. history['loss']."""
+        return [record.get(key) for record in self.epochs]
+
+    def best(self, monitor: str = 'loss') -> Dict[str, float]:
+        """
+        The record with the lowest value of monitor.
+
+        Parameters
+        ----------
+        monitor : str, optional
+            The field to minimize, by default 'loss'.
+
+        Returns
+        -------
+        Dict[str, float]
+            The best record, or None if nothing was recorded.
+        """
+        records = [record for record in self.epochs if record.get(monitor) is not None]
+        if not records:
+            return None
+        return min(records, key=lambda record: record[monitor])
+
+    def to_dict(self) -> Dict[str, object]:
+        """Exports the history as plain dictionaries and lists."""
+        return {
+            'epochs': [dict(record) for record in self.epochs],
+            'stopped_epoch': self.stopped_epoch,
+            'converged': self.converged,
+        }
+
+    def __repr__(self) -> str:
+        return f'History(epochs={len(self.epochs)}, stopped_epoch={self.stopped_epoch})'
+
+
+class TrainingState:
+    """
+    A running fit as seen by its callbacks.
+
+    Callbacks may read or change params and optimizer.learning_rate, and set
+    stop to end the fit after the current epoch.
+
+    Parameters
+    ----------
+    params : ArrayVector
+        The parameters being fitted, updated in place.
+    optimizer : Optimizer
+        The optimizer taking the steps.
+    callbacks : List[Callback], optional
+        Called in order at each event.
+    """
+
+    def __init__(self, params: ArrayVector, optimizer: Optimizer,
+                 callbacks: List['Callback'] = None):
+        self.params = params
+        self.optimizer = optimizer
+        self.callbacks = list(callbacks) if callbacks is not None else []
+        self.history = History()
+        self.epoch = 0
+        self.batch = 0
+        self.stop = False
+
+    def begin(self) -> None:
+        for callback in self.callbacks:
+            callback.on_train_begin(self)
+
+    def begin_epoch(self, epoch: int) -> None:
+        self.epoch = epoch
+        self.batch = 0
+        for callback in self.callbacks:
+            callback.on_epoch_begin(self, epoch)
+
+    def end_batch(self, size: int) -> None:
+        for callback in self.callbacks:
+            callback.on_batch_end(self, self.batch, size)
+        self.batch += 1
+
+    def end_epoch(self, loss: float, val_loss: float = None) -> bool:
+        """
+        Records the epoch in the history and calls on_epoch_end.
+        Returns True if a callback asked to stop.
+        """
+        record = {
+            'epoch': self.epoch,
+            'loss': loss,
+            'learning_rate': self.optimizer.learning_rate,
+        }
+        if val_loss is not None:
+            record['val_loss'] = val_loss
+        self.history.epochs.append(record)
+        for callback in self.callbacks:
+            callback.on_epoch_end(self, record)
+        if self.stop:
+            self.history.stopped_epoch = self.epoch
+        return self.stop
+
+    def end(self) -> History:
+        for callback in self.callbacks:
+            callback.on_train_end(self)
+        return self.history
+
+
+class Callback:
+    """
+    Base class for training callbacks. Each hook does nothing by default,
+    so subclasses only override the events they need.
+    """
+
+    def on_train_begin(self, state: TrainingState) -> None:
+        pass
+
+    def on_epoch_begin(self, state: TrainingState, epoch: int) -> None:
+        pass
+
+    def on_batch_end(self, state: TrainingState, batch: int, size: int) -> None:
+        """Called after each optimizer step with the batch index and size."""
+        pass
+
+    def on_epoch_end(self, state: TrainingState, record: Dict[str, float]) -> None:
+        """Called after each pass with its History record."""
+        pass
+
+    def on_train_end(self, state: TrainingState) -> None:
+        pass
+
+
+class EarlyStopping(Callback):
+    """
+    Stops a fit once the monitored loss has not improved for patience
+    epochs, e.g. when the validation loss starts to rise.
+
+    Parameters
+    ----------
+    monitor : str, optional
+        The History field to watch, by default 'val_loss', which needs
+        validation data. Use 'loss' to watch the training loss.
+    patience : int, optional
+        Epochs without improvement tolerated before stopping, by default 5.
+    min_delta : float, optional
+        The smallest decrease that counts as an improvement.
+    restore_best : bool, optional
+        If true (the default), the fit returns the parameters of the best
+        epoch instead of the last.
+    """
+
+    def __init__(self, monitor: str = 'val_loss', patience: int = 5,
+                 min_delta: float = 0.0, restore_best: bool = True):
+        assert patience >= 0, 'Patience must be non-negative.'
+        self.monitor = monitor
+        self.patience = patience
+        self.min_delta = min_delta
+        self.restore_best = restore_best
+        self.best = math.inf
+        self.best_epoch: int = None
+        self.best_params: List[float] = None
+        self._wait = 0
+
+    def on_train_begin(self, state):
+        self.best = math.inf
+        self.best_epoch = None
+        self.best_params = None
+        self._wait = 0
+
+    def on_epoch_end(self, state, record):
+        assert self.monitor in record, f'{self.monitor} is not recorded, e.g. no validation data was given.'
+        value = record[self.monitor]
+        if value < self.best - self.min_delta:
+            self.best = value
+            self.best_epoch = record['epoch']
+            self.best_params = list(state.params)
+            self._wait = 0
+        else:
+            self._wait += 1
+            if self._wait > self.patience:
+                state.stop = True
+
+    def on_train_end(self, state):
+        if self.restore_best and self.best_params is not None:
+            _assign(state.params, self.best_params)
+
+
+class LearningRateScheduler(Callback):
+    """
+    Sets the optimizer's learning rate at the start of each epoch.
+
+    Parameters
+    ----------
+    schedule : Schedule
+        Maps the epoch (counting from 0) to its learning rate, e.g.
+        step_decay(0.1, 0.5, 10) or exponential_decay(0.1, 0.95).
+    """
+
+    def __init__(self, schedule: Schedule):
+        self.schedule = schedule
+
+    def on_epoch_begin(self, state, epoch):
+        state.optimizer.learning_rate = self.schedule(epoch)
+
+
+def step_decay(initial: float, factor: float = 0.5, every: int = 10) -> Schedule:
+    """
+    A schedule that multiplies the learning rate by factor every few epochs.
+
+    Parameters
+    ----------
+    initial : float
+        The learning rate of the first epoch.
+    factor : float, optional
+        The multiplier applied at each drop, by default 0.5.
+    every : int, optional
+        The number of epochs between drops, by default 10.
+
+    Returns
+    -------
+    Schedule
+        initial * factor ** (epoch // every).
+    """
+    assert every > 0, 'Epochs between drops must be positive.'
+    return lambda epoch: initial * factor ** (epoch // every)
+
+
+def exponential_decay(initial: float, rate: float = 0.95) -> Schedule:
+    """
+    A schedule that multiplies the learning rate by rate every epoch.
+
+    Parameters
+    ----------
+    initial : float
+        The learning rate of the first epoch.
+    rate : float, optional
+        The multiplier per epoch, by default 0.95.
+
+    Returns
+    -------
+    Schedule
+        initial * rate ** epoch.
+    """
+    return lambda epoch: initial * rate ** epoch
+
+
+class Checkpoint(Callback):
+    """
+    Keeps a copy of the parameters after each epoch, or only of the best
+    epoch, optionally written to a JSON file so a long fit survives a
+    crash. Files are replaced atomically, so a checkpoint is never half
+    written.
+
+    Parameters
+    ----------
+    path : str, optional
+        The file to write, if any. The copy in memory is always kept.
+    monitor : str, optional
+        The History field that decides the best epoch, by default 'loss'.
+    save_best_only : bool, optional
+        If true (the default), only keep epochs that improve on monitor.
+    """
+
+    def __init__(self, path: str = None, monitor: str = 'loss', save_best_only: bool = True):
+        self.path = path
+        self.monitor = monitor
+        self.save_best_only = save_best_only
+        self.best = math.inf
+        self.epoch: int = None
+        self.params: List[float] = None
+
+    def on_train_begin(self, state):
+        self.best = math.inf
+        self.epoch = None
+        self.params = None
+
+    def on_epoch_end(self, state, record):
+        value = record.get(self.monitor)
+        if self.save_best_only:
+            assert value is not None, f'{self.monitor} is not recorded, e.g. no validation data was given.'
+            if value >= self.best:
+                return
+            self.best = value
+        self.epoch = record['epoch']
+        self.params = list(state.params)
+        if self.path is not None:
+            self._write(record)
+
+    def _write(self, record: Dict[str, float]) -> None:
+        temporary = self.path + '.tmp'
+        with open(temporary, 'w') as file:
+            json.dump({'record': record, 'params': self.params}, file)
+        os.replace(temporary, self.path)
+
+    @staticmethod
+    def load(path: str) -> List[float]:
+        """
+        Reads the parameters from a checkpoint file.
+
+        Parameters
+        ----------
+        path : str
+            A file written by a Checkpoint.
+
+        Returns
+        -------
+        List[float]
+            The saved parameters.
+        """
+        with open(path) as file:
+            return json.load(file)['params']
+
+
+if __name__ == '__main__':
+    pass
@@ -1,7 +1,9 @@
 import random
-from typing import Callable, TypeVar, List, Iterator
+from array import array
+from typing import Callable, TypeVar, List, Iterator, Sequence, Tuple
 from ..linear_algebra import vector as vector
-from ..linear_algebra.vector import Vector
+from ..linear_algebra.vector import Vector, np
+from ..linear_algebra.matrix import DenseMatrix
 
 def partial_difference_quotient(f: Callable[[Vector], float], 
                                 v: Vector,
@@ -32,10 +34,16 @@ def partial_difference_quotient(f: Callable[[Vector], float],
 
 def estimate_gradient(f: Callable[[Vector], float], 
                                 v: Vector,
-                                h: float = 0.0001) -> Vector:
+                                h: float = 0.0001,
+                                central: bool = False,
+                                batched: bool = False) -> Vector:
     """
     Estimates the gradient of function f(v) at v.
 
+    Forward differences evaluate f(v) once plus once per element of v.
+    Central differences, (f(v + h) - f(v - h)) / 2h, cost twice as many
+    calls but have O(h^2) instead of O(h) error.
+
     Parameters
     ----------
     f : Callable[[Vector, float]] 
@@ -44,13 +52,84 @@ def estimate_gradient(f: Callable[[Vector], float],
         The point at which the difference quotient is calculated
     h : float (default to 0.0001)
         The difference over which we calculate the quotient
+    central : bool (default to False)
+        If true, use central instead of forward differences.
+    batched : bool (default to False)
+        If true, f is called once with a DenseMatrix holding every perturbed
+        point as a row and must return a vector with one value per row.
 
     Returns
     -------
     Vector
         The estimated gradient of a function f at v.
     """
-    return [partial_difference_quotient(f, v, i, h) for i in range(len(v))]
+    n = len(v)
+    if batched:
+        points = _perturbed_points(v, h, central)
+        values = list(f(points))
+        if central:
+            return [(values[i] - values[n + i]) / (2 * h) for i in range(n)]
+        f_v = values[n]
+        return [(values[i] - f_v) / h for i in range(n)]
+
+    def _shifted(i: int, step: float) -> Vector:
+        w = list(v)
+        w[i] += step
+        return w
+
+    if central:
+        return [(f(_shifted(i, h)) - f(_shifted(i, -h))) / (2 * h) for i in range(n)]
+    f_v = f(v)
+    return [(f(_shifted(i, h)) - f_v) / h for i in range(n)]
+
+def _perturbed_points(v: Vector, h: float, central: bool) -> DenseMatrix:
+    """
+    Builds the matrix of points v + h e_i (and v - h e_i for central
+    differences, otherwise v itself) as rows of one DenseMatrix.
+    """
+    n = len(v)
+    if central:
+        offsets = [h] * n + [-h] * n
+    else:
+        offsets = [h] * n + [0.0]
+    rows = len(offsets)
+    base = vector.as_array(v)
+    if np is not None:
+        data = np.tile(base, rows)
+    else:
+        data = base * rows
+    for row, offset in enumerate(offsets):
+        if offset:
+            data[row * n + row % n] += offset
+    return DenseMatrix(rows, n, data)
+
+def compute_gradient(f: Callable[[Vector], float],
+                     v: Vector,
+                     gradient_func: Callable[[Vector], Vector] = None,
+                     **kwargs) -> Vector:
+    """
+    Returns the gradient of f at v, from an analytic gradient if one is
+    supplied and otherwise estimated with finite differences.
+
+    Parameters
+    ----------
+    f : Callable[[Vector, float]] 
+        The function for which we want the gradient
+    v : Vector
+        The point at which the gradient is calculated
+    gradient_func : Callable[[Vector], Vector], optional
+        The analytic gradient of f. If given, f is never evaluated.
+    **kwargs
+        Passed on to estimate_gradient (h, central, batched).
+
+    Returns
+    -------
+    Vector
+        The gradient of a function f at v.
+    """
+    if gradient_func is not None:
+        return gradient_func(v)
+    return estimate_gradient(f, v, **kwargs)
 
 def gradient_step(v: Vector, gradient: Vector, step_size: float) -> Vector:
     """
@@ -114,4 +193,123 @@ def minibatch(dataset: List[T],
         
     for start in batch_starts:
         end = start + batch_size
-        yield dataset[start:end]
\ No newline at end of file
+        yield dataset[start:end]
+
+
+def take(data, indices: Sequence[int]):
+    """
+    Selects the elements (or rows) of data at the given indices.
+
+    A range of indices is taken as a slice, which for NumPy arrays and
+    DenseMatrix row blocks is a view rather than a copy. Other indices
+    gather just the selected elements.
+
+    Parameters
+    ----------
+    data : List[T] | ArrayVector | DenseMatrix
+        The data to select from.
+    indices : Sequence[int]
+        The indices to select, a range or a sequence of ints.
+
+    Returns
+    -------
+    List[T] | ArrayVector | DenseMatrix
+        The selected elements, of the same type as data.
+    """
+    if isinstance(data, DenseMatrix):
+        if isinstance(indices, range) and indices.step == 1:
+            return data.row_block(indices.start, indices.stop)
+        return data.take_rows(indices)
+    if isinstance(indices, range) and indices.step == 1:
+        return data[indices.start:indices.stop]
+    if np is not None and isinstance(data, np.ndarray):
+        return data[np.asarray(indices)]
+    if isinstance(data, array):
+        return array(data.typecode, [data[i] for i in indices])
+    return [data[i] for i in indices]
+
+
+class MinibatchSampler:
+    """
+    Splits a dataset into minibatches of row indices for gradient descent.
+
+    Each epoch shuffles a single permutation of the row indices in place and
+    yields it in consecutive batches, so every row appears exactly once per
+    epoch and batches mix rows from anywhere in the dataset. The same index
+    batch is applied to every array passed to batches, so X and Y stay
+    aligned. The dataset itself is never copied.
+
+    Parameters
+    ----------
+    data_size : int
+        The number of rows in the dataset.
+    batch_size : int | float
+        The size of the minibatches. A float between 0 and 1 is treated
+        as a percentage and multiplied by the size of the dataset to
+        determine the batch_size. Otherwise it specifies the number of
+        samples in each minibatch.
+    shuffle : bool
+        Determines whether or not to reshuffle the rows each epoch. If
+        false, batches are contiguous ranges of rows.
+    seed : int, optional
+        Seed for the shuffles. If none, the random module is used.
+    """
+
+    def __init__(self, data_size: int,
+                 batch_size: int | float,
+                 shuffle: bool = True,
+                 seed: int = None):
+        # If batch_size in (0,1) treat as a percentage of the dataset
+        if 0 < batch_size < 1:
+            batch_size = batch_size * data_size
+        batch_size = int(batch_size)
+        assert batch_size > 0, "batch_size must be greater than 0"
+        self.data_size = data_size
+        self.batch_size = batch_size
+        self.shuffle = shuffle
+        self._random = random.Random(seed) if seed is not None else random
+        self._permutation = list(range(data_size)) if shuffle else None
+
+    def __len__(self) -> int:
+        """The number of batches per epoch."""
+        return -(-self.data_size // self.batch_size)
+
+    def __iter__(self) -> Iterator[Sequence[int]]:
+        return self.epoch()
+
+    def epoch(self) -> Iterator[Sequence[int]]:
+        """
+        Yields the index batches for one epoch.
+
+        Yields
+        -------
+        Sequence[int]
+            The row indices of each batch; ranges when not shuffling.
+        """
+        size, batch_size = self.data_size, self.batch_size
+        if not self.shuffle:
+            for start in range(0, size, batch_size):
+                yield range(start, min(start + batch_size, size))
+            return
+        self._random.shuffle(self._permutation)
+        for start in range(0, size, batch_size):
+            yield self._permutation[start:start + batch_size]
+
+    def batches(self, *arrays) -> Iterator[Tuple]:
+        """
+        Yields aligned batches from several arrays for one epoch.
+
+        Parameters
+        ----------
+        *arrays : List[T] | ArrayVector | DenseMatrix
+            Arrays with data_size rows each, e.g. X and Y.
+
+        Yields
+        -------
+        Tuple
+            One batch from each array, selected with the same indices.
+        """
+        assert all(len(data) == self.data_size for data in arrays), \
+            'Arrays must all be of equal length.'
+        for indices in self.epoch():
+            yield tuple(take(data, indices) for data in arrays)
@@ -0,0 +1,156 @@
+import json
+import sys
+import time
+from typing import Callable, Dict, List
+
+# Per-epoch callback, called with the record of each finished epoch
+EpochCallback = Callable[[Dict[str, float]], None]
+
+
+class _Phase:
+    """Context manager that adds the time spent in a block to a phase."""
+    __slots__ = ('_stats', '_allocations', '_start', '_blocks')
+
+    def __init__(self, stats: Dict[str, float], allocations: bool):
+        self._stats = stats
+        self._allocations = allocations
+
+    def __enter__(self) -> '_Phase':
+        if self._allocations:
+            self._blocks = sys.getallocatedblocks()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        stats = self._stats
+        stats['seconds'] += time.perf_counter() - self._start
+        stats['calls'] += 1
+        if self._allocations:
+            stats['allocated_blocks'] += sys.getallocatedblocks() - self._blocks
+
+
+class Instrumentation:
+    """
+    Opt-in profiling of a training loop: time and calls per phase, named
+    counters, memory allocations and a record per epoch.
+
+    Pass an Instrumentation to a fitter, e.g. fit_least_squares_gradient,
+    to profile it. Without one the fitter runs its plain loop, so profiling
+    costs nothing unless it is asked for. The fitters time the phases
+    'setup' (building the design matrix), 'batch' (drawing minibatches),
+    'gradient', 'step' (the optimizer update), 'loss' and 'convergence'.
+
+    Parameters
+    ----------
+    track_allocations : bool, optional
+        If true, also record for each phase the net number of memory
+        blocks allocated by the interpreter (sys.getallocatedblocks).
+    on_epoch : EpochCallback, optional
+        Called with the record of each epoch as it finishes, e.g. to feed a
+        monitoring system.
+    """
+
+    def __init__(self, track_allocations: bool = False, on_epoch: EpochCallback = None):
+        self.track_allocations = track_allocations
+        self.on_epoch = on_epoch
+        self.phases: Dict[str, Dict[str, float]] = {}
+        self.counters: Dict[str, int] = {}
+        self.epochs: List[Dict[str, float]] = []
+
+    def phase(self, name: str) -> _Phase:
+        """
+        Times a block of code as part of a named phase.
+
+        Parameters
+        ----------
+        name : str
+            The phase, e.g. 'gradient'. Repeated blocks of the same phase
+            are added up.
+
+        Returns
+        -------
+        _Phase
+            A context manager, used as `with instrumentation.phase(name):`.
+        """
+        stats = self.phases.get(name)
+        if stats is None:
+            stats = {'calls': 0, 'seconds': 0.0}
+            if self.track_allocations:
+                stats['allocated_blocks'] = 0
+            self.phases[name] = stats
+        return _Phase(stats, self.track_allocations)
+
+    def count(self, name: str, n: int = 1) -> None:
+        """
+        Adds n to a named counter, e.g. the number of samples seen.
+
+        Parameters
+        ----------
+        name : str
+            The counter.
+        n : int, optional
+            The amount to add, by default 1.
+        """
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def end_epoch(self, samples: int, seconds: float, loss: float = None) -> Dict[str, float]:
+        """
+        Records a finished epoch and calls on_epoch with its record.
+
+        Parameters
+        ----------
+        samples : int
+            The number of samples processed in the epoch.
+        seconds : float
+            The wall time of the epoch.
+        loss : float, optional
+            The loss at the end of the epoch.
+
+        Returns
+        -------
+        Dict[str, float]
+            The record: epoch (counting from 0), samples, seconds,
+            samples_per_second and loss.
+        """
+        record = {
+            'epoch': len(self.epochs),
+            'samples': samples,
+            'seconds': seconds,
+            'samples_per_second': samples / seconds if seconds > 0 else None,
+            'loss': loss,
+        }
+        self.epochs.append(record)
+        if self.on_epoch is not None:
+            self.on_epoch(record)
+        return record
+
+    def to_dict(self) -> Dict[str, object]:
+        """
+        Exports everything recorded as plain dictionaries and lists.
+
+        Returns
+        -------
+        Dict[str, object]
+            'phases' maps each phase to its calls, seconds (and
+            allocated_blocks), 'counters' maps each counter to its value
+            and 'epochs' lists the epoch records.
+        """
+        return {
+            'phases': {name: dict(stats) for name, stats in self.phases.items()},
+            'counters': dict(self.counters),
+            'epochs': [dict(record) for record in self.epochs],
+        }
+
+    def to_json(self, **kwargs) -> str:
+        """Exports to_dict() as a JSON string; kwargs go to json.dumps."""
+        return json.dumps(self.to_dict(), **kwargs)
+
+    def reset(self) -> None:
+        """Forgets everything recorded."""
+        self.phases = {}
+        self.counters = {}
+        self.epochs = []
+
+
+if __name__ == '__main__':
+    pass
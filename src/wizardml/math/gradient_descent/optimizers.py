@@ -0,0 +1,375 @@
+import math
+from array import array
+from typing import Callable, Dict
+
+from ..linear_algebra import vector as vector
+from ..linear_algebra.vector import Vector, ArrayVector, np
+
+
+def _is_ndarray(x) -> bool:
+    """Check if x is a NumPy array."""
+    return np is not None and isinstance(x, np.ndarray)
+
+
+def _assign(buffer, values) -> None:
+    """Overwrite the contents of a buffer in place."""
+    buffer[:] = array('d', values) if isinstance(buffer, array) else values
+
+
+class Optimizer:
+    """
+    Base class for gradient based optimizers.
+
+    An optimizer updates a parameter vector in place from its gradient.
+    State such as velocities or running averages is kept in buffers that
+    are allocated on the first step and reused afterwards.
+
+    Parameters
+    ----------
+    learning_rate : float, optional
+        The size of each gradient step, by default 0.001.
+    """
+
+    def __init__(self, learning_rate: float = 0.001):
+        self.learning_rate = learning_rate
+        self.steps = 0
+        self._state: Dict[str, ArrayVector] = {}
+
+    def _buffer(self, name: str, params: Vector) -> ArrayVector:
+        """Return the named state buffer, allocating zeros on first use."""
+        buffer = self._state.get(name)
+        if buffer is None:
+            if _is_ndarray(params):
+                buffer = np.zeros(len(params))
+            else:
+                buffer = array('d', bytes(8 * len(params)))
+            self._state[name] = buffer
+        return buffer
+
+    def reset(self) -> None:
+        """Forget all state, e.g. before optimizing a new problem."""
+        self.steps = 0
+        self._state = {}
+
+    def step(self, params: Vector, gradient: Vector) -> Vector:
+        """
+        Moves params against the gradient, updating params in place.
+
+        Parameters
+        ----------
+        params : Vector
+            The current parameters, a list or ArrayVector.
+        gradient : Vector
+            The gradient of the loss at params.
+
+        Returns
+        -------
+        Vector
+            The updated params (the same object that was passed in).
+        """
+        assert len(params) == len(gradient), 'Vectors must be of equal size'
+        self.steps += 1
+        self._update(params, gradient)
+        return params
+
+    def _update(self, params: Vector, gradient: Vector) -> None:
+        raise NotImplementedError
+
+
+class SGD(Optimizer):
+    """
+    Plain gradient descent, params -= learning_rate * gradient.
+    """
+
+    def _update(self, params, gradient):
+        lr = self.learning_rate
+        if _is_ndarray(params):
+            params -= lr * np.asarray(gradient)
+        else:
+            _assign(params, [p - lr * g for p, g in zip(params, gradient)])
+
+
+class Momentum(Optimizer):
+    """
+    Gradient descent with momentum.
+
+    velocity = momentum * velocity + gradient
+    params -= learning_rate * velocity
+
+    Parameters
+    ----------
+    learning_rate : float, optional
+        The size of each gradient step, by default 0.001.
+    momentum : float, optional
+        Fraction of the previous velocity kept each step, by default 0.9.
+    nesterov : bool, optional
+        If true, use Nesterov's look-ahead update
+        params -= learning_rate * (gradient + momentum * velocity).
+    """
+
+    def __init__(self, learning_rate: float = 0.001,
+                 momentum: float = 0.9, nesterov: bool = False):
+        super().__init__(learning_rate)
+        self.momentum = momentum
+        self.nesterov = nesterov
+
+    def _update(self, params, gradient):
+        lr, mu = self.learning_rate, self.momentum
+        velocity = self._buffer('velocity', params)
+        if _is_ndarray(params):
+            gradient = np.asarray(gradient)
+            velocity *= mu
+            velocity += gradient
+            if self.nesterov:
+                params -= lr * (gradient + mu * velocity)
+            else:
+                params -= lr * velocity
+            return
+        _assign(velocity, [mu * u + g for u, g in zip(velocity, gradient)])
+        if self.nesterov:
+            _assign(params, [p - lr * (g + mu * u)
+                             for p, g, u in zip(params, gradient, velocity)])
+        else:
+            _assign(params, [p - lr * u for p, u in zip(params, velocity)])
+
+
+class Nesterov(Momentum):
+    """
+    Gradient descent with Nesterov momentum, see Momentum.
+    """
+
+    def __init__(self, learning_rate: float = 0.001, momentum: float = 0.9):
+        super().__init__(learning_rate, momentum, nesterov=True)
+
+
+class AdaGrad(Optimizer):
+    """
+    AdaGrad, which scales each element's step by the inverse root of the
+    sum of its squared gradients.
+
+    Parameters
+    ----------
+    learning_rate : float, optional
+        The size of each gradient step, by default 0.01.
+    eps : float, optional
+        Added to the denominator to avoid division by zero.
+    """
+
+    def __init__(self, learning_rate: float = 0.01, eps: float = 1e-8):
+        super().__init__(learning_rate)
+        self.eps = eps
+
+    def _update(self, params, gradient):
+        lr, eps = self.learning_rate, self.eps
+        total = self._buffer('sum_of_squares', params)
+        if _is_ndarray(params):
+            gradient = np.asarray(gradient)
+            total += gradient * gradient
+            params -= lr * gradient / (np.sqrt(total) + eps)
+            return
+        _assign(total, [s + g * g for s, g in zip(total, gradient)])
+        _assign(params, [p - lr * g / (math.sqrt(s) + eps)
+                         for p, g, s in zip(params, gradient, total)])
+
+
+class Adam(Optimizer):
+    """
+    Adam, which steps along bias corrected running averages of the gradient
+    and of its square.
+
+    Parameters
+    ----------
+    learning_rate : float, optional
+        The size of each gradient step, by default 0.001.
+    beta_1 : float, optional
+        Decay rate of the gradient average, by default 0.9.
+    beta_2 : float, optional
+        Decay rate of the squared gradient average, by default 0.999.
+    eps : float, optional
+        Added to the denominator to avoid division by zero.
+    """
+
+    def __init__(self, learning_rate: float = 0.001, beta_1: float = 0.9,
+                 beta_2: float = 0.999, eps: float = 1e-8):
+        super().__init__(learning_rate)
+        self.beta_1 = beta_1
+        self.beta_2 = beta_2
+        self.eps = eps
+
+    def _update(self, params, gradient):
+        b1, b2, eps = self.beta_1, self.beta_2, self.eps
+        first = self._buffer('first_moment', params)
+        second = self._buffer('second_moment', params)
+        # Fold both bias corrections into the step size
+        lr = (self.learning_rate * math.sqrt(1 - b2 ** self.steps)
+              / (1 - b1 ** self.steps))
+        if _is_ndarray(params):
+            gradient = np.asarray(gradient)
+            first *= b1
+            first += (1 - b1) * gradient
+            second *= b2
+            second += (1 - b2) * gradient * gradient
+            params -= lr * first / (np.sqrt(second) + eps)
+            return
+        _assign(first, [b1 * m + (1 - b1) * g for m, g in zip(first, gradient)])
+        _assign(second, [b2 * s + (1 - b2) * g * g for s, g in zip(second, gradient)])
+        _assign(params, [p - lr * m / (math.sqrt(s) + eps)
+                         for p, m, s in zip(params, first, second)])
+
+
+class LBFGS(Optimizer):
+    """
+    Limited memory BFGS, which steps along the gradient multiplied by an
+    approximate inverse Hessian built from the last `memory` changes in
+    params and gradient.
+
+    There is no line search, so each step moves learning_rate times the
+    quasi-Newton direction. It works best with full batch gradients.
+
+    Parameters
+    ----------
+    learning_rate : float, optional
+        Scale of each quasi-Newton step, by default 1.0.
+    memory : int, optional
+        Number of (s, y) pairs kept, by default 10.
+    """
+
+    def __init__(self, learning_rate: float = 1.0, memory: int = 10):
+        super().__init__(learning_rate)
+        self.memory = memory
+        self._pairs = []
+
+    def reset(self) -> None:
+        super().reset()
+        self._pairs = []
+
+    def _update(self, params, gradient):
+        gradient = vector.as_array(gradient) if _is_ndarray(params) else list(gradient)
+        previous_params = self._state.get('previous_params')
+        if previous_params is not None:
+            s = vector.subtract(params, previous_params)
+            y = vector.subtract(gradient, self._state['previous_gradient'])
+            sy = vector.dot(s, y)
+            # Skip pairs that violate the curvature condition
+            if sy > 1e-10 * vector.dot(y, y):
+                if len(self._pairs) == self.memory:
+                    self._pairs.pop(0)
+                self._pairs.append((s, y, 1.0 / sy))
+        # Remember where this step started from
+        _assign(self._buffer('previous_params', params), params)
+        _assign(self._buffer('previous_gradient', params), gradient)
+
+        # Two-loop recursion for the direction H * gradient
+        q = gradient
+        alphas = []
+        for s, y, rho in reversed(self._pairs):
+            alpha = rho * vector.dot(s, q)
+            alphas.append(alpha)
+            q = vector.subtract(q, vector.scalar_multiply(y, alpha))
+        if self._pairs:
+            s, y, _ = self._pairs[-1]
+            q = vector.scalar_multiply(q, vector.dot(s, y) / vector.dot(y, y))
+        for (s, y, rho), alpha in zip(self._pairs, reversed(alphas)):
+            beta = rho * vector.dot(y, q)
+            q = vector.add(q, vector.scalar_multiply(s, alpha - beta))
+
+        lr = self.learning_rate
+        if _is_ndarray(params):
+            params -= lr * q
+        else:
+            _assign(params, [p - lr * d for p, d in zip(params, q)])
+
+
+class Convergence:
+    """
+    Decides when an optimization has converged.
+
+    Converged means the gradient norm has fallen below grad_tol, or the loss
+    improved by less than loss_tol since the previous check. A tolerance of
+    None disables that test.
+
+    Parameters
+    ----------
+    grad_tol : float, optional
+        Tolerance on the magnitude of the gradient.
+    loss_tol : float, optional
+        Tolerance on the change in loss between checks.
+    """
+
+    def __init__(self, grad_tol: float = None, loss_tol: float = None):
+        self.grad_tol = grad_tol
+        self.loss_tol = loss_tol
+        self._previous_loss = None
+
+    def check(self, gradient: Vector = None, loss: float = None) -> bool:
+        """
+        Records the latest gradient and/or loss.
+
+        Parameters
+        ----------
+        gradient : Vector, optional
+            The current gradient.
+        loss : float, optional
+            The current loss.
+
+        Returns
+        -------
+        bool
+            True if the optimization has converged.
+        """
+        if self.grad_tol is not None and gradient is not None:
+            if vector.magnitude(gradient) < self.grad_tol:
+                return True
+        if self.loss_tol is not None and loss is not None:
+            previous, self._previous_loss = self._previous_loss, loss
+            if previous is not None and abs(previous - loss) < self.loss_tol:
+                return True
+        return False
+
+
+def minimize(gradient_func: Callable[[Vector], Vector],
+             x0: Vector,
+             optimizer: Optimizer = None,
+             max_steps: int = 1000,
+             grad_tol: float = 1e-8,
+             f: Callable[[Vector], float] = None,
+             loss_tol: float = None) -> Vector:
+    """
+    Minimizes a function from its gradient, stopping as soon as it converges.
+
+    Parameters
+    ----------
+    gradient_func : Callable[[Vector], Vector]
+        The gradient of the function to minimize.
+    x0 : Vector
+        The starting point.
+    optimizer : Optimizer, optional
+        The optimizer used for each step, by default SGD().
+    max_steps : int, optional
+        The maximum number of steps, by default 1000.
+    grad_tol : float, optional
+        Stop once the gradient magnitude is below this, by default 1e-8.
+    f : Callable[[Vector], float], optional
+        The function itself, only needed for loss_tol.
+    loss_tol : float, optional
+        Stop once f changes by less than this between steps.
+
+    Returns
+    -------
+    Vector
+        The point reached. optimizer.steps holds the number of steps taken.
+    """
+    optimizer = optimizer if optimizer is not None else SGD()
+    convergence = Convergence(grad_tol, loss_tol if f is not None else None)
+    params = vector.as_array(x0)
+    for _ in range(max_steps):
+        gradient = gradient_func(params)
+        loss = f(params) if convergence.loss_tol is not None else None
+        if convergence.check(gradient, loss):
+            break
+        optimizer.step(params, gradient)
+    return params.tolist()
+
+
+if __name__ == '__main__':
+    pass
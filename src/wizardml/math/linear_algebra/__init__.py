@@ -1,4 +1,5 @@
 __all__ = [
+    'decomposition',
     'matrix',
     'vector'
 ]
\ No newline at end of file
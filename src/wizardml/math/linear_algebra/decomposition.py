@@ -0,0 +1,174 @@
+import math
+import operator
+from array import array
+from typing import Union
+
+from . import vector as v
+from .vector import np
+from .matrix import Matrix, DenseMatrix, _as_dense
+
+# Pivots smaller than this fraction of their diagonal element are treated as
+# zero, i.e. the matrix is too ill-conditioned to factor reliably.
+PIVOT_TOLERANCE = 1e-10
+
+
+def cholesky(matrix: Union[Matrix, DenseMatrix],
+             tol: float = PIVOT_TOLERANCE) -> DenseMatrix:
+    """
+    Cholesky factorization of a symmetric positive definite matrix.
+
+    Parameters
+    ----------
+    matrix : Matrix | DenseMatrix
+        A symmetric positive definite n x n matrix A.
+    tol : float, optional
+        Relative pivot tolerance, by default PIVOT_TOLERANCE.
+
+    Returns
+    -------
+    DenseMatrix
+        The lower triangular matrix L such that A = LL^T.
+
+    Raises
+    ------
+    ValueError
+        If the matrix is not positive definite or is too ill-conditioned.
+    """
+    a = _as_dense(matrix)
+    n, columns = a.shape
+    assert n == columns, 'Matrix must be square.'
+    diagonal = a.data[::n + 1].tolist()
+    if np is not None:
+        try:
+            lower = np.linalg.cholesky(a.data.reshape(n, n))
+        except np.linalg.LinAlgError:
+            raise ValueError('Matrix is not positive definite.') from None
+        pivots = (lower.diagonal() ** 2).tolist()
+        data = lower.reshape(n * n)
+    else:
+        mul = operator.mul
+        rows = [[0.0] * n for _ in range(n)]
+        pivots = []
+        for j in range(n):
+            row_j = rows[j][:j]
+            pivot = diagonal[j] - sum(map(mul, row_j, row_j))
+            pivots.append(pivot)
+            if pivot <= tol * diagonal[j]:
+                break
+            l_jj = math.sqrt(pivot)
+            rows[j][j] = l_jj
+            for i in range(j + 1, n):
+                rows[i][j] = (a[i, j] - sum(map(mul, rows[i][:j], row_j))) / l_jj
+        data = array('d')
+        for row in rows:
+            data.extend(row)
+    if any(p <= tol * d for p, d in zip(pivots, diagonal)):
+        raise ValueError('Matrix is not positive definite.')
+    return DenseMatrix(n, n, data)
+
+
+def cholesky_solve(lower: DenseMatrix, b: v.Vector) -> v.ArrayVector:
+    """
+    Solves Ax = b given the Cholesky factor L of A.
+
+    Parameters
+    ----------
+    lower : DenseMatrix
+        The lower triangular factor L returned by cholesky.
+    b : Vector
+        The right hand side vector.
+
+    Returns
+    -------
+    ArrayVector
+        The solution x.
+    """
+    n = lower.rows
+    assert n == len(b), 'Matrix and vector shapes are not aligned.'
+    if np is not None:
+        l_matrix = lower.data.reshape(n, n)
+        y = np.linalg.solve(l_matrix, np.asarray(b, dtype=np.float64))
+        return np.linalg.solve(l_matrix.T, y)
+    mul = operator.mul
+    rows = lower.to_rows()
+    # Forward substitution for Ly = b
+    y = []
+    for i in range(n):
+        y.append((b[i] - sum(map(mul, rows[i][:i], y))) / rows[i][i])
+    # Back substitution for L^T x = y, using the columns of L as rows of L^T
+    columns = [lower.column(j).tolist() for j in range(n)]
+    x = [0.0] * n
+    for i in reversed(range(n)):
+        tail = sum(map(mul, columns[i][i + 1:], x[i + 1:]))
+        x[i] = (y[i] - tail) / rows[i][i]
+    return v.as_array(x)
+
+
+def qr_solve(matrix: Union[Matrix, DenseMatrix],
+             b: v.Vector,
+             tol: float = PIVOT_TOLERANCE) -> v.ArrayVector:
+    """
+    Solves the least squares problem min ||Ax - b|| with a QR factorization.
+
+    Householder reflections are applied to A and b together, so Q is never
+    formed. This avoids squaring the condition number of A as the normal
+    equations do.
+
+    Parameters
+    ----------
+    matrix : Matrix | DenseMatrix
+        An n x k matrix A with n >= k.
+    b : Vector
+        A vector of length n.
+    tol : float, optional
+        Relative tolerance on the diagonal of R, by default PIVOT_TOLERANCE.
+
+    Returns
+    -------
+    ArrayVector
+        The least squares solution x of length k.
+
+    Raises
+    ------
+    ValueError
+        If A does not have full column rank.
+    """
+    a = _as_dense(matrix)
+    n, k = a.shape
+    assert n == len(b), 'Matrix and vector shapes are not aligned.'
+    assert n >= k, 'Matrix must have at least as many rows as columns.'
+    if np is not None:
+        q, r = np.linalg.qr(a.data.reshape(n, k))
+        diagonal = np.abs(r.diagonal())
+        if k and diagonal.min() <= tol * diagonal.max():
+            raise ValueError('Matrix does not have full column rank.')
+        return np.linalg.solve(r, q.T @ np.asarray(b, dtype=np.float64))
+
+    mul = operator.mul
+    columns = [a.column(j).tolist() for j in range(k)]
+    rhs = list(b)
+    for j in range(k):
+        x = columns[j][j:]
+        norm = math.sqrt(sum(map(mul, x, x)))
+        if norm == 0.0:
+            continue
+        alpha = -norm if x[0] >= 0 else norm
+        # Householder vector u = x - alpha * e_1, reflection H = I - 2uu^T/u^Tu
+        x[0] -= alpha
+        scale = 2.0 / sum(map(mul, x, x))
+        for column in columns[j:] + [rhs]:
+            factor = scale * sum(map(mul, x, column[j:]))
+            column[j:] = [c - factor * u for c, u in zip(column[j:], x)]
+    diagonal = [abs(columns[j][j]) for j in range(k)]
+    if k and min(diagonal) <= tol * max(diagonal):
+        raise ValueError('Matrix does not have full column rank.')
+    # Back substitution for Rx = Q^T b
+    solution = [0.0] * k
+    for i in reversed(range(k)):
+        tail = sum(columns[j][i] * solution[j] for j in range(i + 1, k))
+        solution[i] = (rhs[i] - tail) / columns[i][i]
+    return v.as_array(solution)
+
+
+if __name__ == '__main__':
+    pass
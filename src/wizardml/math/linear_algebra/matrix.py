@@ -1,12 +1,18 @@
 import math
-from typing import List, Tuple, Callable
+import operator
+from array import array
+from typing import List, Tuple, Callable, Union
 
 from . import vector as v
+from .vector import np
 
 # Define Matrix type
 Matrix = List[List[float]]
 Vector = v.Vector
 
+# Number of rows/columns in each tile of a blocked matrix multiply
+BLOCK_SIZE = 64
+
 
 def display_matrix(matrix: Matrix) -> None:
     """
@@ -161,5 +167,353 @@ def identity_matrix(n: int = 1) -> Matrix:
     return [[1 if i == j else 0 for i in size] for j in size]
 
 
+class DenseMatrix:
+    """
+    A row-major matrix stored in one flat float64 buffer.
+
+    The buffer is a numpy.ndarray when NumPy is installed and an array('d')
+    otherwise, see vector.as_array. Indexing with a row index returns that
+    row, so a DenseMatrix can be passed to shape, get_row and get_column
+    like a Matrix.
+
+    Parameters
+    ----------
+    rows : int
+        Number of rows in the matrix.
+    columns : int
+        Number of columns in the matrix.
+    data : ArrayVector, optional
+        The rows * columns elements in row-major order. Zeros if none.
+    """
+    __slots__ = ('rows', 'columns', 'data')
+
+    def __init__(self, rows: int, columns: int, data: v.ArrayVector = None):
+        if data is None:
+            data = _zeros(rows * columns)
+        assert len(data) == rows * columns, 'Data must have rows * columns elements.'
+        self.rows = rows
+        self.columns = columns
+        self.data = data
+
+    @classmethod
+    def from_rows(cls, matrix: Matrix) -> 'DenseMatrix':
+        """
+        Builds a DenseMatrix from a list of rows.
+
+        Parameters
+        ----------
+        matrix : Matrix
+            A matrix of type List[List[float]].
+
+        Returns
+        -------
+        DenseMatrix
+            A copy of the matrix in a flat row-major buffer.
+        """
+        if isinstance(matrix, DenseMatrix):
+            return matrix
+        rows, columns = shape(matrix)
+        if np is not None:
+            data = np.array(matrix, dtype=np.float64).reshape(rows * columns)
+        else:
+            data = array('d')
+            for row in matrix:
+                assert len(row) == columns, 'Rows must all be of equal size.'
+                data.extend(row)
+        return cls(rows, columns, data)
+
+    @classmethod
+    def identity(cls, n: int) -> 'DenseMatrix':
+        """
+        Returns an n x n identity matrix.
+
+        Parameters
+        ----------
+        n : int
+            Size of the n x n identity matrix.
+
+        Returns
+        -------
+        DenseMatrix
+            A matrix with values of 1 on the diagonal, otherwise zero.
+        """
+        identity = cls(n, n)
+        identity.data[::n + 1] = v.as_array([1.0] * n)
+        return identity
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        """The shape of the matrix in the form of (rows, columns)."""
+        return (self.rows, self.columns)
+
+    def to_rows(self) -> Matrix:
+        """
+        Copies the matrix into a list of rows.
+
+        Returns
+        -------
+        Matrix
+            A matrix of type List[List[float]].
+        """
+        data = self.data.tolist()
+        columns = self.columns
+        return [data[start:start + columns]
+                for start in range(0, self.rows * columns, columns)]
+
+    def row(self, row_i: int) -> v.ArrayVector:
+        """
+        Returns a row of the matrix. With NumPy the row is a view.
+
+        Parameters
+        ----------
+        row_i : int
+            The row index to return.
+
+        Returns
+        -------
+        ArrayVector
+            The elements of the row.
+        """
+        assert 0 <= row_i < self.rows, 'Row index out of bounds.'
+        start = row_i * self.columns
+        return self.data[start:start + self.columns]
+
+    def column(self, col_j: int) -> v.ArrayVector:
+        """
+        Returns a copy of a column of the matrix.
+
+        Parameters
+        ----------
+        col_j : int
+            The column index to return.
+
+        Returns
+        -------
+        ArrayVector
+            The elements of the column.
+        """
+        assert 0 <= col_j < self.columns, 'Column index out of bounds.'
+        return self.data[col_j::self.columns]
+
+    def row_block(self, start: int, stop: int) -> 'DenseMatrix':
+        """
+        Returns the rows start to stop - 1 as a matrix. With NumPy the
+        block shares its buffer with this matrix.
+
+        Parameters
+        ----------
+        start : int
+            The first row index.
+        stop : int
+            One past the last row index.
+
+        Returns
+        -------
+        DenseMatrix
+            A (stop - start) x columns matrix.
+        """
+        start, stop = max(start, 0), min(stop, self.rows)
+        columns = self.columns
+        return DenseMatrix(stop - start, columns,
+                           self.data[start * columns:stop * columns])
+
+    def take_rows(self, indices) -> 'DenseMatrix':
+        """
+        Returns a copy of the given rows, in the order given.
+
+        Parameters
+        ----------
+        indices : Sequence[int]
+            The row indices to gather.
+
+        Returns
+        -------
+        DenseMatrix
+            A len(indices) x columns matrix.
+        """
+        columns = self.columns
+        if np is not None:
+            data = self.data.reshape(self.rows, columns)[np.asarray(indices)]
+            return DenseMatrix(len(indices), columns, data.reshape(len(indices) * columns))
+        data = array('d')
+        for i in indices:
+            data.extend(self.data[i * columns:(i + 1) * columns])
+        return DenseMatrix(len(indices), columns, data)
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def __iter__(self):
+        return (self.row(i) for i in range(self.rows))
+
+    def __getitem__(self, index):
+        if isinstance(index, tuple):
+            i, j = index
+            return self.data[i * self.columns + j]
+        return self.row(index)
+
+    def __setitem__(self, index: Tuple[int, int], value: float) -> None:
+        i, j = index
+        self.data[i * self.columns + j] = value
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, DenseMatrix):
+            return NotImplemented
+        return (self.shape == other.shape
+                and self.data.tolist() == other.data.tolist())
+
+    def __repr__(self) -> str:
+        return f'DenseMatrix({self.to_rows()})'
+
+
+def _zeros(n: int) -> v.ArrayVector:
+    """Return a float64 buffer of n zeros."""
+    if np is not None:
+        return np.zeros(n, dtype=np.float64)
+    return array('d', bytes(8 * n))
+
+
+def _as_dense(matrix: Union[Matrix, DenseMatrix]) -> DenseMatrix:
+    """Return matrix as a DenseMatrix, copying only list based matrices."""
+    if isinstance(matrix, DenseMatrix):
+        return matrix
+    return DenseMatrix.from_rows(matrix)
+
+
+def _like(matrix: Union[Matrix, DenseMatrix], result: DenseMatrix):
+    """Return result in the same matrix type as matrix."""
+    if isinstance(matrix, DenseMatrix):
+        return result
+    return result.to_rows()
+
+
+def transpose(matrix: Union[Matrix, DenseMatrix]) -> Union[Matrix, DenseMatrix]:
+    """
+    Returns the transpose of a matrix.
+
+    Parameters
+    ----------
+    matrix : Matrix | DenseMatrix
+        A matrix of type List[List[float]] or a DenseMatrix.
+
+    Returns
+    -------
+    Matrix | DenseMatrix
+        The transposed matrix, of the same type as the input.
+    """
+    a = _as_dense(matrix)
+    rows, columns = a.shape
+    if np is not None:
+        data = np.ascontiguousarray(a.data.reshape(rows, columns).T).reshape(rows * columns)
+    else:
+        # Each strided slice copies one column in C, so no per-element loop
+        data = array('d')
+        for j in range(columns):
+            data.extend(a.data[j::columns])
+    return _like(matrix, DenseMatrix(columns, rows, data))
+
+
+def matmul(a: Union[Matrix, DenseMatrix],
+           b: Union[Matrix, DenseMatrix]) -> Union[Matrix, DenseMatrix]:
+    """
+    Multiplies two matrices.
+
+    Without NumPy the product is computed in BLOCK_SIZE x BLOCK_SIZE tiles
+    of the result. Each tile of BLOCK_SIZE rows of a is unpacked into
+    Python floats once and reused for every tile of columns of b, so only
+    one tile of rows and one of columns are unpacked at a time. The inner
+    (k) dimension is not blocked: each entry is one full-length sum.
+
+    Parameters
+    ----------
+    a : Matrix | DenseMatrix
+        An n x k matrix.
+    b : Matrix | DenseMatrix
+        A k x m matrix.
+
+    Returns
+    -------
+    Matrix | DenseMatrix
+        The n x m matrix product ab, of the same type as a.
+    """
+    a_dense, b_dense = _as_dense(a), _as_dense(b)
+    n, k = a_dense.shape
+    k_b, m = b_dense.shape
+    assert k == k_b, 'Matrix shapes are not aligned.'
+    if np is not None:
+        product = a_dense.data.reshape(n, k) @ b_dense.data.reshape(k, m)
+        return _like(a, DenseMatrix(n, m, product.reshape(n * m)))
+
+    mul = operator.mul
+    result = DenseMatrix(n, m)
+    for i0 in range(0, n, BLOCK_SIZE):
+        rows = [a_dense.row(i).tolist() for i in range(i0, min(i0 + BLOCK_SIZE, n))]
+        for j0 in range(0, m, BLOCK_SIZE):
+            j1 = min(j0 + BLOCK_SIZE, m)
+            columns = [b_dense.column(j).tolist() for j in range(j0, j1)]
+            for i, row in enumerate(rows, i0):
+                start = i * m
+                result.data[start + j0:start + j1] = array(
+                    'd', [sum(map(mul, row, column)) for column in columns])
+    return _like(a, result)
+
+
+def matvec(matrix: Union[Matrix, DenseMatrix], x: Vector) -> v.ArrayVector:
+    """
+    Multiplies a matrix by a vector.
+
+    Parameters
+    ----------
+    matrix : Matrix | DenseMatrix
+        An n x k matrix.
+    x : Vector
+        A vector of length k.
+
+    Returns
+    -------
+    ArrayVector
+        The vector of length n with the dot product of each row with x.
+    """
+    a = _as_dense(matrix)
+    rows, columns = a.shape
+    assert columns == len(x), 'Matrix and vector shapes are not aligned.'
+    if np is not None:
+        return a.data.reshape(rows, columns) @ np.asarray(x, dtype=np.float64)
+    mul = operator.mul
+    x = list(x)
+    data = a.data
+    return array('d', [sum(map(mul, data[start:start + columns], x))
+                       for start in range(0, rows * columns, columns)])
+
+
+
+def rmatvec(matrix: Union[Matrix, DenseMatrix], x: Vector) -> v.ArrayVector:
+    """
+    Multiplies the transpose of a matrix by a vector, without forming the
+    transpose.
+
+    Parameters
+    ----------
+    matrix : Matrix | DenseMatrix
+        An n x k matrix A.
+    x : Vector
+        A vector of length n.
+
+    Returns
+    -------
+    ArrayVector
+        The vector A^T x of length k.
+    """
+    a = _as_dense(matrix)
+    rows, columns = a.shape
+    assert rows == len(x), 'Matrix and vector shapes are not aligned.'
+    if np is not None:
+        return np.asarray(x, dtype=np.float64) @ a.data.reshape(rows, columns)
+    mul = operator.mul
+    x = list(x)
+    data = a.data
+    return array('d', [sum(map(mul, data[j::columns], x)) for j in range(columns)])
+
+
 if __name__ == '__main__':
     pass
@@ -1,4 +1,8 @@
 __all__ = [
+    'bootstrap',
+    'moments',
     'probability',
-    'stats'
+    'sketches',
+    'stats',
+    'summary'
 ]
\ No newline at end of file
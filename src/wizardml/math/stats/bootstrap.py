@@ -1,14 +1,303 @@
+import operator
 import random
-from typing import TypeVar, Callable, List
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import TypeVar, Callable, List, Sequence
+
+from ..linear_algebra.vector import np
+from . import stats
 
 T = TypeVar('T')
 Stat = TypeVar('Stat')
 
-def bootstrap_sample(data: List[T]) -> List[T]:
-    return[random.choice(data) for _ in data]
-        
+# Number of tasks each worker process gets, to balance uneven statistics
+TASKS_PER_WORKER = 4
+
+# Number of resamples whose count vectors are held at once by the
+# weighted bootstrap
+WEIGHTED_BLOCK_SIZE = 32
+
+# Data and statistic for the resamples run in a worker process
+_worker_state = {}
+
+
+def bootstrap_sample(data: List[T], rng: random.Random = None) -> List[T]:
+    """
+    Draws a sample of len(data) elements from data with replacement.
+
+    Parameters
+    ----------
+    data : List[T]
+        The data to resample.
+    rng : random.Random, optional
+        The random number generator. If none, the random module is used.
+
+    Returns
+    -------
+    List[T]
+        The bootstrap sample.
+    """
+    rng = rng if rng is not None else random
+    return rng.choices(data, k=len(data))
+
+
+def resample_seeds(num_samples: int, seed: int = None) -> List[int]:
+    """
+    Draws one seed per resample from a generator seeded with seed.
+
+    Resample i always uses the ith seed, so the resamples do not depend on
+    how they are split between worker processes.
+
+    Parameters
+    ----------
+    num_samples : int
+        The number of resamples.
+    seed : int, optional
+        The seed for the whole bootstrap. If none, results are not
+        reproducible.
+
+    Returns
+    -------
+    List[int]
+        A 64 bit seed for each resample.
+    """
+    rng = random.Random(seed)
+    return [rng.getrandbits(64) for _ in range(num_samples)]
+
+
+def resample_indices(n: int, seed: int) -> Sequence[int]:
+    """
+    Draws n indices in [0, n) with replacement in one bulk call.
+
+    Parameters
+    ----------
+    n : int
+        The size of the data being resampled.
+    seed : int
+        The seed for this resample, see resample_seeds.
+
+    Returns
+    -------
+    Sequence[int]
+        The indices of the resampled elements.
+    """
+    if np is not None:
+        return np.random.default_rng(seed).integers(0, n, size=n)
+    return random.Random(seed).choices(range(n), k=n)
+
+
+def _run_resamples(data, stat_func: Callable[[List[T]], Stat],
+                   seeds: List[int]) -> List[Stat]:
+    """Evaluate stat_func on the resample drawn from each seed."""
+    n = len(data)
+    results = []
+    for seed in seeds:
+        indices = resample_indices(n, seed)
+        if np is not None and isinstance(data, np.ndarray):
+            sample = data[indices].tolist()
+        else:
+            sample = [data[i] for i in indices]
+        results.append(stat_func(sample))
+    return results
+
+
+def _init_worker(shm_name: str, n: int, data: List[T],
+                 stat_func: Callable[[List[T]], Stat]) -> None:
+    """Attach a worker process to the shared data."""
+    if shm_name is not None:
+        shm = shared_memory.SharedMemory(name=shm_name)
+        _worker_state['shm'] = shm  # Keep the mapping alive
+        if np is not None:
+            data = np.ndarray((n,), dtype=np.float64, buffer=shm.buf)
+        else:
+            data = shm.buf[:8 * n].cast('d')
+    _worker_state['data'] = data
+    _worker_state['stat_func'] = stat_func
+
 
-def bootstrap_statistic(data: List[x],
+def _worker_resamples(seeds: List[int]) -> List[Stat]:
+    """Run a chunk of resamples in a worker process."""
+    return _run_resamples(_worker_state['data'], _worker_state['stat_func'], seeds)
+
+
+def bootstrap_statistic(data: List[T],
                         stat_func: Callable[[List[T]], Stat],
-                        num_samples: int) -> List[Stat]:
-    return[stat_func(bootstrap_sample(data) for _ in range(num_samples))]
\ No newline at end of file
+                        num_samples: int,
+                        seed: int = None,
+                        workers: int = 1) -> List[Stat]:
+    """
+    Evaluates a statistic on num_samples bootstrap resamples of data.
+
+    Resample indices are drawn in bulk from a per-resample seed, so for a
+    given seed the results are the same for any number of workers. With
+    workers > 1 the resamples run in a process pool. Numeric data is placed
+    in shared memory once instead of being copied to every task; other data
+    is copied once per worker. stat_func must then be picklable, e.g. a
+    module level function.
+
+    Parameters
+    ----------
+    data : List[T]
+        The data to resample.
+    stat_func : Callable[[List[T]], Stat]
+        The statistic, called with a list for each resample.
+    num_samples : int
+        The number of resamples.
+    seed : int, optional
+        The seed for the whole bootstrap.
+    workers : int, optional
+        The number of worker processes, by default 1 (no pool).
+
+    Returns
+    -------
+    List[Stat]
+        The statistic for each resample.
+    """
+    assert len(data) > 0, 'Must pass a non-empty dataset.'
+    seeds = resample_seeds(num_samples, seed)
+    n = len(data)
+    # Numeric data is held as float64 in every mode so results match
+    numeric = all(isinstance(x, (int, float)) for x in data)
+    if numeric:
+        values = np.asarray(data, dtype=np.float64) if np is not None else array('d', data)
+    else:
+        values = list(data)
+    if workers <= 1 or num_samples < 2:
+        return _run_resamples(values, stat_func, seeds)
+
+    num_tasks = min(num_samples, workers * TASKS_PER_WORKER)
+    bounds = [num_samples * i // num_tasks for i in range(num_tasks + 1)]
+    chunks = [seeds[start:end] for start, end in zip(bounds, bounds[1:])]
+    shm = None
+    try:
+        if numeric:
+            shm = shared_memory.SharedMemory(create=True, size=8 * n)
+            shm.buf[:8 * n] = memoryview(values).cast('B')
+            initargs = (shm.name, n, None, stat_func)
+        else:
+            initargs = (None, n, values, stat_func)
+        with ProcessPoolExecutor(workers, initializer=_init_worker,
+                                 initargs=initargs) as pool:
+            return [stat for chunk in pool.map(_worker_resamples, chunks)
+                    for stat in chunk]
+    finally:
+        if shm is not None:
+            shm.close()
+            shm.unlink()
+
+
+def resample_counts(n: int, seed: int) -> Sequence[int]:
+    """
+    Counts how often each element is drawn in a resample.
+
+    The counts follow a multinomial distribution and describe the same
+    resample as resample_indices(n, seed).
+
+    Parameters
+    ----------
+    n : int
+        The size of the data being resampled.
+    seed : int
+        The seed for this resample, see resample_seeds.
+
+    Returns
+    -------
+    Sequence[int]
+        The number of times each of the n elements is drawn.
+    """
+    indices = resample_indices(n, seed)
+    if np is not None:
+        return np.bincount(indices, minlength=n)
+    counts = [0] * n
+    for i in indices:
+        counts[i] += 1
+    return counts
+
+
+def _weighted_moments(counts, centred: List, shifts: List[float],
+                      stat_func: Callable[..., float]) -> List[float]:
+    """
+    Evaluate a mean, variance or covariance for each row of resample counts
+    as weighted sums over the centred data.
+    """
+    n = len(centred[0])
+    mul = operator.mul
+    if stat_func is stats.mean:
+        x, shift = centred[0], shifts[0]
+        if np is not None:
+            return (counts @ x / n + shift).tolist()
+        return [sum(map(mul, c, x)) / n + shift for c in counts]
+    if n == 1:
+        return [0] * len(counts)
+    x, y = centred if stat_func is stats.cov else centred * 2
+    if np is not None:
+        mean_x, mean_y = counts @ x / n, counts @ y / n
+        return ((counts @ (x * y) - n * mean_x * mean_y) / (n - 1)).tolist()
+    xy = list(map(mul, x, y))
+    result = []
+    for c in counts:
+        mean_x = sum(map(mul, c, x)) / n
+        mean_y = sum(map(mul, c, y)) / n if y is not x else mean_x
+        result.append((sum(map(mul, c, xy)) - n * mean_x * mean_y) / (n - 1))
+    return result
+
+
+def bootstrap_linear_statistic(stat_func: Callable[..., float],
+                               num_samples: int,
+                               *data: List[float],
+                               seed: int = None) -> List[float]:
+    """
+    Bootstraps stats.mean, stats.variance or stats.cov without building
+    the resamples.
+
+    A resample is a reweighting of the original data by how often each
+    element was drawn, so each statistic is a weighted sum over the data.
+    Count vectors are drawn for WEIGHTED_BLOCK_SIZE resamples at a time and
+    reduced against the data in one matrix product, so memory is
+    O(num_samples + n) rather than O(num_samples * n). For a given seed the
+    resamples are the same as those of bootstrap_statistic, and the results
+    agree up to floating point rounding.
+
+    Parameters
+    ----------
+    stat_func : Callable[..., float]
+        One of stats.mean, stats.variance or stats.cov.
+    num_samples : int
+        The number of resamples.
+    *data : List[float]
+        The data, one list (two lists, paired, for stats.cov).
+    seed : int, optional
+        The seed for the whole bootstrap.
+
+    Returns
+    -------
+    List[float]
+        The statistic for each resample.
+    """
+    assert stat_func in (stats.mean, stats.variance, stats.cov), \
+        'stat_func must be stats.mean, stats.variance or stats.cov.'
+    assert len(data) == (2 if stat_func is stats.cov else 1), \
+        'stats.cov needs two lists, other statistics one.'
+    n = len(data[0])
+    assert n > 0, 'Must pass a non-empty dataset.'
+    assert all(len(x) == n for x in data), 'Vectors must be of equal size.'
+    # Centre the data first, for numerical stability of the variance
+    shifts = [stats.mean(x) for x in data]
+    if np is not None:
+        centred = [np.asarray(x, dtype=np.float64) - shift for x, shift in zip(data, shifts)]
+    else:
+        centred = [[xi - shift for xi in x] for x, shift in zip(data, shifts)]
+
+    seeds = resample_seeds(num_samples, seed)
+    result = []
+    for start in range(0, num_samples, WEIGHTED_BLOCK_SIZE):
+        counts = [resample_counts(n, s) for s in seeds[start:start + WEIGHTED_BLOCK_SIZE]]
+        if np is not None:
+            counts = np.array(counts, dtype=np.float64)
+        result.extend(_weighted_moments(counts, centred, shifts, stat_func))
+    return result
+
+
+if __name__ == '__main__':
+    pass
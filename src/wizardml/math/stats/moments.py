@@ -0,0 +1,411 @@
+import math
+import operator
+from itertools import islice
+from typing import Iterable, Iterator, List, Union
+
+from ..linear_algebra.matrix import Matrix, DenseMatrix
+from ..linear_algebra.vector import Vector, np
+
+# Number of values folded into the running moments at a time
+CHUNK_SIZE = 4096
+
+
+def _chunks(values: Iterable) -> Iterator[List]:
+    """Split an iterable into lists of at most CHUNK_SIZE elements."""
+    iterator = iter(values)
+    chunk = list(islice(iterator, CHUNK_SIZE))
+    while chunk:
+        yield chunk
+        chunk = list(islice(iterator, CHUNK_SIZE))
+
+
+class Moments:
+    """
+    Running count, mean and sum of squared deviations (M2) of a stream of
+    values, from which the variance and standard deviation follow.
+
+    Single values are added with Welford's update. Chunks are summarised
+    with a two-pass mean and M2 and combined with Chan's parallel update,
+    which is also how moments from separate shards are merged. Neither
+    subtracts large sums of squares, so both stay accurate when the mean is
+    large compared to the spread.
+    """
+    __slots__ = ('count', 'mean', 'm2')
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def update(self, x: float) -> 'Moments':
+        """
+        Adds a single value.
+
+        Parameters
+        ----------
+        x : float
+            The value to add.
+
+        Returns
+        -------
+        Moments
+            The updated moments (self).
+        """
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (x - self.mean)
+        return self
+
+    def update_many(self, values: Iterable[float]) -> 'Moments':
+        """
+        Adds every value from an iterable, in one pass over it.
+
+        Parameters
+        ----------
+        values : Iterable[float]
+            The values to add, e.g. a list or a generator.
+
+        Returns
+        -------
+        Moments
+            The updated moments (self).
+        """
+        for chunk in _chunks(values):
+            n = len(chunk)
+            chunk_mean = sum(chunk) / n
+            deviations = [x - chunk_mean for x in chunk]
+            self._combine(n, chunk_mean, sum(map(operator.mul, deviations, deviations)))
+        return self
+
+    def merge(self, other: 'Moments') -> 'Moments':
+        """
+        Adds the moments of another, disjoint set of values.
+
+        Parameters
+        ----------
+        other : Moments
+            Moments of e.g. another shard of the data.
+
+        Returns
+        -------
+        Moments
+            The updated moments (self).
+        """
+        self._combine(other.count, other.mean, other.m2)
+        return self
+
+    def _combine(self, count: int, mean: float, m2: float) -> None:
+        """Chan et al.'s update for combining two sets of moments."""
+        if count == 0:
+            return
+        if self.count == 0:
+            self.count, self.mean, self.m2 = count, mean, m2
+            return
+        total = self.count + count
+        delta = mean - self.mean
+        self.m2 += m2 + delta * delta * self.count * count / total
+        self.mean += delta * count / total
+        self.count = total
+
+    @property
+    def variance(self) -> float:
+        """The sample variance, or None if no values were added."""
+        if self.count == 0:
+            return None
+        if self.count == 1:
+            return 0
+        return self.m2 / (self.count - 1)
+
+    @property
+    def std(self) -> float:
+        """The sample standard deviation, or None if no values were added."""
+        if self.count == 0:
+            return None
+        return math.sqrt(self.variance)
+
+
+class CoMoments:
+    """
+    Running moments of a stream of (x, y) pairs: the moments of x and of y
+    plus the sum of products of their deviations (the co-moment), from
+    which the covariance and correlation follow.
+
+    Updates and merges work as for Moments.
+    """
+    __slots__ = ('x', 'y', 'c')
+
+    def __init__(self):
+        self.x = Moments()
+        self.y = Moments()
+        self.c = 0.0
+
+    @property
+    def count(self) -> int:
+        """The number of pairs added."""
+        return self.x.count
+
+    def update(self, x: float, y: float) -> 'CoMoments':
+        """
+        Adds a single pair.
+
+        Parameters
+        ----------
+        x : float
+            The x value.
+        y : float
+            The y value.
+
+        Returns
+        -------
+        CoMoments
+            The updated moments (self).
+        """
+        delta_x = x - self.x.mean
+        self.x.update(x)
+        self.y.update(y)
+        self.c += delta_x * (y - self.y.mean)
+        return self
+
+    def update_many(self, xs: Iterable[float], ys: Iterable[float]) -> 'CoMoments':
+        """
+        Adds every pair from two iterables, in one pass over them.
+
+        Parameters
+        ----------
+        xs : Iterable[float]
+            The x values.
+        ys : Iterable[float]
+            The y values, paired with xs.
+
+        Returns
+        -------
+        CoMoments
+            The updated moments (self).
+        """
+        mul = operator.mul
+        for chunk in _chunks(zip(xs, ys)):
+            n = len(chunk)
+            chunk_x, chunk_y = zip(*chunk)
+            mean_x, mean_y = sum(chunk_x) / n, sum(chunk_y) / n
+            dev_x = [x - mean_x for x in chunk_x]
+            dev_y = [y - mean_y for y in chunk_y]
+            self._combine(n, mean_x, mean_y, sum(map(mul, dev_x, dev_x)),
+                          sum(map(mul, dev_y, dev_y)), sum(map(mul, dev_x, dev_y)))
+        return self
+
+    def merge(self, other: 'CoMoments') -> 'CoMoments':
+        """
+        Adds the moments of another, disjoint set of pairs.
+
+        Parameters
+        ----------
+        other : CoMoments
+            Moments of e.g. another shard of the data.
+
+        Returns
+        -------
+        CoMoments
+            The updated moments (self).
+        """
+        self._combine(other.count, other.x.mean, other.y.mean,
+                      other.x.m2, other.y.m2, other.c)
+        return self
+
+    def _combine(self, count: int, mean_x: float, mean_y: float,
+                 m2_x: float, m2_y: float, c: float) -> None:
+        """Chan et al.'s update, extended to the co-moment."""
+        if count == 0:
+            return
+        if self.count == 0:
+            self.c = c
+        else:
+            total = self.count + count
+            self.c += c + ((mean_x - self.x.mean) * (mean_y - self.y.mean)
+                           * self.count * count / total)
+        self.x._combine(count, mean_x, m2_x)
+        self.y._combine(count, mean_y, m2_y)
+
+    @property
+    def cov(self) -> float:
+        """The sample covariance, or None if no pairs were added."""
+        if self.count == 0:
+            return None
+        if self.count == 1:
+            return 0
+        return self.c / (self.count - 1)
+
+    @property
+    def corr(self) -> float:
+        """
+        The correlation coefficient, or None if no pairs were added. Zero if
+        either x or y is constant.
+        """
+        if self.count == 0:
+            return None
+        if self.x.m2 <= 0 or self.y.m2 <= 0:
+            return 0
+        return self.c / math.sqrt(self.x.m2 * self.y.m2)
+
+
+class CoMomentMatrix:
+    """
+    Running count, column means and matrix of co-moments (sums of products
+    of deviations) of a stream of rows, from which the covariance and
+    correlation matrices of all pairs of columns follow.
+
+    Rows are added a chunk at a time: each chunk is centred on its own
+    means, its co-moment matrix is a single X^T X product of the centred
+    chunk, and it is combined with the running totals by Chan's update.
+    Totals from separate shards combine the same way with merge. Memory
+    is O(d^2) in the number of columns d however many rows are seen.
+    """
+    __slots__ = ('count', 'mean', 'm2')
+
+    def __init__(self):
+        self.count = 0
+        self.mean = None
+        self.m2 = None
+
+    @property
+    def dimension(self) -> int:
+        """The number of columns."""
+        return len(self.mean) if self.mean is not None else 0
+
+    def update_many(self, rows: Union[Matrix, DenseMatrix,
+                                      Iterable[Vector]]) -> 'CoMomentMatrix':
+        """
+        Adds every row of a matrix or an iterable of rows, in one pass.
+
+        Parameters
+        ----------
+        rows : Matrix | DenseMatrix | Iterable[Vector]
+            The rows to add, e.g. a list of rows or a generator.
+
+        Returns
+        -------
+        CoMomentMatrix
+            The updated moments (self).
+        """
+        if isinstance(rows, DenseMatrix):
+            for start in range(0, rows.rows, CHUNK_SIZE):
+                block = rows.row_block(start, start + CHUNK_SIZE)
+                if np is not None:
+                    self._add_block(block.data.reshape(block.shape))
+                else:
+                    self._add_block([block.data[j::block.columns]
+                                     for j in range(block.columns)])
+            return self
+        for chunk in _chunks(rows):
+            if np is not None:
+                self._add_block(np.array(chunk, dtype=np.float64))
+            else:
+                self._add_block([list(column) for column in zip(*chunk)])
+        return self
+
+    def _add_block(self, block) -> None:
+        """
+        Add one chunk, an n x d ndarray with NumPy and otherwise a list of
+        its d columns.
+        """
+        if np is not None:
+            n = len(block)
+            block_mean = block.mean(axis=0)
+            centred = block - block_mean
+            self._combine(n, block_mean, centred.T @ centred)
+            return
+        mul = operator.mul
+        n, d = len(block[0]), len(block)
+        block_mean = [sum(column) / n for column in block]
+        centred = [[x - mean for x in column]
+                   for column, mean in zip(block, block_mean)]
+        # Fill the upper triangle and mirror it
+        m2 = [[0.0] * d for _ in range(d)]
+        for i in range(d):
+            for j in range(i, d):
+                m2[i][j] = m2[j][i] = sum(map(mul, centred[i], centred[j]))
+        self._combine(n, block_mean, m2)
+
+    def merge(self, other: 'CoMomentMatrix') -> 'CoMomentMatrix':
+        """
+        Adds the moments of another, disjoint set of rows.
+
+        Parameters
+        ----------
+        other : CoMomentMatrix
+            Moments of e.g. another shard of the data.
+
+        Returns
+        -------
+        CoMomentMatrix
+            The updated moments (self).
+        """
+        if other.count > 0:
+            if np is not None:
+                self._combine(other.count, other.mean.copy(), other.m2.copy())
+            else:
+                self._combine(other.count, list(other.mean),
+                              [row[:] for row in other.m2])
+        return self
+
+    def _combine(self, count: int, mean, m2) -> None:
+        """Chan et al.'s update for combining two sets of moments."""
+        if count == 0:
+            return
+        if self.count == 0:
+            self.count, self.mean, self.m2 = count, mean, m2
+            return
+        assert len(mean) == self.dimension, 'Rows must all be of equal size.'
+        total = self.count + count
+        weight = self.count * count / total
+        if np is not None:
+            delta = mean - self.mean
+            self.m2 += m2 + np.outer(delta, delta * weight)
+            self.mean += delta * (count / total)
+        else:
+            delta = [b - a for a, b in zip(self.mean, mean)]
+            for row, other_row, delta_i in zip(self.m2, m2, delta):
+                scaled = delta_i * weight
+                row[:] = [r + o + scaled * delta_j
+                          for r, o, delta_j in zip(row, other_row, delta)]
+            self.mean = [a + d * count / total for a, d in zip(self.mean, delta)]
+        self.count = total
+
+    def _matrix(self, rows) -> DenseMatrix:
+        """Return a d x d ndarray or list of rows as a DenseMatrix."""
+        d = self.dimension
+        if np is not None:
+            return DenseMatrix(d, d, rows.reshape(d * d))
+        return DenseMatrix.from_rows(rows)
+
+    @property
+    def cov(self) -> DenseMatrix:
+        """The sample covariance matrix, or None if no rows were added."""
+        if self.count == 0:
+            return None
+        denominator = max(self.count - 1, 1)
+        if np is not None:
+            return self._matrix(self.m2 / denominator)
+        return self._matrix([[c / denominator for c in row] for row in self.m2])
+
+    @property
+    def corr(self) -> DenseMatrix:
+        """
+        The correlation matrix, or None if no rows were added. Entries
+        involving a constant column are zero.
+        """
+        if self.count == 0:
+            return None
+        if np is not None:
+            diagonal = self.m2.diagonal()
+            scale = np.zeros(self.dimension)
+            np.divide(1.0, np.sqrt(diagonal), out=scale, where=diagonal > 0)
+            return self._matrix(self.m2 * np.outer(scale, scale))
+        scale = [1 / math.sqrt(row[i]) if row[i] > 0 else 0.0
+                 for i, row in enumerate(self.m2)]
+        return self._matrix([[c * s_i * s_j for c, s_j in zip(row, scale)]
+                             for row, s_i in zip(self.m2, scale)])
+
+
+if __name__ == '__main__':
+    pass
@@ -0,0 +1,499 @@
+import heapq
+import math
+import random
+from collections import Counter
+from operator import itemgetter
+from typing import Any, Dict, Hashable, Iterable, List, Tuple, Union
+
+from .moments import _chunks
+
+
+class QuantileSketch:
+    """
+    A mergeable, bounded memory quantile sketch (KLL).
+
+    Values are kept in a stack of compactors. The compactor at level h
+    holds values that each stand for 2^h original values. When a compactor
+    is full it is sorted and every other value, starting at a random
+    offset, is promoted to the next level while the rest are dropped.
+    Lower levels get geometrically smaller capacities, so memory is
+    O(k log(n / k)). The rank error of a quantile is roughly 1.7 / k of the
+    number of values seen (about 1% for the default k = 200). Until the
+    first compaction the sketch holds every value and quantiles are exact.
+
+    Parameters
+    ----------
+    k : int, optional
+        Capacity of the top compactor. Larger k means smaller error and
+        more memory, by default 200.
+    seed : int, optional
+        Seed for the compaction offsets.
+    """
+
+    # Ratio between the capacities of adjacent compactors
+    _CAPACITY_DECAY = 2 / 3
+
+    def __init__(self, k: int = 200, seed: int = None):
+        assert k >= 2, 'k must be at least 2.'
+        self.k = k
+        self.count = 0
+        self._random = random.Random(seed)
+        self._compactors: List[list] = [[]]
+        self._size = 0
+        self._max_size = self._capacity(0)
+
+    def _capacity(self, level: int) -> int:
+        """The number of values a compactor may hold before compacting."""
+        depth = len(self._compactors) - level - 1
+        return int(math.ceil(self.k * self._CAPACITY_DECAY ** depth)) + 1
+
+    def _grow(self) -> None:
+        """Add a new top compactor."""
+        self._compactors.append([])
+        self._max_size = sum(self._capacity(h) for h in range(len(self._compactors)))
+
+    def _compress(self) -> None:
+        """Compact full compactors until the sketch is within its size limit."""
+        for level in range(len(self._compactors)):
+            compactor = self._compactors[level]
+            if len(compactor) >= self._capacity(level):
+                if level + 1 == len(self._compactors):
+                    self._grow()
+                compactor.sort()
+                # An odd value out stays at this level
+                keep = compactor[:len(compactor) % 2]
+                offset = self._random.randrange(2)
+                self._compactors[level + 1].extend(compactor[len(keep) + offset::2])
+                self._compactors[level] = keep
+                self._size = sum(len(c) for c in self._compactors)
+                if self._size < self._max_size:
+                    break
+
+    def update(self, x: float) -> 'QuantileSketch':
+        """
+        Adds a single value.
+
+        Parameters
+        ----------
+        x : float
+            The value to add.
+
+        Returns
+        -------
+        QuantileSketch
+            The updated sketch (self).
+        """
+        self._compactors[0].append(x)
+        self._size += 1
+        self.count += 1
+        if self._size >= self._max_size:
+            self._compress()
+        return self
+
+    def update_many(self, values: Iterable[float]) -> 'QuantileSketch':
+        """
+        Adds every value from an iterable.
+
+        Parameters
+        ----------
+        values : Iterable[float]
+            The values to add, e.g. a list or a generator.
+
+        Returns
+        -------
+        QuantileSketch
+            The updated sketch (self).
+        """
+        for x in values:
+            self.update(x)
+        return self
+
+    def merge(self, other: 'QuantileSketch') -> 'QuantileSketch':
+        """
+        Adds the values summarised by another sketch, e.g. from another
+        worker. Both sketches should use the same k.
+
+        Parameters
+        ----------
+        other : QuantileSketch
+            The sketch to merge in. It is not modified.
+
+        Returns
+        -------
+        QuantileSketch
+            The updated sketch (self).
+        """
+        while len(self._compactors) < len(other._compactors):
+            self._grow()
+        for level, compactor in enumerate(other._compactors):
+            self._compactors[level].extend(compactor)
+        self.count += other.count
+        self._size = sum(len(c) for c in self._compactors)
+        while self._size >= self._max_size:
+            self._compress()
+        return self
+
+    def _weighted_values(self) -> List[Tuple[float, int]]:
+        """The retained values, sorted, with the number of values each represents."""
+        return sorted((x, 2 ** level)
+                      for level, compactor in enumerate(self._compactors)
+                      for x in compactor)
+
+    def quantiles(self, ps: List[float]) -> List[float]:
+        """
+        Estimates stats.quantile(x, p) for each p in ps.
+
+        Parameters
+        ----------
+        ps : List[float]
+            The percents of values that are below each return value.
+
+        Returns
+        -------
+        List[float]
+            The estimated quantile for each p, in the order of ps.
+        """
+        if self.count == 0:
+            return None
+        # Compactions preserve the total weight, so ranks match stats.quantile
+        total = self.count
+        return self._at_ranks([min(int(total * p), total - 1) for p in ps])
+
+    def _at_ranks(self, ranks: List[int]) -> List[float]:
+        """The estimated value at each rank (counting from 0) of the sorted data."""
+        weighted = self._weighted_values()
+        order = sorted(range(len(ranks)), key=lambda i: ranks[i])
+        result = [None] * len(ranks)
+        position, cumulative = 0, weighted[0][1]
+        for i in order:
+            while cumulative <= ranks[i]:
+                position += 1
+                cumulative += weighted[position][1]
+            result[i] = weighted[position][0]
+        return result
+
+    def median(self) -> float:
+        """
+        Estimates stats.median(x) for the values seen, averaging the two
+        middle values when the count is even.
+
+        Returns
+        -------
+        float
+            The estimated median.
+        """
+        if self.count == 0:
+            return None
+        midpoint = self.count // 2
+        if self.count % 2 == 1:
+            return self._at_ranks([midpoint])[0]
+        lower, upper = self._at_ranks([midpoint - 1, midpoint])
+        return (lower + upper) / 2
+
+    def quantile(self, p: float) -> float:
+        """
+        Estimates stats.quantile(x, p) for the values seen.
+
+        Parameters
+        ----------
+        p : float
+            The percent of values that are below the return value.
+
+        Returns
+        -------
+        float
+            The estimated quantile.
+        """
+        if self.count == 0:
+            return None
+        return self.quantiles([p])[0]
+
+    def iqr(self) -> float:
+        """
+        Estimates stats.iqr(x) for the values seen.
+
+        Returns
+        -------
+        float
+            The estimated difference between the 75th and 25th percentiles.
+        """
+        if self.count == 0:
+            return None
+        q3, q1 = self.quantiles([0.75, 0.25])
+        return q3 - q1
+
+
+class FrequencySketch:
+    """
+    A mergeable, bounded memory frequency sketch (Space-Saving) for finding
+    the most frequent values of a stream.
+
+    At most `capacity` values are tracked, each with an upper bound on its
+    count and the most that bound can overstate it. A new value arriving
+    when the sketch is full replaces the value with the smallest count and
+    inherits that count as its error. Every count is then overstated by at
+    most n / capacity for n values seen, and any value seen more than
+    n / capacity times is tracked. While there are no more distinct values
+    than the capacity, every count is exact.
+
+    Parameters
+    ----------
+    capacity : int, optional
+        The number of values tracked, by default 100.
+    """
+
+    def __init__(self, capacity: int = 100):
+        assert capacity >= 1, 'capacity must be at least 1.'
+        self.capacity = capacity
+        self.count = 0
+        self._counts: Dict[Hashable, int] = {}
+        self._errors: Dict[Hashable, int] = {}
+        # Whether a value has ever been dropped, i.e. counts are estimates
+        self._evicted = False
+
+    def _floor(self) -> int:
+        """The most an untracked value can have been seen."""
+        return min(self._counts.values()) if self._evicted else 0
+
+    def update(self, x: Hashable, weight: int = 1) -> 'FrequencySketch':
+        """
+        Adds a single value.
+
+        Parameters
+        ----------
+        x : Hashable
+            The value to add.
+        weight : int, optional
+            The number of times x was seen, by default 1.
+
+        Returns
+        -------
+        FrequencySketch
+            The updated sketch (self).
+        """
+        self.count += weight
+        counts = self._counts
+        if x in counts:
+            counts[x] += weight
+        elif len(counts) < self.capacity:
+            counts[x] = weight
+            self._errors[x] = 0
+        else:
+            smallest = min(counts, key=counts.get)
+            floor = counts.pop(smallest)
+            del self._errors[smallest]
+            counts[x] = floor + weight
+            self._errors[x] = floor
+            self._evicted = True
+        return self
+
+    def update_many(self, values: Iterable[Hashable]) -> 'FrequencySketch':
+        """
+        Adds every value from an iterable. Values are counted exactly a
+        chunk at a time and each chunk is merged into the sketch.
+
+        Parameters
+        ----------
+        values : Iterable[Hashable]
+            The values to add, e.g. a list or a generator.
+
+        Returns
+        -------
+        FrequencySketch
+            The updated sketch (self).
+        """
+        for chunk in _chunks(values):
+            counts = Counter(chunk)
+            self._combine(counts, dict.fromkeys(counts, 0), 0, len(chunk))
+        return self
+
+    def merge(self, other: 'FrequencySketch') -> 'FrequencySketch':
+        """
+        Adds the values summarised by another sketch, e.g. from another
+        worker. The error bound becomes n / capacity for the combined n.
+
+        Parameters
+        ----------
+        other : FrequencySketch
+            The sketch to merge in. It is not modified.
+
+        Returns
+        -------
+        FrequencySketch
+            The updated sketch (self).
+        """
+        self._combine(other._counts, other._errors, other._floor(), other.count)
+        self._evicted = self._evicted or other._evicted
+        return self
+
+    def _combine(self, counts: Dict[Hashable, int], errors: Dict[Hashable, int],
+                 floor: int, count: int) -> None:
+        """
+        Add another summary's counts, charging values missing from either
+        side with that side's floor, and keep the largest capacity counts.
+        """
+        own_floor = self._floor()
+        combined = {}
+        # Keep first-seen order, which mode uses to order ties like stats.mode
+        for x in dict.fromkeys([*self._counts, *counts]):
+            combined[x] = (self._counts.get(x, own_floor) + counts.get(x, floor),
+                           self._errors.get(x, own_floor) + errors.get(x, floor))
+        if len(combined) > self.capacity:
+            kept = heapq.nlargest(self.capacity, combined.items(),
+                                  key=lambda item: item[1][0])
+            combined = dict(kept)
+            self._evicted = True
+        self._counts = {x: c for x, (c, _) in combined.items()}
+        self._errors = {x: e for x, (_, e) in combined.items()}
+        self.count += count
+
+    def estimate(self, x: Hashable) -> int:
+        """
+        Estimates how often a value was seen.
+
+        Parameters
+        ----------
+        x : Hashable
+            The value.
+
+        Returns
+        -------
+        int
+            An upper bound on the count of x. Exact if error(x) is 0.
+        """
+        return self._counts.get(x, self._floor())
+
+    def error(self, x: Hashable) -> int:
+        """
+        The most that estimate(x) can overstate the count of x.
+
+        Parameters
+        ----------
+        x : Hashable
+            The value.
+
+        Returns
+        -------
+        int
+            The maximum overestimate.
+        """
+        return self._errors.get(x, self._floor())
+
+    def top_k(self, k: int = None) -> List[Tuple[Any, int]]:
+        """
+        Returns the most frequent values with their estimated counts.
+
+        Parameters
+        ----------
+        k : int, optional
+            The number of values to return. If none, every tracked value.
+
+        Returns
+        -------
+        List[Tuple[Any, int]]
+            (value, count) pairs, most frequent first.
+        """
+        items = sorted(self._counts.items(), key=itemgetter(1), reverse=True)
+        return items if k is None else items[:k]
+
+    def heavy_hitters(self, threshold: float) -> List[Any]:
+        """
+        Returns the values that may make up more than a fraction threshold
+        of the values seen. No value above the threshold is missed.
+
+        Parameters
+        ----------
+        threshold : float
+            The fraction of values seen, e.g. 0.01.
+
+        Returns
+        -------
+        List[Any]
+            The candidate values, most frequent first.
+        """
+        return [x for x, c in self.top_k() if c > threshold * self.count]
+
+    def mode(self) -> List[Any]:
+        """
+        Estimates stats.mode(x) for the values seen.
+
+        Returns
+        -------
+        List[Any]
+            The value(s) with the largest estimated count.
+        """
+        if self.count == 0:
+            return None
+        max_count = max(self._counts.values())
+        return [x for x, c in self._counts.items() if c == max_count]
+
+
+def approx_quantile(x: Union[Iterable[float], QuantileSketch], p: float) -> float:
+    """
+    Estimates the value such that p percent of values are below it, in
+    bounded memory. Matches stats.quantile, but also takes a stream or a
+    sketch.
+
+    Parameters
+    ----------
+    x : Iterable[float] | QuantileSketch
+        The values, or a sketch already built from them.
+    p : float
+        The percent of values that are below the return value.
+
+    Returns
+    -------
+    float
+        The estimated quantile.
+    """
+    if not isinstance(x, QuantileSketch):
+        x = QuantileSketch().update_many(x)
+    return x.quantile(p)
+
+
+def approx_iqr(x: Union[Iterable[float], QuantileSketch]) -> float:
+    """
+    Estimates the Interquartile Range (IQR) in bounded memory. Matches
+    stats.iqr, but also takes a stream or a sketch.
+
+    Parameters
+    ----------
+    x : Iterable[float] | QuantileSketch
+        The values, or a sketch already built from them.
+
+    Returns
+    -------
+    float
+        The estimated difference between the 75th and 25th percentiles.
+    """
+    if not isinstance(x, QuantileSketch):
+        x = QuantileSketch().update_many(x)
+    return x.iqr()
+
+
+def approx_mode(x: Union[Iterable[Hashable], FrequencySketch],
+                capacity: int = 100) -> List[Any]:
+    """
+    Estimates the most frequent value(s) in bounded memory. Matches
+    stats.mode while x has at most capacity distinct values, but also takes
+    a stream or a sketch.
+
+    Parameters
+    ----------
+    x : Iterable[Hashable] | FrequencySketch
+        The values, or a sketch already built from them.
+    capacity : int, optional
+        The number of values tracked, by default 100.
+
+    Returns
+    -------
+    List[Any]
+        The most frequent value(s).
+    """
+    if not isinstance(x, FrequencySketch):
+        x = FrequencySketch(capacity).update_many(x)
+    return x.mode()
+
+
+if __name__ == '__main__':
+    pass
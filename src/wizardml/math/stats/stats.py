@@ -1,8 +1,18 @@
-from typing import List
+from typing import Dict, List, Union
 from collections import Counter
 import math
+import random
 
-from ..linear_algebra.vector import dot, sum_of_squares
+from ..linear_algebra.matrix import Matrix, DenseMatrix, _like
+from ..linear_algebra.vector import np
+from .moments import Moments, CoMoments, CoMomentMatrix
+
+# Partitions smaller than this are sorted instead of partitioned further
+_SELECT_CUTOFF = 32
+
+# Pivot choices only affect speed, so use a private generator and leave the
+# global random state alone
+_pivot_random = random.Random(0)
 
 def mean(x: List[float]) -> float:
     """
@@ -23,6 +33,53 @@ def mean(x: List[float]) -> float:
     return sum(x) / len(x)
 
 
+def _select(x: List[float], ranks: List[int]) -> Dict[int, float]:
+    """
+    Finds the values at several ranks of sorted(x) from one partial
+    partition of x, in O(n) expected time instead of a full sort.
+
+    Pure Python uses quickselect with a median of three random pivots,
+    recursing only into the partitions that hold a requested rank, and
+    falls back to sorting a partition whose recursion gets too deep
+    (introselect). With NumPy numeric data is handed to numpy.partition.
+    """
+    wanted = sorted(set(ranks))
+    if wanted and wanted[-1] >= len(x):
+        raise IndexError('Quantile index out of range.')
+    if np is not None:
+        values = np.asarray(x)
+        if values.dtype.kind in 'iuf':
+            partitioned = np.partition(values, wanted)
+            return {k: partitioned[k].item() for k in wanted}
+
+    result = {}
+    depth_limit = 2 * max(len(x), 1).bit_length()
+    # Each entry is (values, ranks within values, offset of values, depth)
+    stack = [(list(x), wanted, 0, 0)]
+    while stack:
+        values, ks, offset, depth = stack.pop()
+        if len(values) <= _SELECT_CUTOFF or depth > depth_limit:
+            ordered = sorted(values)
+            for k in ks:
+                result[k + offset] = ordered[k]
+            continue
+        pivot = sorted(_pivot_random.sample(values, 3))[1]
+        lows = [v for v in values if v < pivot]
+        highs = [v for v in values if v > pivot]
+        n_low = len(lows)
+        n_not_high = len(values) - len(highs)
+        low_ks = [k for k in ks if k < n_low]
+        high_ks = [k - n_not_high for k in ks if k >= n_not_high]
+        for k in ks:
+            if n_low <= k < n_not_high:
+                result[k + offset] = pivot
+        if low_ks:
+            stack.append((lows, low_ks, offset, depth + 1))
+        if high_ks:
+            stack.append((highs, high_ks, offset + n_not_high, depth + 1))
+    return result
+
+
 def median(x: List[float]) -> float:
     """
     Calculate the median value of a list of numbers.
@@ -39,21 +96,13 @@ def median(x: List[float]) -> float:
         For even numbered lists, the mean of the two middle elements is 
         returned.
     """
-    
-    def _median_odd(x):
-        """Calculate median for odd-numbered lists."""
-        return sorted(x)[len(x) // 2]
-    
-    def _median_even(x):
-        """Calculate median for even-numbered lists."""
-        x_sorted = sorted(x)
-        midpoint_high = len(x) // 2
-        return (x_sorted[midpoint_high - 1] + x_sorted[midpoint_high]) / 2
-    
     if len(x) == 0:  # Return None for empty lists
         return None
-    even = len(x) % 2 == 0  # Check if list has an even number of elements
-    return _median_even(x) if even else _median_odd(x)
+    midpoint_high = len(x) // 2
+    if len(x) % 2 == 1:  # Odd numbered lists have a single middle element
+        return _select(x, [midpoint_high])[midpoint_high]
+    middle = _select(x, [midpoint_high - 1, midpoint_high])
+    return (middle[midpoint_high - 1] + middle[midpoint_high]) / 2
 
 
 def quantile(x: List[float], p: float) -> float:
@@ -75,7 +124,31 @@ def quantile(x: List[float], p: float) -> float:
     if len(x) == 0:
         return None
     quantile_index = int(len(x) * p)
-    return sorted(x)[quantile_index]
+    return _select(x, [quantile_index])[quantile_index]
+
+
+def quantiles(x: List[float], ps: List[float]) -> List[float]:
+    """
+    Returns quantile(x, p) for each p in ps, from a single partial
+    partition of x rather than one sort per quantile.
+
+    Parameters
+    ----------
+    x : List[float]
+        A list of values.
+    ps : List[float]
+        The percents of values that are below each return value.
+
+    Returns
+    -------
+    List[float]
+        The quantile of x for each p, in the order of ps.
+    """
+    if len(x) == 0:
+        return None
+    indices = [int(len(x) * p) for p in ps]
+    values = _select(x, indices)
+    return [values[i] for i in indices]
 
 
 def mode(x: List[float]) -> List[float]:
@@ -143,6 +216,8 @@ def variance(x: List[float]) -> float:
     """
     Returns the variance of a list of values.
 
+    Computed in one pass with Moments, without a list of deviations.
+
     Parameters
     ----------
     x : List[float]
@@ -155,11 +230,7 @@ def variance(x: List[float]) -> float:
     """
     if len(x) == 0:
         return None
-    if len(x) == 1:
-        return 0
-    n = len(x)
-    deviations = subtract_mean(x)
-    return sum_of_squares(deviations) / (n - 1)
+    return Moments().update_many(x).variance
 
 
 def std(x: List[float]) -> float:
@@ -197,13 +268,16 @@ def iqr(x: List[float]) -> float:
     """
     if len(x) == 0:
         return None
-    return quantile(x, p=0.75) - quantile(x, p=0.25)
+    q3, q1 = quantiles(x, [0.75, 0.25])
+    return q3 - q1
 
 
 def cov(x: List[float], y: List[float]) -> float:
     """
     Returns the sample covariance of x and y.
 
+    Computed in one pass with CoMoments.
+
     Parameters
     ----------
     x : List[float]
@@ -219,15 +293,16 @@ def cov(x: List[float], y: List[float]) -> float:
     assert len(x) == len(y), 'Vectors must be of equal size.'
     if len(x) == 0:
         return None
-    elif len(x) == 1:
-        return 0
-    return dot(subtract_mean(x), subtract_mean(y)) / (len(x) - 1)
+    return CoMoments().update_many(x, y).cov
 
 
 def corr(x: List[float], y: List[float]) -> float:
     """
     Return the correlation coefficient of x and y.
 
+    Computed in one pass with CoMoments, rather than separate passes for
+    each standard deviation and the covariance.
+
     Parameters
     ----------
     x : List[float]
@@ -238,12 +313,54 @@ def corr(x: List[float], y: List[float]) -> float:
     Returns
     -------
     float
-        The correlation coefficient of x and y.
+        The correlation coefficient of x and y. Zero if x or y is constant.
     """
     if len(x) == 0 or len(y) == 0:
         return None
-    std_x = std(x)
-    std_y = std(y)
-    if std_x <= 0 and std_y <= 0:
-        return 0
-    return cov(x, y) / (std_x * std_y)
\ No newline at end of file
+    assert len(x) == len(y), 'Vectors must be of equal size.'
+    return CoMoments().update_many(x, y).corr
+
+
+def cov_matrix(matrix: Union[Matrix, DenseMatrix]) -> Union[Matrix, DenseMatrix]:
+    """
+    Returns the sample covariance of every pair of columns of a matrix.
+
+    The whole matrix is computed from one pass over the rows with
+    CoMomentMatrix, instead of one call to cov per pair of columns.
+
+    Parameters
+    ----------
+    matrix : Matrix | DenseMatrix
+        A matrix with one row per observation and one column per variable.
+
+    Returns
+    -------
+    Matrix | DenseMatrix
+        The d x d covariance matrix, of the same type as the input.
+    """
+    if len(matrix) == 0:
+        return None
+    return _like(matrix, CoMomentMatrix().update_many(matrix).cov)
+
+
+def corr_matrix(matrix: Union[Matrix, DenseMatrix]) -> Union[Matrix, DenseMatrix]:
+    """
+    Returns the correlation coefficient of every pair of columns of a matrix.
+
+    The whole matrix is computed from one pass over the rows with
+    CoMomentMatrix, instead of one call to corr per pair of columns.
+
+    Parameters
+    ----------
+    matrix : Matrix | DenseMatrix
+        A matrix with one row per observation and one column per variable.
+
+    Returns
+    -------
+    Matrix | DenseMatrix
+        The d x d correlation matrix, of the same type as the input.
+        Entries involving a constant column are zero.
+    """
+    if len(matrix) == 0:
+        return None
+    return _like(matrix, CoMomentMatrix().update_many(matrix).corr)
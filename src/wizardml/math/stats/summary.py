@@ -0,0 +1,160 @@
+from typing import Dict, Iterator, List, Sequence, Union
+
+from ..linear_algebra.matrix import Matrix, DenseMatrix
+from ..linear_algebra.vector import np
+from .moments import CHUNK_SIZE, Moments
+from .stats import _select
+
+# Rows of the table returned by describe, in order
+STATISTICS = ('count', 'mean', 'std', 'min', 'q1', 'median', 'q3', 'max', 'range', 'iqr')
+
+
+class Summary:
+    """
+    Per-column summary statistics of a dataset, as returned by describe.
+
+    The statistics are held in a DenseMatrix with one row per entry of
+    STATISTICS and one column per column of the data. q1, median, q3 and
+    iqr follow stats.quantile, stats.median and stats.iqr.
+
+    Parameters
+    ----------
+    table : DenseMatrix
+        A len(STATISTICS) x columns matrix of statistics.
+    """
+    __slots__ = ('table',)
+
+    def __init__(self, table: DenseMatrix):
+        assert table.rows == len(STATISTICS), 'Table must have a row per statistic.'
+        self.table = table
+
+    @property
+    def columns(self) -> int:
+        """The number of columns summarised."""
+        return self.table.columns
+
+    def __getitem__(self, statistic: str) -> List[float]:
+        """The value of a statistic for every column, e.g. summary['mean']."""
+        if statistic not in STATISTICS:
+            raise KeyError(statistic)
+        return self.table.row(STATISTICS.index(statistic)).tolist()
+
+    def column(self, col_j: int) -> Dict[str, float]:
+        """
+        Returns every statistic of a single column.
+
+        Parameters
+        ----------
+        col_j : int
+            The column index.
+
+        Returns
+        -------
+        Dict[str, float]
+            The statistics of the column, keyed by name.
+        """
+        return dict(zip(STATISTICS, self.table.column(col_j).tolist()))
+
+    def to_dict(self) -> Dict[str, List[float]]:
+        """
+        Copies the table into a dictionary of lists.
+
+        Returns
+        -------
+        Dict[str, List[float]]
+            The per-column values of each statistic, keyed by name.
+        """
+        return dict(zip(STATISTICS, self.table.to_rows()))
+
+    def __repr__(self) -> str:
+        width = max(len(name) for name in STATISTICS)
+        lines = [f'{name:<{width}} ' + ' '.join(f'{x:>12.6g}' for x in row)
+                 for name, row in zip(STATISTICS, self.table.to_rows())]
+        return '\n'.join(lines)
+
+
+def _column_chunks(matrix: Union[Matrix, DenseMatrix]) -> Iterator[List[Sequence[float]]]:
+    """Yield the columns of each block of CHUNK_SIZE rows."""
+    if isinstance(matrix, DenseMatrix):
+        columns = matrix.columns
+        for start in range(0, matrix.rows, CHUNK_SIZE):
+            block = matrix.row_block(start, start + CHUNK_SIZE).data
+            yield [block[j::columns] for j in range(columns)]
+    else:
+        for start in range(0, len(matrix), CHUNK_SIZE):
+            yield list(zip(*matrix[start:start + CHUNK_SIZE]))
+
+
+def _order_ranks(n: int) -> List[int]:
+    """The ranks of min, q1, the middle element(s), q3 and max for n values."""
+    return sorted({0, int(n * 0.25), (n - 1) // 2, n // 2, int(n * 0.75), n - 1})
+
+
+def describe(matrix: Union[Matrix, DenseMatrix]) -> Summary:
+    """
+    Computes summary statistics for every column of a dataset.
+
+    The count, mean and standard deviation of all columns come from one
+    pass over the rows, a chunk of rows at a time, instead of one pass per
+    column and statistic. The order statistics (min, quartiles, median and
+    max) come from one partial partition of each column. With NumPy both
+    steps run on the whole array at once.
+
+    Parameters
+    ----------
+    matrix : Matrix | DenseMatrix
+        A matrix with one row per observation and one column per variable.
+
+    Returns
+    -------
+    Summary
+        The statistics of each column, see STATISTICS, or None if the
+        dataset has no rows or no columns.
+    """
+    if len(matrix) == 0:
+        return None
+    # A dataset of rows without columns has nothing to summarize either
+    if (matrix.columns if isinstance(matrix, DenseMatrix) else len(matrix[0])) == 0:
+        return None
+    if np is not None:
+        if isinstance(matrix, DenseMatrix):
+            values = matrix.data.reshape(matrix.rows, matrix.columns)
+        else:
+            values = np.asarray(matrix, dtype=np.float64)
+        n, columns = values.shape
+        ranks = _order_ranks(n)
+        means = values.mean(axis=0)
+        centred = values - means
+        m2 = np.einsum('ij,ij->j', centred, centred)
+        std = np.sqrt(m2 / (n - 1)) if n > 1 else np.zeros(columns)
+        partitioned = np.partition(values, ranks, axis=0)
+        order = {k: partitioned[k].tolist() for k in ranks}
+        means, std = means.tolist(), std.tolist()
+    else:
+        moments = None
+        gathered = None
+        for chunk in _column_chunks(matrix):
+            if moments is None:
+                moments = [Moments() for _ in chunk]
+                gathered = [[] for _ in chunk]
+            for moment, values, column in zip(moments, gathered, chunk):
+                moment.update_many(column)
+                values.extend(column)
+        n, columns = moments[0].count, len(moments)
+        ranks = _order_ranks(n)
+        selected = [_select(values, ranks) for values in gathered]
+        order = {k: [s[k] for s in selected] for k in ranks}
+        means = [moment.mean for moment in moments]
+        std = [moment.std for moment in moments]
+
+    lows, highs = order[0], order[n - 1]
+    q1, q3 = order[int(n * 0.25)], order[int(n * 0.75)]
+    medians = [(a + b) / 2 for a, b in zip(order[(n - 1) // 2], order[n // 2])]
+    rows = [[n] * columns, means, std, lows, q1, medians, q3, highs,
+            [b - a for a, b in zip(lows, highs)],
+            [b - a for a, b in zip(q1, q3)]]
+    return Summary(DenseMatrix.from_rows(rows))
+
+
+if __name__ == '__main__':
+    pass
@@ -0,0 +1,4 @@
+__all__ = [
+    'dataset',
+    'scaler'
+]
\ No newline at end of file
@@ -0,0 +1,269 @@
+import mmap
+import shutil
+import struct
+import sys
+import tempfile
+from array import array
+from typing import Iterator, List, Tuple, Union
+
+from ..math.linear_algebra.vector import Vector, ArrayVector, np
+from ..math.linear_algebra.matrix import DenseMatrix
+
+# File layout: a HEADER_SIZE byte header, then the rows x columns features
+# in row-major order, then (if present) the rows targets. Every value is a
+# little-endian float64 and the data starts 64 byte aligned.
+MAGIC = b'WZMLDATA'
+VERSION = 1
+HEADER_SIZE = 64
+_HEADER = struct.Struct('<8sHHIQQ')  # magic, version, flags, reserved, rows, columns
+
+# Header flag set when the file holds a target for each row
+FLAG_TARGETS = 1
+
+# Access modes of load_dataset, as for numpy.memmap
+_ACCESS = {'r': mmap.ACCESS_READ, 'c': mmap.ACCESS_COPY, 'r+': mmap.ACCESS_WRITE}
+
+
+def _to_bytes(values) -> bytes:
+    """Little-endian float64 bytes of a list, array('d') or ndarray."""
+    if np is not None:
+        return np.asarray(values, dtype='<f8').tobytes()
+    values = values if isinstance(values, array) else array('d', values)
+    if sys.byteorder != 'little':
+        values = array('d', values)
+        values.byteswap()
+    return values.tobytes()
+
+
+class DatasetWriter:
+    """
+    Writes a dataset file a chunk of rows at a time, so data larger than
+    memory (e.g. parsed from a CSV) can be converted in constant memory.
+
+    Targets are spooled to a temporary file and appended when the writer
+    is closed, which also fills in the row count in the header.
+
+    Parameters
+    ----------
+    path : str
+        The file to create.
+    columns : int
+        The number of features in each row.
+    targets : bool, optional
+        If true, every chunk must come with a target for each row.
+    """
+
+    def __init__(self, path: str, columns: int, targets: bool = False):
+        self.path = path
+        self.columns = columns
+        self.targets = targets
+        self.rows = 0
+        self._file = open(path, 'wb')
+        self._file.write(bytes(HEADER_SIZE))
+        self._targets = tempfile.TemporaryFile() if targets else None
+
+    def write(self, x_chunk: Union[List[Vector], DenseMatrix],
+              y_chunk: List[float] = None) -> 'DatasetWriter':
+        """
+        Appends a chunk of rows.
+
+        Parameters
+        ----------
+        x_chunk : List[Vector] | DenseMatrix
+            The features, one row per data point.
+        y_chunk : List[float], optional
+            The target of each row, required if the file has targets.
+
+        Returns
+        -------
+        DatasetWriter
+            The writer (self).
+        """
+        assert (y_chunk is not None) == self.targets, \
+            'Targets must be given exactly when the file has targets.'
+        if isinstance(x_chunk, DenseMatrix):
+            assert x_chunk.columns == self.columns, 'Rows must all be of equal size.'
+            self._file.write(_to_bytes(x_chunk.data))
+        else:
+            data = array('d')
+            for row in x_chunk:
+                assert len(row) == self.columns, 'Rows must all be of equal size.'
+                data.extend(row)
+            self._file.write(_to_bytes(data))
+        if self.targets:
+            assert len(y_chunk) == len(x_chunk), 'X and Y vectors must be of equal length.'
+            self._targets.write(_to_bytes(y_chunk))
+        self.rows += len(x_chunk)
+        return self
+
+    def close(self) -> None:
+        """Appends the targets, writes the header and closes the file."""
+        if self._file.closed:
+            return
+        flags = 0
+        if self._targets is not None:
+            flags |= FLAG_TARGETS
+            self._targets.seek(0)
+            shutil.copyfileobj(self._targets, self._file)
+            self._targets.close()
+        self._file.seek(0)
+        self._file.write(_HEADER.pack(MAGIC, VERSION, flags, 0, self.rows, self.columns))
+        self._file.close()
+
+    def __enter__(self) -> 'DatasetWriter':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def save_dataset(path: str, x: Union[List[Vector], DenseMatrix],
+                 y: List[float] = None) -> None:
+    """
+    Writes a dataset to a file that load_dataset can memory-map.
+
+    Parameters
+    ----------
+    path : str
+        The file to create.
+    x : List[Vector] | DenseMatrix
+        The features, one row per data point.
+    y : List[float], optional
+        The target of each row.
+
+    Returns
+    -------
+    None
+    """
+    assert len(x) > 0, 'Must pass a non-empty dataset.'
+    with DatasetWriter(path, len(x[0]), targets=y is not None) as writer:
+        writer.write(x, y)
+
+
+class MappedDataset:
+    """
+    A dataset file mapped into memory.
+
+    Opening a file only reads its header; pages of data are read by the
+    operating system as they are first touched. x is a DenseMatrix and y
+    an ArrayVector (a memoryview of doubles without NumPy) whose buffers
+    are the mapping itself, and the row blocks from batches are views of
+    it, so they can be passed to MinibatchSampler, the scalers and the
+    regression fitters without copying the data into Python floats.
+
+    Parameters
+    ----------
+    path : str
+        The file to open.
+    mode : str, optional
+        'r' for read only (the default), 'c' for copy-on-write, so data
+        can be scaled in place without changing the file, or 'r+' to write
+        changes back to the file.
+
+    Raises
+    ------
+    ValueError
+        If the file is not a dataset file or is truncated.
+    """
+
+    def __init__(self, path: str, mode: str = 'r'):
+        assert mode in _ACCESS, "mode must be 'r', 'c' or 'r+'."
+        self.path = path
+        with open(path, 'r+b' if mode == 'r+' else 'rb') as file:
+            header = file.read(HEADER_SIZE)
+            if len(header) < HEADER_SIZE or header[:len(MAGIC)] != MAGIC:
+                raise ValueError('Not a wizardml dataset file.')
+            _, version, flags, _, rows, columns = _HEADER.unpack_from(header)
+            if version != VERSION:
+                raise ValueError(f'Unsupported dataset version {version}.')
+            count = rows * columns + (rows if flags & FLAG_TARGETS else 0)
+            file.seek(0, 2)
+            if file.tell() < HEADER_SIZE + 8 * count:
+                raise ValueError('Dataset file is truncated.')
+            # The mapping stays valid after the file is closed
+            self._mmap = mmap.mmap(file.fileno(), HEADER_SIZE + 8 * count,
+                                   access=_ACCESS[mode])
+        if np is not None:
+            values = np.frombuffer(self._mmap, dtype='<f8', count=count, offset=HEADER_SIZE)
+        else:
+            values = memoryview(self._mmap)[HEADER_SIZE:HEADER_SIZE + 8 * count].cast('d')
+            if sys.byteorder != 'little':
+                values = array('d', values)
+                values.byteswap()
+        self.x = DenseMatrix(rows, columns, values[:rows * columns])
+        self.y: ArrayVector = values[rows * columns:] if flags & FLAG_TARGETS else None
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        """The shape of x in the form of (rows, columns)."""
+        return self.x.shape
+
+    def __len__(self) -> int:
+        return self.x.rows
+
+    def batches(self, batch_size: int) -> Iterator[Tuple[DenseMatrix, ArrayVector]]:
+        """
+        Yields consecutive blocks of rows as views of the mapping.
+
+        Parameters
+        ----------
+        batch_size : int
+            The number of rows in each block (the last may be smaller).
+
+        Yields
+        -------
+        Tuple[DenseMatrix, ArrayVector]
+            The features and targets (None if the file has none) of each
+            block.
+        """
+        assert batch_size > 0, 'Batch size must be positive.'
+        for start in range(0, self.x.rows, batch_size):
+            stop = min(start + batch_size, self.x.rows)
+            y = self.y[start:stop] if self.y is not None else None
+            yield self.x.row_block(start, stop), y
+
+    def flush(self) -> None:
+        """Writes changes back to the file, in mode 'r+'."""
+        self._mmap.flush()
+
+    def close(self) -> None:
+        """
+        Unmaps the file. If views of the data are still referenced the
+        mapping is left for the garbage collector to release.
+        """
+        self.x = self.y = None
+        try:
+            self._mmap.close()
+        except BufferError:
+            pass
+
+    def __enter__(self) -> 'MappedDataset':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def load_dataset(path: str, mode: str = 'r') -> MappedDataset:
+    """
+    Memory-maps a dataset file written by save_dataset or DatasetWriter.
+    This takes constant time however large the file is.
+
+    Parameters
+    ----------
+    path : str
+        The file to open.
+    mode : str, optional
+        'r' (read only), 'c' (copy-on-write) or 'r+' (read and write), see
+        MappedDataset.
+
+    Returns
+    -------
+    MappedDataset
+        The dataset, with features x and targets y.
+    """
+    return MappedDataset(path, mode)
+
+
+if __name__ == '__main__':
+    pass
@@ -1,11 +1,18 @@
-from typing import Tuple, List
+from array import array
+from typing import Iterable, Iterator, List, Tuple, Union
 
-from ..math.linear_algebra.vector import Vector
+from ..math.linear_algebra.vector import Vector, ArrayVector, np
 from ..math.linear_algebra import vector as v
+from ..math.linear_algebra.matrix import DenseMatrix
 from ..math.stats import stats as stat
+from ..math.stats.moments import CHUNK_SIZE, Moments
+from ..math.stats.sketches import QuantileSketch
+from ..math.stats.summary import describe
 
+Dataset = Union[List[Vector], DenseMatrix]
 
-def scale(data: List[Vector]) -> Tuple(Vector, Vector):
+
+def scale(data: List[Vector]) -> Tuple[Vector, Vector]:
     """
     Returns the mean and standard deviation of each position.
 
@@ -13,17 +20,17 @@ def scale(data: List[Vector]) -> Tuple(Vector, Vector):
     ----------
     data : List[Vector]
         The dataset being scaled.
-    
+
     Returns
     -------
     float
         The mean and standard deviation for each position of the dataset.
     """
     size = len(data[0])
-    
+
     mean = v.vector_mean(data)
-    stdev = [stat.std([vector[i] for vector in data]) for i in size]
-    
+    stdev = [stat.std([vector[i] for vector in data]) for i in range(size)]
+
     return mean, stdev
 
 
@@ -43,12 +50,629 @@ def rescale(data: List[Vector]) -> List[Vector]:
     """
     size = len(data[0])
     mean, stdev = scale(data)
-    
-    rescaled = [v[:] for v in data]  # Copy
-    
-    for v in rescaled:
+
+    rescaled = [vector[:] for vector in data]  # Copy
+
+    for vector in rescaled:
         for i in range(size):
             if stdev[i] > 0:
-                v[i] = (v[i] - mean[i]) / stdev[i]
-                
-    return rescaled
\ No newline at end of file
+                vector[i] = (vector[i] - mean[i]) / stdev[i]
+
+    return rescaled
+
+
+def _row_blocks(data: Dataset) -> Iterator[Dataset]:
+    """Yield blocks of at most CHUNK_SIZE rows."""
+    if isinstance(data, DenseMatrix):
+        for start in range(0, data.rows, CHUNK_SIZE):
+            yield data.row_block(start, start + CHUNK_SIZE)
+    else:
+        for start in range(0, len(data), CHUNK_SIZE):
+            yield data[start:start + CHUNK_SIZE]
+
+
+def _column_blocks(data: Dataset) -> Iterator[Tuple[int, object]]:
+    """
+    Yield (columns, values) for each non-empty block of rows, where values
+    is an n x columns ndarray with NumPy and otherwise a list of the
+    block's columns.
+    """
+    for block in _row_blocks(data):
+        if len(block) == 0:
+            continue
+        if isinstance(block, DenseMatrix):
+            columns = block.columns
+            if np is not None:
+                yield columns, block.data.reshape(block.rows, columns)
+            else:
+                yield columns, [block.data[j::columns] for j in range(columns)]
+        else:
+            if np is not None:
+                values = np.asarray(block, dtype=np.float64)
+                yield values.shape[1], values
+            else:
+                yield len(block[0]), [list(column) for column in zip(*block)]
+
+
+class Scaler:
+    """
+    Base class for scalers, which map each column x to (x - center) / scale.
+
+    fit learns center and scale from a dataset and keeps them, so the same
+    transform can later be applied to new rows, e.g. at serving time.
+    Columns with a scale of zero are only shifted. The transform is applied
+    as x * (1 / scale) - center / scale with both factors precomputed, one
+    pass over the data with no per-element branching.
+
+    Datasets are lists of rows or DenseMatrix objects, and transforms
+    return the same type they are given.
+    """
+
+    def __init__(self):
+        self.center: List[float] = None
+        self.scale: List[float] = None
+        self._factor: ArrayVector = None
+        self._offset: ArrayVector = None
+
+    def fit(self, data: Dataset) -> 'Scaler':
+        """
+        Learns the center and scale of each column.
+
+        Parameters
+        ----------
+        data : List[Vector] | DenseMatrix
+            The dataset, one row per data point.
+
+        Returns
+        -------
+        Scaler
+            The fitted scaler (self).
+        """
+        raise NotImplementedError
+
+    def _set_statistics(self, center: List[float], scale: List[float]) -> None:
+        """Store the fitted center and scale, and precompute the kernel."""
+        self.center = list(center)
+        self.scale = list(scale)
+        factor = [1.0 / s if s != 0 else 1.0 for s in self.scale]
+        self._factor = v.as_array(factor)
+        self._offset = v.as_array([c * f for c, f in zip(self.center, factor)])
+
+    def _apply(self, data: Dataset, factor: ArrayVector, offset: ArrayVector,
+               out: Dataset = None) -> Dataset:
+        """Compute data * factor - offset column-wise, writing into out if given."""
+        assert self._factor is not None, 'Scaler must be fit first.'
+        columns = len(factor)
+        if isinstance(data, DenseMatrix):
+            rows = data.rows
+            assert data.columns == columns, 'Data has the wrong number of columns.'
+            if out is None:
+                out = DenseMatrix(rows, columns)
+            assert out.shape == data.shape, 'Output must have the shape of the data.'
+            if np is not None:
+                result = out.data.reshape(rows, columns)
+                np.multiply(data.data.reshape(rows, columns), factor, out=result)
+                result -= offset
+            else:
+                # Each column is one strided slice with a constant factor
+                for j, (f, o) in enumerate(zip(factor, offset)):
+                    out.data[j::columns] = array('d', [x * f - o for x in data.data[j::columns]])
+            return out
+
+        if len(data) == 0:
+            return out if out is not None else []
+        assert len(data[0]) == columns, 'Data has the wrong number of columns.'
+        if np is not None:
+            result = (np.asarray(data, dtype=np.float64) * factor - offset).tolist()
+            if out is None:
+                return result
+            for target, row in zip(out, result):
+                target[:] = row
+            return out
+        factor, offset = list(factor), list(offset)
+        if out is None:
+            return [[x * f - o for x, f, o in zip(row, factor, offset)] for row in data]
+        assert len(out) == len(data), 'Output must have the shape of the data.'
+        for target, row in zip(out, data):
+            target[:] = [x * f - o for x, f, o in zip(row, factor, offset)]
+        return out
+
+    def transform(self, data: Dataset, out: Dataset = None) -> Dataset:
+        """
+        Scales a dataset with the fitted statistics.
+
+        Parameters
+        ----------
+        data : List[Vector] | DenseMatrix
+            The dataset, one row per data point.
+        out : List[Vector] | DenseMatrix, optional
+            Where to write the result, of the same shape and type as data.
+            Pass data itself to transform in place. If none, a new dataset
+            is returned.
+
+        Returns
+        -------
+        List[Vector] | DenseMatrix
+            The scaled dataset (out if given).
+        """
+        return self._apply(data, self._factor, self._offset, out)
+
+    def fit_transform(self, data: Dataset, out: Dataset = None) -> Dataset:
+        """
+        Fits the scaler to a dataset and scales it.
+
+        Parameters
+        ----------
+        data : List[Vector] | DenseMatrix
+            The dataset, one row per data point.
+        out : List[Vector] | DenseMatrix, optional
+            Where to write the result, see transform.
+
+        Returns
+        -------
+        List[Vector] | DenseMatrix
+            The scaled dataset (out if given).
+        """
+        return self.fit(data).transform(data, out)
+
+    def transform_stream(self, chunks: Iterable[Dataset],
+                         in_place: bool = False) -> Iterator[Dataset]:
+        """
+        Scales a stream of chunks one chunk at a time, e.g. batches of rows
+        read from a file, so memory stays that of a single chunk.
+
+        Parameters
+        ----------
+        chunks : Iterable[List[Vector] | DenseMatrix]
+            The chunks of the dataset.
+        in_place : bool, optional
+            If true, each chunk is overwritten with its scaled values.
+
+        Returns
+        -------
+        Iterator[List[Vector] | DenseMatrix]
+            The scaled chunks, in order.
+        """
+        for chunk in chunks:
+            yield self.transform(chunk, chunk if in_place else None)
+
+    def inverse_transform(self, data: Dataset, out: Dataset = None) -> Dataset:
+        """
+        Maps scaled data back to the original units.
+
+        Parameters
+        ----------
+        data : List[Vector] | DenseMatrix
+            A scaled dataset, one row per data point.
+        out : List[Vector] | DenseMatrix, optional
+            Where to write the result, see transform.
+
+        Returns
+        -------
+        List[Vector] | DenseMatrix
+            The unscaled dataset (out if given).
+        """
+        assert self._factor is not None, 'Scaler must be fit first.'
+        factor = [1.0 / f for f in self._factor]
+        offset = [-c for c in self.center]
+        return self._apply(data, v.as_array(factor), v.as_array(offset), out)
+
+
+class StandardScaler(Scaler):
+    """
+    Scales each column to zero mean and unit variance, like rescale but
+    with the mean and standard deviation kept for later transforms.
+
+    The statistics come from one pass over the rows, CHUNK_SIZE rows at a
+    time, using a Moments object per column. Data that does not fit in
+    memory can be fit a chunk at a time with partial_fit, and scalers fit
+    on separate shards can be combined with merge.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._moments: List[Moments] = None
+
+    @property
+    def mean(self) -> List[float]:
+        """The mean of each column."""
+        return self.center
+
+    @property
+    def std(self) -> List[float]:
+        """The sample standard deviation of each column."""
+        return self.scale
+
+    @property
+    def count(self) -> int:
+        """The number of rows fit so far."""
+        return self._moments[0].count if self._moments else 0
+
+    def _refresh(self) -> None:
+        """Recompute the fitted statistics from the running moments."""
+        self._set_statistics([moments.mean for moments in self._moments],
+                             [moments.std for moments in self._moments])
+
+    def _update(self, data: Dataset) -> None:
+        """Add the rows of data to the running moments of each column."""
+        for columns, values in _column_blocks(data):
+            if self._moments is None:
+                self._moments = [Moments() for _ in range(columns)]
+            assert len(self._moments) == columns, 'Data has the wrong number of columns.'
+            if np is not None:
+                n = len(values)
+                means = values.mean(axis=0)
+                m2 = ((values - means) ** 2).sum(axis=0)
+                for moments, mean, m2_j in zip(self._moments, means.tolist(), m2.tolist()):
+                    moments._combine(n, mean, m2_j)
+            else:
+                for moments, column in zip(self._moments, values):
+                    moments.update_many(column)
+
+    def fit(self, data: Dataset) -> 'StandardScaler':
+        """
+        Learns the mean and standard deviation of each column.
+
+        Parameters
+        ----------
+        data : List[Vector] | DenseMatrix
+            The dataset, one row per data point.
+
+        Returns
+        -------
+        StandardScaler
+            The fitted scaler (self).
+        """
+        assert len(data) > 0, 'Must pass a non-empty dataset.'
+        self._moments = None
+        self._update(data)
+        self._refresh()
+        return self
+
+    def partial_fit(self, data: Dataset) -> 'StandardScaler':
+        """
+        Adds a chunk of rows to the statistics fit so far. The result is
+        the same as fitting all the chunks at once.
+
+        Parameters
+        ----------
+        data : List[Vector] | DenseMatrix
+            A chunk of the dataset, one row per data point.
+
+        Returns
+        -------
+        StandardScaler
+            The updated scaler (self).
+        """
+        if len(data) == 0:
+            return self
+        self._update(data)
+        self._refresh()
+        return self
+
+    def merge(self, other: 'StandardScaler') -> 'StandardScaler':
+        """
+        Adds the statistics of a scaler fit on another, disjoint set of
+        rows, e.g. another shard.
+
+        Parameters
+        ----------
+        other : StandardScaler
+            The scaler to merge in. It is not modified.
+
+        Returns
+        -------
+        StandardScaler
+            The updated scaler (self).
+        """
+        if other.count == 0:
+            return self
+        if self._moments is None:
+            self._moments = [Moments() for _ in other._moments]
+        assert len(self._moments) == len(other._moments), 'Data has the wrong number of columns.'
+        for moments, other_moments in zip(self._moments, other._moments):
+            moments.merge(other_moments)
+        self._refresh()
+        return self
+
+
+class MinMaxScaler(Scaler):
+    """
+    Scales each column to the range [0, 1] using its minimum and maximum.
+
+    The extremes are tracked in one pass, so the scaler can also be fit a
+    chunk at a time with partial_fit and combined with merge.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.min: List[float] = None
+        self.max: List[float] = None
+
+    def _update(self, data: Dataset) -> None:
+        """Widen the running minimum and maximum of each column."""
+        for columns, values in _column_blocks(data):
+            if np is not None:
+                lows, highs = values.min(axis=0).tolist(), values.max(axis=0).tolist()
+            else:
+                lows, highs = [min(c) for c in values], [max(c) for c in values]
+            self._extend(lows, highs)
+
+    def _extend(self, lows: List[float], highs: List[float]) -> None:
+        """Widen the running extremes to include lows and highs."""
+        if self.min is None:
+            self.min, self.max = list(lows), list(highs)
+        else:
+            assert len(lows) == len(self.min), 'Data has the wrong number of columns.'
+            self.min = [min(a, b) for a, b in zip(self.min, lows)]
+            self.max = [max(a, b) for a, b in zip(self.max, highs)]
+        self._set_statistics(self.min, [b - a for a, b in zip(self.min, self.max)])
+
+    def fit(self, data: Dataset) -> 'MinMaxScaler':
+        """
+        Learns the minimum and maximum of each column.
+
+        Parameters
+        ----------
+        data : List[Vector] | DenseMatrix
+            The dataset, one row per data point.
+
+        Returns
+        -------
+        MinMaxScaler
+            The fitted scaler (self).
+        """
+        assert len(data) > 0, 'Must pass a non-empty dataset.'
+        self.min = self.max = None
+        self._update(data)
+        return self
+
+    def partial_fit(self, data: Dataset) -> 'MinMaxScaler':
+        """
+        Adds a chunk of rows to the extremes fit so far.
+
+        Parameters
+        ----------
+        data : List[Vector] | DenseMatrix
+            A chunk of the dataset, one row per data point.
+
+        Returns
+        -------
+        MinMaxScaler
+            The updated scaler (self).
+        """
+        self._update(data)
+        return self
+
+    def merge(self, other: 'MinMaxScaler') -> 'MinMaxScaler':
+        """
+        Adds the extremes of a scaler fit on another set of rows.
+
+        Parameters
+        ----------
+        other : MinMaxScaler
+            The scaler to merge in. It is not modified.
+
+        Returns
+        -------
+        MinMaxScaler
+            The updated scaler (self).
+        """
+        if other.min is not None:
+            self._extend(other.min, other.max)
+        return self
+
+
+class MaxAbsScaler(Scaler):
+    """
+    Scales each column to the range [-1, 1] by its largest absolute value,
+    without shifting it, so zeros stay zero.
+
+    Like MinMaxScaler it can be fit a chunk at a time with partial_fit and
+    combined with merge.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.max_abs: List[float] = None
+
+    def _update(self, data: Dataset) -> None:
+        """Raise the running maximum absolute value of each column."""
+        for columns, values in _column_blocks(data):
+            if np is not None:
+                highs = np.abs(values).max(axis=0).tolist()
+            else:
+                highs = [max(max(c), -min(c)) for c in values]
+            self._extend(highs)
+
+    def _extend(self, highs: List[float]) -> None:
+        """Raise the running maximum absolute values to include highs."""
+        if self.max_abs is None:
+            self.max_abs = list(highs)
+        else:
+            assert len(highs) == len(self.max_abs), 'Data has the wrong number of columns.'
+            self.max_abs = [max(a, b) for a, b in zip(self.max_abs, highs)]
+        self._set_statistics([0.0] * len(self.max_abs), self.max_abs)
+
+    def fit(self, data: Dataset) -> 'MaxAbsScaler':
+        """
+        Learns the maximum absolute value of each column.
+
+        Parameters
+        ----------
+        data : List[Vector] | DenseMatrix
+            The dataset, one row per data point.
+
+        Returns
+        -------
+        MaxAbsScaler
+            The fitted scaler (self).
+        """
+        assert len(data) > 0, 'Must pass a non-empty dataset.'
+        self.max_abs = None
+        self._update(data)
+        return self
+
+    def partial_fit(self, data: Dataset) -> 'MaxAbsScaler':
+        """
+        Adds a chunk of rows to the maxima fit so far.
+
+        Parameters
+        ----------
+        data : List[Vector] | DenseMatrix
+            A chunk of the dataset, one row per data point.
+
+        Returns
+        -------
+        MaxAbsScaler
+            The updated scaler (self).
+        """
+        self._update(data)
+        return self
+
+    def merge(self, other: 'MaxAbsScaler') -> 'MaxAbsScaler':
+        """
+        Adds the maxima of a scaler fit on another set of rows.
+
+        Parameters
+        ----------
+        other : MaxAbsScaler
+            The scaler to merge in. It is not modified.
+
+        Returns
+        -------
+        MaxAbsScaler
+            The updated scaler (self).
+        """
+        if other.max_abs is not None:
+            self._extend(other.max_abs)
+        return self
+
+
+class RobustScaler(Scaler):
+    """
+    Centers each column on its median and scales it by its Interquartile
+    Range (IQR), so outliers have little effect on the scaling.
+
+    By default the median and IQR are exact, as stats.median and stats.iqr,
+    and come from one partial partition of each column (see describe)
+    rather than a sort. With approximate=True each column is summarised by
+    a QuantileSketch instead, so memory stays bounded and the scaler can
+    be fit a chunk at a time with partial_fit and combined with merge.
+
+    Parameters
+    ----------
+    approximate : bool, optional
+        If true, estimate the median and IQR with quantile sketches.
+    k : int, optional
+        Size of each QuantileSketch, by default 200.
+    """
+
+    def __init__(self, approximate: bool = False, k: int = 200):
+        super().__init__()
+        self.approximate = approximate
+        self.k = k
+        self._sketches: List[QuantileSketch] = None
+
+    @property
+    def median(self) -> List[float]:
+        """The median of each column."""
+        return self.center
+
+    @property
+    def iqr(self) -> List[float]:
+        """The Interquartile Range of each column."""
+        return self.scale
+
+    def _update(self, data: Dataset) -> None:
+        """Add the rows of data to the sketch of each column."""
+        for columns, values in _column_blocks(data):
+            if self._sketches is None:
+                self._sketches = [QuantileSketch(self.k) for _ in range(columns)]
+            assert len(self._sketches) == columns, 'Data has the wrong number of columns.'
+            if np is not None:
+                values = values.T.tolist()
+            for sketch, column in zip(self._sketches, values):
+                sketch.update_many(column)
+
+    def _refresh(self) -> None:
+        """Recompute the fitted statistics from the sketches."""
+        # median() averages the middle values of an even count, as in exact mode
+        self._set_statistics([sketch.median() for sketch in self._sketches],
+                             [sketch.iqr() for sketch in self._sketches])
+
+    def fit(self, data: Dataset) -> 'RobustScaler':
+        """
+        Learns the median and IQR of each column.
+
+        Parameters
+        ----------
+        data : List[Vector] | DenseMatrix
+            The dataset, one row per data point.
+
+        Returns
+        -------
+        RobustScaler
+            The fitted scaler (self).
+        """
+        assert len(data) > 0, 'Must pass a non-empty dataset.'
+        if not self.approximate:
+            summary = describe(data)
+            self._set_statistics(summary['median'], summary['iqr'])
+            return self
+        self._sketches = None
+        self._update(data)
+        self._refresh()
+        return self
+
+    def partial_fit(self, data: Dataset) -> 'RobustScaler':
+        """
+        Adds a chunk of rows to the sketches fit so far. Only available
+        with approximate=True.
+
+        Parameters
+        ----------
+        data : List[Vector] | DenseMatrix
+            A chunk of the dataset, one row per data point.
+
+        Returns
+        -------
+        RobustScaler
+            The updated scaler (self).
+        """
+        assert self.approximate, 'partial_fit needs approximate=True.'
+        if len(data) == 0:
+            return self
+        self._update(data)
+        self._refresh()
+        return self
+
+    def merge(self, other: 'RobustScaler') -> 'RobustScaler':
+        """
+        Adds the sketches of a scaler fit on another set of rows. Only
+        available with approximate=True.
+
+        Parameters
+        ----------
+        other : RobustScaler
+            The scaler to merge in. It is not modified.
+
+        Returns
+        -------
+        RobustScaler
+            The updated scaler (self).
+        """
+        assert self.approximate and other.approximate, 'merge needs approximate=True.'
+        if other._sketches is None:
+            return self
+        if self._sketches is None:
+            self._sketches = [QuantileSketch(self.k) for _ in other._sketches]
+        assert len(self._sketches) == len(other._sketches), 'Data has the wrong number of columns.'
+        for sketch, other_sketch in zip(self._sketches, other._sketches):
+            sketch.merge(other_sketch)
+        self._refresh()
+        return self
+
+
+if __name__ == '__main__':
+    pass
@@ -0,0 +1,44 @@
+import pytest
+
+from benchmarks import harness as h
+
+
+def _report(results):
+    return {'machine': {}, 'results': results}
+
+
+# TEST COMPARE
+def test_compare_flags_regressions():
+    baseline = _report({'a[1]': 1.0, 'b[1]': 1.0, 'c[1]': 2.0})
+    current = _report({'a[1]': 1.05, 'b[1]': 1.5, 'c[1]': 3.0})
+    regressions = h.compare(baseline, current, threshold=0.1)
+    assert [r[0] for r in regressions] == ['b[1]', 'c[1]']
+    assert regressions[0][3] == pytest.approx(1.5)
+
+def test_compare_ignores_new_and_faster():
+    baseline = _report({'a[1]': 1.0})
+    current = _report({'a[1]': 0.5, 'd[1]': 10.0})
+    assert h.compare(baseline, current) == []
+
+
+# TEST RUN
+def test_run_registered(tmp_path, monkeypatch):
+    # Register into an empty registry so the test can rerun and leaves no trace
+    monkeypatch.setattr(h, '_registry', {})
+
+    @h.benchmark('test_harness.sum', [10, 1000])
+    def setup(n):
+        values = list(range(n))
+        return lambda: sum(values)
+
+    assert h.registered() == {'test_harness.sum': [10, 1000]}
+    report = h.run('test_harness.', quick=True, repeats=1)
+    assert list(report['results']) == ['test_harness.sum[10]']
+    assert report['results']['test_harness.sum[10]'] > 0
+    path = str(tmp_path / 'results.json')
+    h.save(report, path)
+    assert h.load(path) == report
+
+
+if __name__ == '__main__':
+    pass
@@ -0,0 +1,104 @@
+import random
+import pytest
+
+from src.wizardml.math.stats import bootstrap as b
+from src.wizardml.math.stats import stats as s
+
+
+# TEST BOOTSTRAP_SAMPLE
+def test_bootstrap_sample_size():
+    data = [1, 2, 3, 4, 5]
+    result = b.bootstrap_sample(data)
+    assert len(result) == len(data)
+    assert all(x in data for x in result)
+
+def test_bootstrap_sample_seeded():
+    data = list(range(100))
+    assert b.bootstrap_sample(data, random.Random(1)) == b.bootstrap_sample(data, random.Random(1))
+
+
+# TEST RESAMPLE_INDICES
+def test_resample_indices_range():
+    indices = list(b.resample_indices(50, seed=3))
+    assert len(indices) == 50
+    assert all(0 <= i < 50 for i in indices)
+
+def test_resample_indices_seeded():
+    assert list(b.resample_indices(50, 3)) == list(b.resample_indices(50, 3))
+
+
+# TEST BOOTSTRAP_STATISTIC
+def test_bootstrap_statistic_count():
+    data = [float(i) for i in range(20)]
+    result = b.bootstrap_statistic(data, s.mean, 30, seed=0)
+    assert len(result) == 30
+    assert all(0 <= stat <= 19 for stat in result)
+
+def test_bootstrap_statistic_constant():
+    data = [2.0] * 10
+    assert b.bootstrap_statistic(data, s.median, 5, seed=0) == [2.0] * 5
+
+def test_bootstrap_statistic_seeded():
+    data = [float(i) for i in range(20)]
+    first = b.bootstrap_statistic(data, s.mean, 10, seed=42)
+    second = b.bootstrap_statistic(data, s.mean, 10, seed=42)
+    assert first == second
+
+def test_bootstrap_statistic_workers_match_serial():
+    data = [float(i) ** 0.5 for i in range(200)]
+    serial = b.bootstrap_statistic(data, s.median, 17, seed=5)
+    parallel = b.bootstrap_statistic(data, s.median, 17, seed=5, workers=3)
+    assert parallel == serial
+
+def test_bootstrap_statistic_workers_non_numeric():
+    data = ['a', 'b', 'b', 'c']
+    serial = b.bootstrap_statistic(data, s.mode, 9, seed=5)
+    parallel = b.bootstrap_statistic(data, s.mode, 9, seed=5, workers=2)
+    assert parallel == serial
+
+def test_bootstrap_statistic_empty():
+    with pytest.raises(AssertionError, match=r'.*non-empty.*'):
+        b.bootstrap_statistic([], s.mean, 10)
+
+
+
+# TEST RESAMPLE_COUNTS
+def test_resample_counts_match_indices():
+    indices = list(b.resample_indices(30, seed=4))
+    counts = list(b.resample_counts(30, seed=4))
+    assert sum(counts) == 30
+    assert counts == [indices.count(i) for i in range(30)]
+
+
+# TEST BOOTSTRAP_LINEAR_STATISTIC
+@pytest.mark.parametrize('stat_func', [s.mean, s.variance])
+def test_bootstrap_linear_statistic_matches(stat_func):
+    data = [float(i % 7) + 0.1 * i for i in range(50)]
+    expected_result = b.bootstrap_statistic(data, stat_func, 40, seed=9)
+    result = b.bootstrap_linear_statistic(stat_func, 40, data, seed=9)
+    assert pytest.approx(result) == expected_result
+
+def test_bootstrap_linear_statistic_cov():
+    x = [float(i % 7) for i in range(50)]
+    y = [float(i % 5) - i for i in range(50)]
+    pairs = list(zip(x, y))
+    def pair_cov(sample):
+        return s.cov([p[0] for p in sample], [p[1] for p in sample])
+    expected_result = b.bootstrap_statistic(pairs, pair_cov, 40, seed=9)
+    result = b.bootstrap_linear_statistic(s.cov, 40, x, y, seed=9)
+    assert pytest.approx(result) == expected_result
+
+def test_bootstrap_linear_statistic_single():
+    assert b.bootstrap_linear_statistic(s.variance, 3, [5.0], seed=1) == [0, 0, 0]
+
+def test_bootstrap_linear_statistic_unsupported():
+    with pytest.raises(AssertionError, match=r'.*stat_func.*'):
+        b.bootstrap_linear_statistic(s.median, 3, [1.0, 2.0])
+
+def test_bootstrap_linear_statistic_cov_one_list():
+    with pytest.raises(AssertionError, match=r'.*two lists.*'):
+        b.bootstrap_linear_statistic(s.cov, 3, [1.0, 2.0])
+
+
+if __name__ == '__main__':
+    pass
@@ -0,0 +1,109 @@
+import pytest
+
+from src.wizardml.math.gradient_descent import callbacks as c
+from src.wizardml.math.gradient_descent import optimizers as o
+
+# DEFINE TEST FUNCTIONS
+def run_epochs(callbacks, losses, params=None):
+    # Feeds a list of losses through a training state, as a fit would
+    params = params if params is not None else [0.0]
+    state = c.TrainingState(params, o.SGD(0.1), callbacks)
+    state.begin()
+    for epoch, loss in enumerate(losses):
+        state.begin_epoch(epoch)
+        params[0] = float(epoch)
+        state.end_batch(1)
+        if state.end_epoch(loss, val_loss=loss):
+            break
+    return state.end()
+
+
+# TEST HISTORY
+def test_history():
+    history = run_epochs([], [3.0, 1.0, 2.0])
+    assert len(history) == 3
+    assert history['loss'] == [3.0, 1.0, 2.0]
+    assert history['learning_rate'] == [0.1, 0.1, 0.1]
+    assert history.best()['epoch'] == 1
+    assert history.stopped_epoch == None
+    assert history.to_dict()['epochs'][2]['val_loss'] == 2.0
+
+def test_history_empty():
+    assert c.History().best() == None
+
+
+# TEST CALLBACK
+def test_callback_events():
+    events = []
+
+    class Recorder(c.Callback):
+        def on_train_begin(self, state):
+            events.append('begin')
+        def on_batch_end(self, state, batch, size):
+            events.append(('batch', batch, size))
+        def on_epoch_end(self, state, record):
+            events.append(('epoch', record['epoch']))
+        def on_train_end(self, state):
+            events.append('end')
+
+    run_epochs([Recorder()], [1.0, 0.5])
+    assert events == ['begin', ('batch', 0, 1), ('epoch', 0),
+                      ('batch', 0, 1), ('epoch', 1), 'end']
+
+
+# TEST EARLY_STOPPING
+def test_early_stopping():
+    stopping = c.EarlyStopping(patience=2)
+    params = [0.0]
+    history = run_epochs([stopping], [5.0, 3.0, 4.0, 3.5, 3.2, 1.0], params)
+    assert history.stopped_epoch == 4
+    assert stopping.best_epoch == 1
+    # The parameters of the best epoch are restored
+    assert params == [1.0]
+
+def test_early_stopping_min_delta():
+    stopping = c.EarlyStopping(monitor='loss', patience=0, min_delta=0.5, restore_best=False)
+    params = [0.0]
+    history = run_epochs([stopping], [5.0, 4.8, 1.0], params)
+    assert history.stopped_epoch == 1
+    assert params == [1.0]
+
+def test_early_stopping_missing_monitor():
+    state = c.TrainingState([0.0], o.SGD(), [c.EarlyStopping()])
+    state.begin()
+    with pytest.raises(AssertionError, match=r'.*val_loss is not recorded.*'):
+        state.end_epoch(1.0)
+
+
+# TEST LEARNING_RATE_SCHEDULER
+def test_step_decay():
+    schedule = c.step_decay(0.1, factor=0.5, every=2)
+    assert pytest.approx([schedule(epoch) for epoch in range(5)]) == [0.1, 0.1, 0.05, 0.05, 0.025]
+
+def test_exponential_decay():
+    schedule = c.exponential_decay(1.0, rate=0.5)
+    assert [schedule(epoch) for epoch in range(3)] == [1.0, 0.5, 0.25]
+
+def test_learning_rate_scheduler():
+    history = run_epochs([c.LearningRateScheduler(c.exponential_decay(1.0, 0.5))], [1.0, 1.0, 1.0])
+    assert history['learning_rate'] == [1.0, 0.5, 0.25]
+
+
+# TEST CHECKPOINT
+def test_checkpoint_best_only(tmp_path):
+    path = str(tmp_path / 'checkpoint.json')
+    checkpoint = c.Checkpoint(path)
+    run_epochs([checkpoint], [3.0, 1.0, 2.0])
+    assert checkpoint.epoch == 1
+    assert checkpoint.params == [1.0]
+    assert c.Checkpoint.load(path) == [1.0]
+
+def test_checkpoint_every_epoch():
+    checkpoint = c.Checkpoint(save_best_only=False)
+    run_epochs([checkpoint], [3.0, 1.0, 2.0])
+    assert checkpoint.epoch == 2
+    assert checkpoint.params == [2.0]
+
+
+if __name__ == '__main__':
+    pass
@@ -0,0 +1,136 @@
+import random
+import pytest
+
+from src.wizardml.classifiers.linear_models import linear_regression as lr
+from src.wizardml.math.gradient_descent import gradient_descent as g
+from src.wizardml.math.linear_algebra import matrix as m
+from src.wizardml.preprocessing import dataset as d
+from src.wizardml.preprocessing import scaler as s
+
+
+def _dataset(n=50):
+    rng = random.Random(0)
+    x = [[rng.random(), rng.random(), rng.random()] for _ in range(n)]
+    y = [2 * a - b + 0.5 * c + 1 for a, b, c in x]
+    return x, y
+
+
+# TEST SAVE_DATASET
+def test_save_load_round_trip(tmp_path):
+    x, y = _dataset()
+    path = str(tmp_path / 'data.wz')
+    d.save_dataset(path, x, y)
+    with d.load_dataset(path) as dataset:
+        assert dataset.shape == (50, 3)
+        assert len(dataset) == 50
+        assert dataset.x.to_rows() == x
+        assert list(dataset.y) == y
+
+def test_save_dense_without_targets(tmp_path):
+    x, _ = _dataset()
+    path = str(tmp_path / 'data.wz')
+    d.save_dataset(path, m.DenseMatrix.from_rows(x))
+    with d.load_dataset(path) as dataset:
+        assert dataset.x.to_rows() == x
+        assert dataset.y == None
+
+def test_file_layout(tmp_path):
+    path = str(tmp_path / 'data.wz')
+    d.save_dataset(path, [[1, 2], [3, 4]], [5, 6])
+    with open(path, 'rb') as file:
+        content = file.read()
+    assert content[:8] == d.MAGIC
+    assert len(content) == d.HEADER_SIZE + 8 * 6
+
+
+# TEST DATASET_WRITER
+def test_writer_chunks(tmp_path):
+    x, y = _dataset()
+    path = str(tmp_path / 'data.wz')
+    with d.DatasetWriter(path, 3, targets=True) as writer:
+        for start in range(0, 50, 16):
+            writer.write(x[start:start + 16], y[start:start + 16])
+    with d.load_dataset(path) as dataset:
+        assert dataset.x.to_rows() == x
+        assert list(dataset.y) == y
+
+def test_writer_requires_targets(tmp_path):
+    with d.DatasetWriter(str(tmp_path / 'data.wz'), 2, targets=True) as writer:
+        with pytest.raises(AssertionError, match=r'.*Targets.*'):
+            writer.write([[1, 2]])
+        writer.write([[1, 2]], [3])
+
+
+# TEST LOAD_DATASET
+def test_load_invalid(tmp_path):
+    path = tmp_path / 'data.wz'
+    path.write_bytes(b'not a dataset' * 10)
+    with pytest.raises(ValueError, match=r'.*Not a wizardml dataset.*'):
+        d.load_dataset(str(path))
+
+def test_load_truncated(tmp_path):
+    path = str(tmp_path / 'data.wz')
+    d.save_dataset(path, [[1, 2], [3, 4]])
+    with open(path, 'r+b') as file:
+        file.truncate(d.HEADER_SIZE + 8)
+    with pytest.raises(ValueError, match=r'.*truncated.*'):
+        d.load_dataset(path)
+
+def test_load_copy_on_write(tmp_path):
+    path = str(tmp_path / 'data.wz')
+    d.save_dataset(path, [[1, 2], [4, 5], [7, 8]])
+    dataset = d.load_dataset(path, mode='c')
+    s.StandardScaler().fit_transform(dataset.x, out=dataset.x)
+    assert dataset.x[0, 0] == pytest.approx(-1)
+    with d.load_dataset(path) as original:
+        assert original.x[0, 0] == 1
+
+def test_load_read_write(tmp_path):
+    path = str(tmp_path / 'data.wz')
+    d.save_dataset(path, [[1, 2], [3, 4]])
+    with d.load_dataset(path, mode='r+') as dataset:
+        dataset.x[1, 1] = 10
+        dataset.flush()
+    with d.load_dataset(path) as dataset:
+        assert dataset.x.to_rows() == [[1, 2], [3, 10]]
+
+
+# TEST BATCHES
+def test_batches(tmp_path):
+    x, y = _dataset()
+    path = str(tmp_path / 'data.wz')
+    d.save_dataset(path, x, y)
+    with d.load_dataset(path) as dataset:
+        batches = list(dataset.batches(16))
+        assert [len(x_batch) for x_batch, _ in batches] == [16, 16, 16, 2]
+        assert batches[1][0].to_rows() == x[16:32]
+        assert list(batches[3][1]) == y[48:]
+
+def test_batches_feed_fitters(tmp_path):
+    x, y = _dataset(200)
+    path = str(tmp_path / 'data.wz')
+    d.save_dataset(path, x, y)
+    with d.load_dataset(path) as dataset:
+        assert lr.fit_stream(dataset.batches(64)) == pytest.approx([2, -1, 0.5, 1])
+        assert lr.fit_least_squares_exact(dataset.x, dataset.y) == pytest.approx([2, -1, 0.5, 1])
+        scaler = s.StandardScaler()
+        for x_batch, _ in dataset.batches(64):
+            scaler.partial_fit(x_batch)
+        assert scaler.mean == pytest.approx(s.StandardScaler().fit(x).mean)
+        sampler = g.MinibatchSampler(len(dataset), 32, seed=0)
+        rows = sum(len(x_batch) for x_batch, _ in sampler.batches(dataset.x, dataset.y))
+        assert rows == 200
+
+def test_gradient_fit_on_mapped(tmp_path):
+    random.seed(0)
+    x, y = _dataset(100)
+    path = str(tmp_path / 'data.wz')
+    d.save_dataset(path, x, y)
+    with d.load_dataset(path) as dataset:
+        beta = lr.fit_least_squares_gradient(dataset.x, dataset.y, learning_rate=0.1,
+                                             num_steps=300, batch_size=10)
+    assert beta == pytest.approx([2, -1, 0.5, 1], abs=0.05)
+
+
+if __name__ == '__main__':
+    pass
@@ -0,0 +1,57 @@
+import pytest
+
+from src.wizardml.math.linear_algebra import decomposition as d
+from src.wizardml.math.linear_algebra import matrix as m
+
+
+# TEST CHOLESKY
+def test_cholesky_identity():
+    result = d.cholesky(m.identity_matrix(3))
+    assert result.to_rows() == m.identity_matrix(3)
+
+def test_cholesky_factor():
+    a = [[4, 12, -16], [12, 37, -43], [-16, -43, 98]]
+    expected_result = [[2, 0, 0], [6, 1, 0], [-8, 5, 3]]
+    result = d.cholesky(a)
+    assert pytest.approx(result.data.tolist()) == sum(expected_result, [])
+
+def test_cholesky_not_positive_definite():
+    a = [[1, 2], [2, 1]]
+    with pytest.raises(ValueError, match=r'.*positive definite.*'):
+        d.cholesky(a)
+
+def test_cholesky_singular():
+    a = [[1, 1], [1, 1]]
+    with pytest.raises(ValueError, match=r'.*positive definite.*'):
+        d.cholesky(a)
+
+
+# TEST CHOLESKY_SOLVE
+def test_cholesky_solve():
+    a = [[4, 12, -16], [12, 37, -43], [-16, -43, 98]]
+    x = [1.0, -2.0, 0.5]
+    b = list(m.matvec(a, x))
+    result = d.cholesky_solve(d.cholesky(a), b)
+    assert pytest.approx(list(result)) == x
+
+
+# TEST QR_SOLVE
+def test_qr_solve_square():
+    a = [[2, 1], [1, 3]]
+    result = d.qr_solve(a, [3, 5])
+    assert pytest.approx(list(result)) == [0.8, 1.4]
+
+def test_qr_solve_least_squares():
+    a = [[1, 1], [2, 1], [3, 1], [4, 1]]
+    b = [3.0, 5.0, 7.0, 9.5]
+    result = d.qr_solve(a, b)
+    assert pytest.approx(list(result)) == [2.15, 0.75]
+
+def test_qr_solve_rank_deficient():
+    a = [[1, 2], [2, 4], [3, 6]]
+    with pytest.raises(ValueError, match=r'.*full column rank.*'):
+        d.qr_solve(a, [1, 2, 3])
+
+
+if __name__ == '__main__':
+    pass
@@ -1,6 +1,8 @@
 import pytest
 
 from src.wizardml.math.gradient_descent import gradient_descent as g
+from src.wizardml.math.linear_algebra import matrix as m
+from src.wizardml.math.linear_algebra import vector as v
 
 # DEFINE TEST FUNCTIONS
 # Define a linear function: f(v) = 2v + 1
@@ -44,6 +46,56 @@ def test_estimate_gradient_quadratic():
     result = g.estimate_gradient(quadratic_function, v, h)
     assert pytest.approx(result, abs=2*h) == expected_result
 
+def test_estimate_gradient_central():
+    v = [1.0, -2.0, 3.0]
+    h = 0.01
+    expected_result = [2.0, 3.0, -1.0]
+    result = g.estimate_gradient(quadratic_function, v, h, central=True)
+    assert pytest.approx(result, abs=1e-9) == expected_result
+
+def test_estimate_gradient_single_base_call():
+    calls = []
+    def counted(v):
+        calls.append(list(v))
+        return quadratic_function(v)
+    v = [1.0, -2.0, 3.0]
+    g.estimate_gradient(counted, v)
+    assert len(calls) == len(v) + 1
+    assert v == [1.0, -2.0, 3.0]
+
+def test_estimate_gradient_batched():
+    calls = []
+    def batched_function(points):
+        calls.append(points.shape)
+        return [quadratic_function(row) for row in points]
+    v = [1.0, -2.0, 3.0]
+    h = 0.0001
+    result = g.estimate_gradient(batched_function, v, h, batched=True)
+    assert calls == [(4, 3)]
+    assert pytest.approx(result) == g.estimate_gradient(quadratic_function, v, h)
+
+def test_estimate_gradient_batched_central():
+    def batched_function(points):
+        return [quadratic_function(row) for row in points]
+    v = [1.0, -2.0, 3.0]
+    result = g.estimate_gradient(batched_function, v, 0.01, central=True, batched=True)
+    assert pytest.approx(result, abs=1e-9) == [2.0, 3.0, -1.0]
+
+
+# TEST COMPUTE_GRADIENT
+def test_compute_gradient_analytic():
+    def fail(v):
+        raise AssertionError('f should not be evaluated')
+    def gradient(v):
+        return [2 * v[0], 3.0, -1.0]
+    result = g.compute_gradient(fail, [1.0, -2.0, 3.0], gradient_func=gradient)
+    assert result == [2.0, 3.0, -1.0]
+
+def test_compute_gradient_estimated():
+    v = [1.0, 2.0, 3.0]
+    result = g.compute_gradient(linear_function, v, h=0.001)
+    assert pytest.approx(result) == [2.0, 2.0, 2.0]
+
 # TEST GRADIENT_STEP
 def test_gradient_step_linear():
     v = [1.0, 2.0, 3.0]
@@ -84,5 +136,63 @@ def test_minibatch_shuffle():
     assert result != unexpected_result
 
 
+# TEST TAKE
+def test_take_list():
+    assert g.take([1, 2, 3, 4], [3, 0]) == [4, 1]
+    assert g.take([1, 2, 3, 4], range(1, 3)) == [2, 3]
+
+def test_take_array():
+    data = v.as_array([1, 2, 3, 4])
+    result = g.take(data, [3, 0])
+    assert type(result) == type(data)
+    assert list(result) == [4, 1]
+
+def test_take_matrix():
+    data = m.DenseMatrix.from_rows([[1, 2], [3, 4], [5, 6]])
+    assert g.take(data, [2, 0]).to_rows() == [[5, 6], [1, 2]]
+    assert g.take(data, range(1, 3)).to_rows() == [[3, 4], [5, 6]]
+
+
+# TEST MINIBATCH_SAMPLER
+def test_minibatch_sampler_no_shuffle():
+    sampler = g.MinibatchSampler(10, 3, shuffle=False)
+    result = [list(indices) for indices in sampler]
+    assert result == [[0, 1, 2], [3, 4, 5], [6, 7, 8], [9]]
+    assert len(sampler) == 4
+
+def test_minibatch_sampler_percentage():
+    sampler = g.MinibatchSampler(10, 0.4, shuffle=False)
+    assert [len(indices) for indices in sampler] == [4, 4, 2]
+
+def test_minibatch_sampler_zero_batch():
+    with pytest.raises(AssertionError, match=r'.*greater than 0.*'):
+        g.MinibatchSampler(10, 0)
+
+def test_minibatch_sampler_epoch_covers_rows():
+    sampler = g.MinibatchSampler(10, 3, seed=1)
+    first = [i for indices in sampler.epoch() for i in indices]
+    second = [i for indices in sampler.epoch() for i in indices]
+    assert sorted(first) == list(range(10))
+    assert sorted(second) == list(range(10))
+    assert first != second
+
+def test_minibatch_sampler_seeded():
+    first = [list(indices) for indices in g.MinibatchSampler(10, 3, seed=7)]
+    second = [list(indices) for indices in g.MinibatchSampler(10, 3, seed=7)]
+    assert first == second
+
+def test_minibatch_sampler_batches_aligned():
+    x = [[i, i] for i in range(10)]
+    y = [10 * i for i in range(10)]
+    sampler = g.MinibatchSampler(10, 4, seed=3)
+    for batch_x, batch_y in sampler.batches(x, y):
+        assert [10 * x_i[0] for x_i in batch_x] == batch_y
+
+def test_minibatch_sampler_batches_unequal():
+    sampler = g.MinibatchSampler(3, 2)
+    with pytest.raises(AssertionError, match=r'.*equal length.*'):
+        list(sampler.batches([1, 2, 3], [1, 2]))
+
+
 if __name__ == '__main__':
     pass
@@ -0,0 +1,85 @@
+import gc
+import json
+import pytest
+
+from src.wizardml.math.gradient_descent import instrumentation as ins
+
+
+# TEST PHASE
+def test_phase_accumulates():
+    profile = ins.Instrumentation()
+    for _ in range(3):
+        with profile.phase('work'):
+            sum(range(1000))
+    stats = profile.to_dict()['phases']['work']
+    assert stats['calls'] == 3
+    assert stats['seconds'] > 0
+    assert 'allocated_blocks' not in stats
+
+def test_phase_allocations():
+    profile = ins.Instrumentation(track_allocations=True)
+    # A garbage collection inside the phase would free blocks of earlier
+    # tests and offset the count, so keep the collector off
+    gc.disable()
+    try:
+        with profile.phase('allocate'):
+            kept = [[i] for i in range(1000)]
+    finally:
+        gc.enable()
+    assert profile.phases['allocate']['allocated_blocks'] >= 1000
+    assert len(kept) == 1000
+
+def test_phase_records_on_error():
+    profile = ins.Instrumentation()
+    with pytest.raises(ZeroDivisionError):
+        with profile.phase('fail'):
+            1 / 0
+    assert profile.phases['fail']['calls'] == 1
+
+
+# TEST COUNT
+def test_count():
+    profile = ins.Instrumentation()
+    profile.count('batches')
+    profile.count('samples', 32)
+    profile.count('samples', 8)
+    assert profile.counters == {'batches': 1, 'samples': 40}
+
+
+# TEST END_EPOCH
+def test_end_epoch_callback():
+    seen = []
+    profile = ins.Instrumentation(on_epoch=seen.append)
+    profile.end_epoch(100, 0.5, loss=2.0)
+    record = profile.end_epoch(100, 0.25)
+    assert record['epoch'] == 1
+    assert record['samples_per_second'] == 400
+    assert seen == profile.epochs
+    assert seen[0]['loss'] == 2.0
+
+def test_end_epoch_zero_time():
+    profile = ins.Instrumentation()
+    assert profile.end_epoch(10, 0.0)['samples_per_second'] == None
+
+
+# TEST EXPORT
+def test_to_json():
+    profile = ins.Instrumentation()
+    with profile.phase('work'):
+        pass
+    profile.count('samples', 3)
+    profile.end_epoch(3, 0.1, loss=1.5)
+    exported = json.loads(profile.to_json())
+    assert exported == profile.to_dict()
+    assert exported['counters'] == {'samples': 3}
+    assert exported['epochs'][0]['loss'] == 1.5
+
+def test_reset():
+    profile = ins.Instrumentation()
+    profile.count('samples')
+    profile.reset()
+    assert profile.to_dict() == {'phases': {}, 'counters': {}, 'epochs': []}
+
+
+if __name__ == '__main__':
+    pass
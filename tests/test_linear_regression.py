@@ -1,6 +1,12 @@
+import random
 import pytest
 
 from src.wizardml.classifiers.linear_models import linear_regression as l
+from src.wizardml.math.linear_algebra import matrix as m
+from src.wizardml.math.linear_algebra import vector as v
+from src.wizardml.math.gradient_descent import optimizers as o
+from src.wizardml.math.gradient_descent import instrumentation as ins
+from src.wizardml.math.gradient_descent import callbacks as c
 
 # TODO
 # Finish linear regression fit tests
@@ -50,6 +56,230 @@ def test_squared_error_gradient():
     # assert pytest.approx(result[0]) == expected_result[0]
     # assert pytest.approx(result[1]) == expected_result[1]
 
+# TEST SQUARED_ERROR_GRADIENT_BATCH
+def test_squared_error_gradient_batch():
+    x = [[1.0, 2.0, 1.0], [3.0, -1.0, 1.0], [0.5, 0.5, 1.0]]
+    y = [2.0, 1.0, -1.0]
+    beta = [0.5, 0.25, 0.75]
+    per_sample = [[2 * (l.predict(x_i, beta) - y_i) * x_ij for x_ij in x_i]
+                  for x_i, y_i in zip(x, y)]
+    expected_result = [sum(column) / 3 for column in zip(*per_sample)]
+    result = l.squared_error_gradient_batch(m.DenseMatrix.from_rows(x), y, beta)
+    assert pytest.approx(list(result)) == expected_result
+
+def test_ridge_squared_error_gradient_batch():
+    x = [[1.0, 2.0, 1.0], [3.0, -1.0, 1.0]]
+    y = [2.0, 1.0]
+    beta = [0.5, 0.25, 0.75]
+    batch = m.DenseMatrix.from_rows(x)
+    expected_result = v.add(list(l.squared_error_gradient_batch(batch, y, beta)), [0.5, 0.25, 0.0])
+    result = l.ridge_squared_error_gradient_batch(batch, y, beta, alpha=0.5)
+    assert pytest.approx(list(result)) == expected_result
+
+
+# TEST FIT_LEAST_SQUARES_GRADIENT
+def test_fit_least_squares_gradient():
+    random.seed(0)
+    x = [[i / 10, (i % 4) / 4] for i in range(20)]
+    y = [3 * x_i[0] - 2 * x_i[1] + 1 for x_i in x]
+    result = l.fit_least_squares_gradient(x, y, learning_rate=0.1, num_steps=2000, batch_size=5)
+    assert pytest.approx(result, abs=1e-3) == [3.0, -2.0, 1.0]
+    assert x[0] == [0.0, 0.0]
+
+def test_fit_least_squares_ridge():
+    random.seed(0)
+    x = [[i / 10] for i in range(20)]
+    y = [2 * x_i[0] + 1 for x_i in x]
+    result = l.fit_least_squares_ridge(x, y, learning_rate=0.05, num_steps=3000,
+                                       batch_size=20, alpha=0.1)
+    # Full batch descent minimizes the mean squared error plus the penalty,
+    # i.e. the exact ridge problem with alpha scaled by the number of points
+    expected_result = l.fit_least_squares_ridge_exact(x, y, alpha=0.1 * 20)
+    assert pytest.approx(result, abs=1e-4) == expected_result
+
+def test_fit_least_squares_gradient_early_stopping():
+    random.seed(0)
+    x = [[i / 10, (i % 4) / 4] for i in range(20)]
+    y = [3 * x_i[0] - 2 * x_i[1] + 1 for x_i in x]
+    optimizer = o.Adam(0.05)
+    result = l.fit_least_squares_gradient(x, y, num_steps=100000, batch_size=20,
+                                          optimizer=optimizer, tol=1e-6)
+    assert pytest.approx(result, abs=1e-4) == [3.0, -2.0, 1.0]
+    assert optimizer.steps < 100000
+
+def test_fit_least_squares_gradient_instrumented():
+    random.seed(0)
+    x = [[i / 10, (i % 4) / 4] for i in range(20)]
+    y = [3 * x_i[0] - 2 * x_i[1] + 1 for x_i in x]
+    losses = []
+    profile = ins.Instrumentation(on_epoch=lambda record: losses.append(record['loss']))
+    result = l.fit_least_squares_gradient(x, y, learning_rate=0.1, num_steps=2000,
+                                          batch_size=5, instrumentation=profile)
+    random.seed(0)
+    expected_result = l.fit_least_squares_gradient(x, y, learning_rate=0.1, num_steps=2000,
+                                                   batch_size=5)
+    assert result == expected_result
+    assert len(profile.epochs) == 2000
+    assert profile.counters['samples'] == 20 * 2000
+    assert profile.phases['gradient']['calls'] == profile.counters['batches']
+    assert {'setup', 'batch', 'gradient', 'step', 'loss'} <= profile.phases.keys()
+    assert losses[-1] < losses[0]
+
+def test_fit_least_squares_gradient_history():
+    random.seed(0)
+    x = [[i / 10, (i % 4) / 4] for i in range(20)]
+    y = [3 * x_i[0] - 2 * x_i[1] + 1 for x_i in x]
+    result, history = l.fit_least_squares_gradient(x, y, learning_rate=0.1, num_steps=50,
+                                                   batch_size=5, return_history=True)
+    assert len(history) == 50
+    assert history['loss'][-1] < history['loss'][0]
+    residuals = [l.predict(x_i + [1.0], result) - y_i for x_i, y_i in zip(x, y)]
+    assert pytest.approx(history['loss'][-1]) == sum(r * r for r in residuals) / len(x)
+
+def test_fit_least_squares_gradient_early_stopping_validation():
+    random.seed(0)
+    x = [[i / 10, (i % 4) / 4] for i in range(20)]
+    y = [3 * x_i[0] - 2 * x_i[1] + 1 for x_i in x]
+    x_val = [[i / 7, (i % 3) / 3] for i in range(10)]
+    y_val = [3 * x_i[0] - 2 * x_i[1] + 1 for x_i in x_val]
+    stopping = c.EarlyStopping(patience=50, min_delta=1e-12)
+    result, history = l.fit_least_squares_gradient(x, y, num_steps=100000, batch_size=20,
+                                                   optimizer=o.Adam(0.05),
+                                                   callbacks=[stopping],
+                                                   validation_data=(x_val, y_val),
+                                                   return_history=True)
+    assert history.stopped_epoch is not None
+    assert len(history) < 100000
+    assert pytest.approx(result, abs=1e-3) == [3.0, -2.0, 1.0]
+
+def test_fit_least_squares_ridge_callbacks(tmp_path):
+    random.seed(0)
+    x = [[i / 10] for i in range(20)]
+    y = [2 * x_i[0] + 1 for x_i in x]
+    path = str(tmp_path / 'ridge.json')
+    checkpoint = c.Checkpoint(path)
+    scheduler = c.LearningRateScheduler(c.step_decay(0.05, factor=0.5, every=100))
+    result, history = l.fit_least_squares_ridge(x, y, num_steps=300, batch_size=20, alpha=0.1,
+                                                callbacks=[scheduler, checkpoint],
+                                                return_history=True)
+    assert history['learning_rate'][-1] == 0.0125
+    assert c.Checkpoint.load(path) == checkpoint.params
+    assert checkpoint.epoch == history.best()['epoch']
+
+def test_fit_least_squares_gradient_tol_history():
+    random.seed(0)
+    x = [[i / 10, (i % 4) / 4] for i in range(20)]
+    y = [3 * x_i[0] - 2 * x_i[1] + 1 for x_i in x]
+    _, history = l.fit_least_squares_gradient(x, y, num_steps=100000, batch_size=20,
+                                              optimizer=o.Adam(0.05), tol=1e-6,
+                                              return_history=True)
+    assert history.converged
+    assert history.stopped_epoch is None
+
+
+# TEST FIT_LEAST_SQUARES_EXACT
+def test_fit_least_squares_exact():
+    x = [[1.0, 0.0], [2.0, 1.0], [3.0, -1.0], [4.0, 2.0], [5.0, 0.5]]
+    y = [3 * x_i[0] - 2 * x_i[1] + 1 for x_i in x]
+    result = l.fit_least_squares_exact(x, y)
+    assert pytest.approx(result) == [3.0, -2.0, 1.0]
+
+def test_fit_least_squares_exact_keeps_data():
+    x = [[1.0], [2.0], [3.0]]
+    y = [2.0, 4.0, 6.0]
+    l.fit_least_squares_exact(x, y)
+    assert x == [[1.0], [2.0], [3.0]]
+
+def test_fit_least_squares_exact_no_intercept():
+    x = [[1.0], [2.0], [3.0]]
+    y = [2.0, 4.0, 6.0]
+    result = l.fit_least_squares_exact(x, y, fit_intercept=False)
+    assert pytest.approx(result) == [2.0]
+
+def test_fit_least_squares_exact_chunks(monkeypatch):
+    monkeypatch.setattr(l, 'CHUNK_SIZE', 2)
+    x = [[1.0, 0.0], [2.0, 1.0], [3.0, -1.0], [4.0, 2.0], [5.0, 0.5]]
+    y = [3 * x_i[0] - 2 * x_i[1] + 1 for x_i in x]
+    result = l.fit_least_squares_exact(x, y)
+    assert pytest.approx(result) == [3.0, -2.0, 1.0]
+
+def test_fit_least_squares_exact_ill_conditioned():
+    # Second column is the first up to a tiny perturbation
+    x = [[float(i), i + 1e-7 * (-1) ** i] for i in range(10)]
+    y = [2 * x_i[0] + 1 for x_i in x]
+    result = l.fit_least_squares_exact(x, y)
+    predictions = [l.predict(x_i + [1.0], result) for x_i in x]
+    assert pytest.approx(predictions) == y
+
+def test_fit_least_squares_exact_collinear():
+    x = [[1.0, 2.0], [2.0, 4.0], [3.0, 6.0]]
+    y = [1.0, 2.0, 3.0]
+    with pytest.raises(ValueError):
+        l.fit_least_squares_exact(x, y)
+
+
+# TEST FIT_LEAST_SQUARES_RIDGE_EXACT
+def test_fit_least_squares_ridge_exact():
+    x = [[1.0], [2.0], [3.0]]
+    y = [2.0, 4.0, 6.0]
+    # (x^T x + alpha) beta = x^T y with centred data: (2 + 2) beta = 4
+    result = l.fit_least_squares_ridge_exact(x, y, alpha=2.0)
+    assert pytest.approx(result[0]) == 1.0
+    assert pytest.approx(result[1]) == 2.0
+
+def test_fit_least_squares_ridge_exact_collinear():
+    x = [[1.0, 2.0], [2.0, 4.0], [3.0, 6.0]]
+    y = [1.0, 2.0, 3.0]
+    result = l.fit_least_squares_ridge_exact(x, y, alpha=1.0)
+    assert len(result) == 3
+
+
+# TEST SUFFICIENT_STATISTICS
+def _stream_data():
+    x = [[float(i), float(i % 3)] for i in range(20)]
+    y = [0.5 * x_i[0] - x_i[1] + 2 for x_i in x]
+    return x, y
+
+def test_sufficient_statistics_partial_fit():
+    x, y = _stream_data()
+    stats = l.SufficientStatistics()
+    for start in range(0, 20, 6):
+        stats.partial_fit(x[start:start + 6], y[start:start + 6])
+    assert stats.count == 20
+    assert pytest.approx(stats.solve()) == l.fit_least_squares_exact(x, y)
+
+def test_sufficient_statistics_merge():
+    x, y = _stream_data()
+    left = l.SufficientStatistics().partial_fit(x[:7], y[:7])
+    right = l.SufficientStatistics().partial_fit(x[7:], y[7:])
+    merged = l.SufficientStatistics().merge(left).merge(right)
+    assert merged.count == 20
+    assert pytest.approx(merged.solve()) == [0.5, -1.0, 2.0]
+
+def test_sufficient_statistics_sum_of_squared_errors():
+    x, y = _stream_data()
+    stats = l.SufficientStatistics().partial_fit(x, y)
+    beta = [0.5, -1.0, 1.0]
+    assert pytest.approx(stats.sum_of_squared_errors(beta)) == 20.0
+
+def test_sufficient_statistics_unequal():
+    with pytest.raises(AssertionError, match=r'.*equal length.*'):
+        l.SufficientStatistics().partial_fit([[1.0]], [1.0, 2.0])
+
+
+# TEST FIT_STREAM
+def test_fit_stream():
+    x, y = _stream_data()
+    chunks = ((x[start:start + 4], y[start:start + 4]) for start in range(0, 20, 4))
+    result = l.fit_stream(chunks)
+    assert pytest.approx(result) == [0.5, -1.0, 2.0]
+
+def test_fit_stream_ridge():
+    x, y = _stream_data()
+    result = l.fit_stream([(x, y)], alpha=3.0)
+    assert pytest.approx(result) == l.fit_least_squares_ridge_exact(x, y, alpha=3.0)
+
+
 # TEST TOTAL_SUM_OF_SQUARES
 # def test_total_sum_of_squares():
     # y = [1.0, 2.0, 3.0, 4.0]
@@ -120,5 +120,82 @@ def test_identify_matrix_2():
     assert m.identity_matrix(2) == [[1, 0], [0, 1]]
 
 
+
+# TEST DENSE MATRIX
+def test_dense_matrix_from_rows():
+    a = m.DenseMatrix.from_rows([[1, 2, 3], [4, 5, 6]])
+    assert a.shape == (2, 3)
+    assert a[1, 2] == 6
+    assert list(a.row(1)) == [4, 5, 6]
+    assert list(a.column(0)) == [1, 4]
+    assert a.to_rows() == [[1, 2, 3], [4, 5, 6]]
+
+def test_dense_matrix_bad_data():
+    with pytest.raises(AssertionError, match=r'.*rows \* columns.*'):
+        m.DenseMatrix(2, 2, [1.0, 2.0, 3.0])
+
+def test_dense_matrix_helpers():
+    a = m.DenseMatrix.from_rows([[1, 2, 3], [4, 5, 6]])
+    assert m.shape(a) == (2, 3)
+    assert list(m.get_row(a, 0)) == [1, 2, 3]
+    assert m.get_column(a, 2) == [3, 6]
+
+def test_dense_matrix_identity():
+    assert m.DenseMatrix.identity(2).to_rows() == m.identity_matrix(2)
+
+
+# TEST TRANSPOSE
+def test_transpose_list():
+    a = [[1, 2, 3], [4, 5, 6]]
+    assert m.transpose(a) == [[1, 4], [2, 5], [3, 6]]
+
+def test_transpose_dense():
+    a = m.DenseMatrix.from_rows([[1, 2, 3], [4, 5, 6]])
+    assert m.transpose(a) == m.DenseMatrix.from_rows([[1, 4], [2, 5], [3, 6]])
+
+
+# TEST MATMUL
+def test_matmul_unaligned():
+    a = [[1, 2, 3]]
+    with pytest.raises(AssertionError, match=r'.*not aligned.*'):
+        m.matmul(a, a)
+
+def test_matmul_identity():
+    a = [[1, 2], [3, 4]]
+    assert m.matmul(a, m.identity_matrix(2)) == a
+
+def test_matmul_list():
+    a = [[1, 2, 3], [4, 5, 6]]
+    b = [[7, 8], [9, 10], [11, 12]]
+    assert m.matmul(a, b) == [[58, 64], [139, 154]]
+
+def test_matmul_blocked():
+    n = m.BLOCK_SIZE + 3
+    a = m.build_matrix(n, n, lambda i, j: i - j)
+    b = m.build_matrix(n, n, lambda i, j: (i * j) % 7)
+    expected = [[sum(a_ik * b_kj for a_ik, b_kj in zip(row, column))
+                 for column in m.get_column(b)] for row in a]
+    result = m.matmul(m.DenseMatrix.from_rows(a), m.DenseMatrix.from_rows(b))
+    assert result.to_rows() == expected
+
+def test_matmul_blocked_rectangular():
+    # Partial tiles of rows and of columns, with n != m
+    a = m.build_matrix(2 * m.BLOCK_SIZE + 1, 5, lambda i, j: i + j)
+    b = m.build_matrix(5, m.BLOCK_SIZE + 2, lambda i, j: i - 2 * j)
+    expected = [[sum(a_ik * b_kj for a_ik, b_kj in zip(row, column))
+                 for column in m.get_column(b)] for row in a]
+    assert m.matmul(a, b) == expected
+
+
+# TEST MATVEC
+def test_matvec_unaligned():
+    with pytest.raises(AssertionError, match=r'.*not aligned.*'):
+        m.matvec([[1, 2, 3]], [1, 2])
+
+def test_matvec():
+    a = [[1, 2, 3], [4, 5, 6]]
+    assert list(m.matvec(a, [1, 0, -1])) == [-2, -2]
+
+
 if __name__ == '__main__':
     pass
\ No newline at end of file
@@ -0,0 +1,125 @@
+import random
+import pytest
+
+from src.wizardml.math.stats import moments as mo
+from src.wizardml.math.stats import stats as s
+
+
+# TEST MOMENTS
+def test_moments_empty():
+    moments = mo.Moments()
+    assert moments.variance == None
+    assert moments.std == None
+
+def test_moments_single():
+    moments = mo.Moments().update(100)
+    assert moments.mean == 100
+    assert moments.variance == 0
+
+def test_moments_update():
+    moments = mo.Moments()
+    for x in [0, 5, 10, 15, 20]:
+        moments.update(x)
+    assert moments.mean == 10
+    assert moments.variance == 62.5
+
+def test_moments_update_many_iterator():
+    moments = mo.Moments().update_many(x for x in [0, 5, 10, 15, 20])
+    assert moments.count == 5
+    assert moments.variance == 62.5
+
+def test_moments_chunks(monkeypatch):
+    monkeypatch.setattr(mo, 'CHUNK_SIZE', 3)
+    rng = random.Random(0)
+    x = [rng.random() for _ in range(20)]
+    assert len(set(x)) == 20
+    moments = mo.Moments().update_many(x)
+    assert pytest.approx(moments.mean) == s.mean(x)
+    assert pytest.approx(moments.variance) == sum((xi - s.mean(x)) ** 2 for xi in x) / 19
+
+def test_moments_merge():
+    rng = random.Random(1)
+    x = [rng.gauss(5, 2) for _ in range(100)]
+    left = mo.Moments().update_many(x[:30])
+    right = mo.Moments().update_many(x[30:])
+    merged = mo.Moments().merge(left).merge(right)
+    expected = mo.Moments().update_many(x)
+    assert merged.count == 100
+    assert pytest.approx(merged.mean) == expected.mean
+    assert pytest.approx(merged.variance) == expected.variance
+
+def test_moments_stable_large_offset():
+    x = [1e9 + v for v in [4.0, 7.0, 13.0, 16.0]]
+    moments = mo.Moments()
+    for xi in x:
+        moments.update(xi)
+    assert moments.variance == 30.0
+
+
+# TEST COMOMENTS
+def test_comoments_empty():
+    moments = mo.CoMoments()
+    assert moments.cov == None
+    assert moments.corr == None
+
+def test_comoments_update():
+    moments = mo.CoMoments()
+    for x, y in zip([0, 2, 3, 4], [0, 1, 5, 10]):
+        moments.update(x, y)
+    assert pytest.approx(moments.cov) == 7
+    assert pytest.approx(moments.corr) == 0.901611
+
+def test_comoments_update_many():
+    moments = mo.CoMoments().update_many([1, 2, 3, 4, 5], [10, 9, 8, 7, 6])
+    assert moments.cov == -2.5
+    assert pytest.approx(moments.corr) == -1
+    assert moments.x.variance == 2.5
+
+def test_comoments_merge():
+    rng = random.Random(2)
+    x = [rng.random() for _ in range(50)]
+    y = [xi + rng.random() for xi in x]
+    merged = mo.CoMoments().update_many(x[:20], y[:20]).merge(
+        mo.CoMoments().update_many(x[20:], y[20:]))
+    assert merged.count == 50
+    assert pytest.approx(merged.cov) == s.cov(x, y)
+    assert pytest.approx(merged.corr) == s.corr(x, y)
+
+def test_comoments_constant():
+    moments = mo.CoMoments().update_many([1, 1, 1], [1, 2, 3])
+    assert moments.corr == 0
+
+
+# TEST COMOMENT_MATRIX
+def test_comoment_matrix_empty():
+    moments = mo.CoMomentMatrix()
+    assert moments.cov == None
+    assert moments.corr == None
+
+def test_comoment_matrix_chunked(monkeypatch):
+    monkeypatch.setattr(mo, 'CHUNK_SIZE', 4)
+    rng = random.Random(4)
+    rows = [[1e6 + rng.random(), rng.random()] for _ in range(30)]
+    x, y = [list(column) for column in zip(*rows)]
+    moments = mo.CoMomentMatrix().update_many(iter(rows))
+    assert moments.count == 30
+    assert moments.cov[0, 0] == pytest.approx(s.variance(x))
+    assert moments.cov[0, 1] == pytest.approx(s.cov(x, y))
+    assert moments.corr[1, 0] == pytest.approx(s.corr(x, y))
+
+def test_comoment_matrix_merge():
+    rng = random.Random(5)
+    rows = [[rng.random(), rng.random(), rng.random()] for _ in range(50)]
+    merged = mo.CoMomentMatrix().update_many(rows[:15]).merge(
+        mo.CoMomentMatrix().update_many(rows[15:]))
+    whole = mo.CoMomentMatrix().update_many(rows)
+    assert merged.count == 50
+    assert merged.cov.data.tolist() == pytest.approx(whole.cov.data.tolist())
+
+def test_comoment_matrix_single_row():
+    moments = mo.CoMomentMatrix().update_many([[1, 2]])
+    assert moments.cov.data.tolist() == [0, 0, 0, 0]
+
+
+if __name__ == '__main__':
+    pass
@@ -0,0 +1,104 @@
+import pytest
+
+from src.wizardml.math.gradient_descent import optimizers as o
+
+# DEFINE TEST FUNCTIONS
+# Gradient of f(v) = sum(a_i * (v_i - 1)^2) / 2, minimized at v = [1, 1, 1]
+def quadratic_gradient(v):
+    return [a * (v_i - 1) for a, v_i in zip([3.0, 1.0, 0.2], v)]
+
+def quadratic_function(v):
+    return sum(a * (v_i - 1) ** 2 for a, v_i in zip([3.0, 1.0, 0.2], v)) / 2
+
+
+# TEST STEP
+def test_sgd_step():
+    params = [1.0, 2.0]
+    result = o.SGD(0.1).step(params, [1.0, -1.0])
+    assert result is params
+    assert pytest.approx(params) == [0.9, 2.1]
+
+def test_step_unequal():
+    with pytest.raises(AssertionError, match=r'.*equal size.*'):
+        o.SGD().step([1.0, 2.0], [1.0])
+
+def test_momentum_step():
+    optimizer = o.Momentum(0.1, momentum=0.5)
+    params = [0.0]
+    optimizer.step(params, [1.0])
+    optimizer.step(params, [1.0])
+    # Velocities 1 then 1.5
+    assert pytest.approx(params) == [-0.25]
+
+def test_nesterov_step():
+    optimizer = o.Nesterov(0.1, momentum=0.5)
+    params = [0.0]
+    optimizer.step(params, [1.0])
+    # Velocity 1, step gradient + 0.5 * velocity
+    assert pytest.approx(params) == [-0.15]
+
+def test_adagrad_step():
+    params = [0.0, 0.0]
+    o.AdaGrad(0.1).step(params, [2.0, -0.5])
+    assert pytest.approx(params) == [-0.1, 0.1]
+
+def test_adam_first_step():
+    params = [0.0, 0.0]
+    o.Adam(0.1).step(params, [2.0, -0.5])
+    assert pytest.approx(params) == [-0.1, 0.1]
+
+def test_buffers_reused():
+    optimizer = o.Adam(0.1)
+    params = [0.0, 0.0]
+    optimizer.step(params, [1.0, 1.0])
+    buffer = optimizer._state['first_moment']
+    optimizer.step(params, [1.0, 1.0])
+    assert optimizer._state['first_moment'] is buffer
+    assert optimizer.steps == 2
+
+def test_reset():
+    optimizer = o.Momentum(0.1)
+    optimizer.step([0.0], [1.0])
+    optimizer.reset()
+    assert optimizer.steps == 0
+    assert optimizer._state == {}
+
+
+# TEST CONVERGENCE
+def test_convergence_gradient():
+    convergence = o.Convergence(grad_tol=0.1)
+    assert not convergence.check(gradient=[1.0, 0.0])
+    assert convergence.check(gradient=[0.01, 0.0])
+
+def test_convergence_loss():
+    convergence = o.Convergence(loss_tol=0.1)
+    assert not convergence.check(loss=10.0)
+    assert not convergence.check(loss=5.0)
+    assert convergence.check(loss=4.95)
+
+
+# TEST MINIMIZE
+@pytest.mark.parametrize('optimizer', [
+    o.SGD(0.3), o.Momentum(0.1), o.Nesterov(0.1),
+    o.AdaGrad(0.5), o.Adam(0.1), o.LBFGS(0.3)])
+def test_minimize(optimizer):
+    result = o.minimize(quadratic_gradient, [0.0, 0.0, 0.0], optimizer,
+                        max_steps=5000, grad_tol=1e-8)
+    assert pytest.approx(result, abs=1e-6) == [1.0, 1.0, 1.0]
+    assert optimizer.steps < 5000
+
+def test_minimize_lbfgs_faster_than_sgd():
+    sgd, lbfgs = o.SGD(0.3), o.LBFGS(0.3)
+    o.minimize(quadratic_gradient, [0.0, 0.0, 0.0], sgd, max_steps=5000)
+    o.minimize(quadratic_gradient, [0.0, 0.0, 0.0], lbfgs, max_steps=5000)
+    assert lbfgs.steps < sgd.steps
+
+def test_minimize_loss_tol():
+    optimizer = o.SGD(0.3)
+    o.minimize(quadratic_gradient, [0.0, 0.0, 0.0], optimizer, max_steps=5000,
+               grad_tol=None, f=quadratic_function, loss_tol=1e-3)
+    assert 0 < optimizer.steps < 100
+
+
+if __name__ == '__main__':
+    pass
@@ -1,7 +1,10 @@
+import math
 import pytest
 from random import random
+from statistics import NormalDist
 
 from src.wizardml.math.stats import probability as p
+from src.wizardml.math.linear_algebra import vector as v
 
 
 # TEST UNIFORM_PDF
@@ -110,5 +113,114 @@ def test_normal_cdf_random():
     assert p.normal_cdf(x, mu, sigma) <= 1
 
 
+# TEST UNIFORM
+def test_uniform_matches_scalar():
+    xs = [-1, 0, 0.3987, 1, 2]
+    assert p.uniform_pdf_many(xs) == [p.uniform_pdf(x) for x in xs]
+    assert p.uniform_cdf_many(xs) == [p.uniform_cdf(x) for x in xs]
+
+def test_uniform_frozen():
+    dist = p.Uniform(2, 6)
+    assert dist.pdf(3) == 0.25
+    assert dist.pdf(7) == 0
+    assert dist.cdf([1, 3, 6, 8]) == [0, 0.25, 1, 1]
+
+def test_uniform_array():
+    xs = v.as_array([-1, 0.5, 2])
+    assert list(p.Uniform().pdf(xs)) == [0, 1, 0]
+    assert list(p.Uniform().cdf(xs)) == [0, 0.5, 1]
+
+def test_uniform_invalid():
+    with pytest.raises(AssertionError, match=r'.*low must be less than high.*'):
+        p.Uniform(1, 1)
+
+
+# TEST NORMAL
+def test_normal_matches_scalar():
+    xs = [-3.5, -1, 0, 0.25, 2, 5]
+    assert pytest.approx(p.normal_pdf_many(xs, 1, 2)) == [p.normal_pdf(x, 1, 2) for x in xs]
+    assert pytest.approx(p.normal_cdf_many(xs, 1, 2)) == [p.normal_cdf(x, 1, 2) for x in xs]
+
+def test_normal_frozen():
+    dist = p.Normal(1, 2)
+    assert pytest.approx(dist.pdf(1)) == 1 / (2 * p.SQRT_TWO_PI)
+    assert dist.cdf(1) == 0.5
+    assert pytest.approx(dist.cdf(3)) == 0.8413447460685429
+
+def test_normal_array():
+    xs = v.as_array([-2.0, 0.0, 2.0])
+    dist = p.Normal()
+    pdf, cdf = dist.pdf(xs), dist.cdf(xs)
+    assert type(pdf) == type(xs) and type(cdf) == type(xs)
+    assert pytest.approx(list(pdf)) == [p.normal_pdf(x) for x in [-2, 0, 2]]
+    assert pytest.approx(list(cdf)) == [p.normal_cdf(x) for x in [-2, 0, 2]]
+
+def test_normal_cdf_lower_tail():
+    # Far below the mean 1 + erf loses every digit, erfc does not
+    assert pytest.approx(p.Normal().cdf(-20), rel=1e-12) == 2.7536241186062337e-89
+
+def test_normal_many_invalid_sigma():
+    assert p.normal_pdf_many([1.0], 0, -1) == None
+    assert p.normal_cdf_many([1.0], 0, 0) == None
+    with pytest.raises(AssertionError, match=r'.*sigma must be positive.*'):
+        p.Normal(0, 0)
+
+def test_normal_many_empty():
+    assert p.normal_pdf_many([]) == []
+
+
+# TEST INVERSE_NORMAL_CDF
+def test_inverse_normal_cdf_known_values():
+    assert p.inverse_normal_cdf(0.5) == 0
+    assert pytest.approx(p.inverse_normal_cdf(0.975), rel=1e-15) == 1.959963984540054
+    assert pytest.approx(p.inverse_normal_cdf(0.9), rel=1e-15) == 1.2815515655446004
+    assert pytest.approx(p.inverse_normal_cdf(1e-10), rel=1e-15) == -6.361340902404056
+
+def test_inverse_normal_cdf_mu_sigma():
+    assert pytest.approx(p.inverse_normal_cdf(0.975, 10, 2)) == 10 + 2 * 1.959963984540054
+
+def test_inverse_normal_cdf_symmetric():
+    # 1 - q is exact for these q
+    for q in [2 ** -40, 2 ** -10, 0.0625, 0.25, 0.375]:
+        assert p.inverse_normal_cdf(q) == -p.inverse_normal_cdf(1 - q)
+
+def test_inverse_normal_cdf_round_trip():
+    # Probabilities spanning all three branches of the approximation. In the
+    # deep tail the steep cdf magnifies rounding in the quantile, so the
+    # round trip is only good to about 1e-12 relative (about 8e-13 measured)
+    for exponent in range(-300, 0, 7):
+        q = 10.0 ** exponent
+        assert pytest.approx(p.Normal().cdf(p.inverse_normal_cdf(q)), rel=1e-12) == q
+    for _ in range(100):
+        q = random()
+        assert pytest.approx(p.normal_cdf(p.inverse_normal_cdf(q)), abs=1e-15) == q
+
+def test_inverse_normal_cdf_matches_statistics():
+    normal = NormalDist(1, 3)
+    for exponent in range(-300, 0, 7):
+        q = 10.0 ** exponent
+        assert pytest.approx(p.inverse_normal_cdf(q, 1, 3), rel=1e-15) == normal.inv_cdf(q)
+    for _ in range(100):
+        q = random()
+        assert pytest.approx(p.inverse_normal_cdf(q, 1, 3), rel=1e-15) == normal.inv_cdf(q)
+
+def test_inverse_normal_cdf_edges():
+    assert p.inverse_normal_cdf(0) == float('-inf')
+    assert p.inverse_normal_cdf(1) == float('inf')
+    assert p.inverse_normal_cdf(1.5) == None
+    assert p.inverse_normal_cdf(0.5, 0, -1) == None
+
+def test_inverse_normal_cdf_many():
+    ps = [0.0, 0.025, 0.5, 0.9, 1e-200, 1.0]
+    expected_result = [p.inverse_normal_cdf(q, 1, 3) for q in ps]
+    assert p.inverse_normal_cdf_many(ps, 1, 3) == expected_result
+    assert list(p.inverse_normal_cdf_many(v.as_array(ps), 1, 3)) == pytest.approx(expected_result, rel=1e-15)
+    assert p.inverse_normal_cdf_many(ps, 0, 0) == None
+
+def test_inverse_normal_cdf_many_invalid():
+    result = p.Normal().ppf([-0.5, 2.0])
+    assert all(math.isnan(z) for z in result)
+
+
 if __name__ == '__main__':
     pass
\ No newline at end of file
@@ -1,19 +1,223 @@
+import random
 import pytest 
 
+from src.wizardml.math.linear_algebra import matrix as m
+from src.wizardml.math.stats import stats as st
 from src.wizardml.preprocessing import scaler as s
 
+
+def _assert_rows_close(result, expected):
+    assert len(result) == len(expected)
+    for row, expected_row in zip(result, expected):
+        assert pytest.approx(list(row)) == expected_row
+
 # TEST SCALE 
 def test_scale():
-    data = [[1, 2, 3], [4, 5, 6] [7, 8, 9]]
+    data = [[1, 2, 3], [4, 5, 6], [7, 8, 9]]
     expected_mean = [4, 5, 6]
-    expected_stdev = [4.2426406, 4.2426406, 4.2426406]
+    expected_stdev = [3, 3, 3]
     mean, stdev = s.scale(data)
     assert pytest.approx(mean) == expected_mean
     assert pytest.approx(stdev) == expected_stdev
 
 # TEST RESCALER
 def test_rescale():
-    data = [[1, 2, 3], [4, 5, 6] [7, 8, 9]]
-    expected_result = [[-0.707107, -0.707107, -0.707107], [0, 0, 0], [0.707107, 0.707107, 0.707107]]
+    data = [[1, 2, 3], [4, 5, 6], [7, 8, 9]]
+    expected_result = [[-1, -1, -1], [0, 0, 0], [1, 1, 1]]
     result = s.rescale(data)
-    assert pytest.approx(result) == expected_result
\ No newline at end of file
+    _assert_rows_close(result, expected_result)
+
+# TEST STANDARD_SCALER
+def test_standard_scaler_fit():
+    scaler = s.StandardScaler().fit([[1, 2, 3], [4, 5, 6], [7, 8, 9]])
+    assert pytest.approx(scaler.mean) == [4, 5, 6]
+    assert pytest.approx(scaler.std) == [3, 3, 3]
+
+def test_standard_scaler_matches_rescale():
+    data = [[1, 20, 3], [4, 5, 6], [7, 8, -9], [2, 0, 1]]
+    result = s.StandardScaler().fit_transform(data)
+    expected = s.rescale(data)
+    _assert_rows_close(result, expected)
+
+def test_standard_scaler_new_rows():
+    scaler = s.StandardScaler().fit([[1, 2], [4, 5], [7, 8]])
+    assert pytest.approx(scaler.transform([[10, 2]])[0]) == [2, -1]
+
+def test_standard_scaler_constant_column():
+    result = s.StandardScaler().fit_transform([[1, 5], [3, 5]])
+    assert pytest.approx([row[1] for row in result]) == [0, 0]
+
+def test_standard_scaler_inverse():
+    data = [[1.5, 2], [4, -5], [7, 8], [0, 0]]
+    scaler = s.StandardScaler().fit(data)
+    restored = scaler.inverse_transform(scaler.transform(data))
+    _assert_rows_close(restored, data)
+
+def test_standard_scaler_dense():
+    data = [[1, 2, 3], [4, 5, 6], [7, 8, 9]]
+    result = s.StandardScaler().fit_transform(m.DenseMatrix.from_rows(data))
+    assert isinstance(result, m.DenseMatrix)
+    _assert_rows_close(result, [[-1, -1, -1], [0, 0, 0], [1, 1, 1]])
+
+def test_standard_scaler_in_place():
+    data = [[1, 2], [4, 5], [7, 8]]
+    rows = [row for row in data]
+    result = s.StandardScaler().fit_transform(data, out=data)
+    assert result is data
+    assert all(a is b for a, b in zip(data, rows))
+    _assert_rows_close(data, [[-1, -1], [0, 0], [1, 1]])
+
+def test_standard_scaler_in_place_dense():
+    dense = m.DenseMatrix.from_rows([[1, 2], [4, 5], [7, 8]])
+    buffer = dense.data
+    s.StandardScaler().fit_transform(dense, out=dense)
+    assert dense.data is buffer
+    _assert_rows_close(dense, [[-1, -1], [0, 0], [1, 1]])
+
+def test_standard_scaler_chunked(monkeypatch):
+    monkeypatch.setattr(s, 'CHUNK_SIZE', 2)
+    data = [[i, i * i] for i in range(7)]
+    scaler = s.StandardScaler().fit(data)
+    assert pytest.approx(scaler.mean) == [3, 13]
+    assert pytest.approx(scaler.std[1]) == 13.490738
+
+def test_standard_scaler_not_fit():
+    with pytest.raises(AssertionError, match=r'.*fit first.*'):
+        s.StandardScaler().transform([[1, 2]])
+
+
+# TEST PARTIAL_FIT
+def test_partial_fit_matches_fit():
+    data = [[i, (i * 7) % 5, i * i] for i in range(20)]
+    scaler = s.StandardScaler()
+    for start in range(0, 20, 6):
+        scaler.partial_fit(data[start:start + 6])
+    expected = s.StandardScaler().fit(data)
+    assert scaler.count == 20
+    assert pytest.approx(scaler.mean) == expected.mean
+    assert pytest.approx(scaler.std) == expected.std
+
+def test_partial_fit_dense_chunks():
+    data = [[1e8 + i, -i] for i in range(9)]
+    scaler = s.StandardScaler()
+    for start in range(0, 9, 4):
+        scaler.partial_fit(m.DenseMatrix.from_rows(data[start:start + 4]))
+    assert pytest.approx(scaler.mean) == [1e8 + 4, -4]
+    assert pytest.approx(scaler.std) == [2.738613, 2.738613]
+
+def test_partial_fit_empty():
+    scaler = s.StandardScaler().partial_fit([])
+    assert scaler.count == 0
+
+def test_standard_scaler_merge():
+    data = [[i, i % 3] for i in range(15)]
+    left = s.StandardScaler().fit(data[:4])
+    right = s.StandardScaler().fit(data[4:])
+    merged = s.StandardScaler().merge(left).merge(right)
+    expected = s.StandardScaler().fit(data)
+    assert merged.count == 15
+    assert pytest.approx(merged.mean) == expected.mean
+    assert pytest.approx(merged.std) == expected.std
+    assert left.count == 4
+
+
+# TEST TRANSFORM_STREAM
+def test_transform_stream():
+    data = [[i, 2 * i] for i in range(10)]
+    chunks = [data[start:start + 3] for start in range(0, 10, 3)]
+    scaler = s.StandardScaler()
+    for chunk in chunks:
+        scaler.partial_fit(chunk)
+    result = [row for chunk in scaler.transform_stream(iter(chunks)) for row in chunk]
+    _assert_rows_close(result, s.StandardScaler().fit_transform(data))
+
+def test_transform_stream_in_place():
+    chunks = [[[1, 2], [4, 5]], [[7, 8]]]
+    scaler = s.StandardScaler().fit([row for chunk in chunks for row in chunk])
+    for chunk, result in zip(chunks, scaler.transform_stream(chunks, in_place=True)):
+        assert result is chunk
+    _assert_rows_close(chunks[0] + chunks[1], [[-1, -1], [0, 0], [1, 1]])
+
+
+# TEST MIN_MAX_SCALER
+def test_min_max_scaler():
+    data = [[1, -2], [3, 8], [2, 3]]
+    scaler = s.MinMaxScaler().fit(data)
+    assert scaler.min == [1, -2]
+    assert scaler.max == [3, 8]
+    _assert_rows_close(scaler.transform(data), [[0, 0], [1, 1], [0.5, 0.5]])
+    _assert_rows_close(scaler.inverse_transform(scaler.transform(data)), data)
+
+def test_min_max_scaler_partial_fit():
+    data = [[i, -i * i] for i in range(10)]
+    scaler = s.MinMaxScaler().partial_fit(data[:3]).partial_fit(m.DenseMatrix.from_rows(data[3:]))
+    assert scaler.min == [0, -81]
+    assert scaler.max == [9, 0]
+    merged = s.MinMaxScaler().fit(data[:5]).merge(s.MinMaxScaler().fit(data[5:]))
+    assert merged.scale == scaler.scale
+
+def test_min_max_scaler_constant_column():
+    result = s.MinMaxScaler().fit_transform([[1, 4], [2, 4]])
+    assert [row[1] for row in result] == [0, 0]
+
+
+# TEST MAX_ABS_SCALER
+def test_max_abs_scaler():
+    data = [[1, -4], [-2, 2], [0, 1]]
+    scaler = s.MaxAbsScaler().fit(data)
+    assert scaler.max_abs == [2, 4]
+    _assert_rows_close(scaler.transform(data), [[0.5, -1], [-1, 0.5], [0, 0.25]])
+
+def test_max_abs_scaler_dense_in_place():
+    dense = m.DenseMatrix.from_rows([[1, -4], [-2, 2]])
+    scaler = s.MaxAbsScaler().partial_fit(dense)
+    scaler.transform(dense, out=dense)
+    _assert_rows_close(dense, [[0.5, -1], [-1, 0.5]])
+
+def test_max_abs_scaler_merge():
+    merged = s.MaxAbsScaler().fit([[1, -5]]).merge(s.MaxAbsScaler().fit([[-3, 2]]))
+    assert merged.max_abs == [3, 5]
+
+
+# TEST ROBUST_SCALER
+def test_robust_scaler():
+    data = [[1, 10], [2, 20], [3, 30], [4, 40], [100, -1000]]
+    columns = [list(column) for column in zip(*data)]
+    scaler = s.RobustScaler().fit(data)
+    assert scaler.median == [st.median(x) for x in columns]
+    assert scaler.iqr == [st.iqr(x) for x in columns]
+    result = scaler.transform(data)
+    assert result[2][0] == 0
+    assert result[1][1] == 0
+
+def test_robust_scaler_dense():
+    data = [[1, 10], [2, 20], [3, 30], [4, 40]]
+    scaler = s.RobustScaler().fit(m.DenseMatrix.from_rows(data))
+    assert scaler.median == [2.5, 25]
+    assert scaler.iqr == [2, 20]
+
+def test_robust_scaler_approximate():
+    rng = random.Random(6)
+    data = [[rng.gauss(0, 1), rng.random()] for _ in range(5000)]
+    columns = [list(column) for column in zip(*data)]
+    scaler = s.RobustScaler(approximate=True)
+    for start in range(0, 5000, 1000):
+        scaler.partial_fit(data[start:start + 1000])
+    assert scaler.median == pytest.approx([st.median(x) for x in columns], abs=0.05)
+    assert scaler.iqr == pytest.approx([st.iqr(x) for x in columns], abs=0.05)
+
+def test_robust_scaler_approximate_merge():
+    data = [[i] for i in range(100)]
+    merged = s.RobustScaler(approximate=True).fit(data[:50]).merge(
+        s.RobustScaler(approximate=True).fit(data[50:]))
+    exact = s.RobustScaler().fit(data)
+    assert merged.median == exact.median == [49.5]
+    assert merged.iqr == exact.iqr == [50]
+
+def test_robust_scaler_exact_partial_fit():
+    with pytest.raises(AssertionError, match=r'.*approximate=True.*'):
+        s.RobustScaler().partial_fit([[1]])
+
+
+if __name__ == '__main__':
+    pass
@@ -0,0 +1,156 @@
+import bisect
+import random
+from collections import Counter
+import pytest
+
+from src.wizardml.math.stats import sketches as sk
+from src.wizardml.math.stats import stats as s
+
+
+def _rank_error(ordered, value, p):
+    """Distance between the rank of value and the rank asked for, as a fraction."""
+    return abs(bisect.bisect_left(ordered, value) / len(ordered) - p)
+
+
+# TEST QUANTILE_SKETCH
+def test_quantile_sketch_empty():
+    sketch = sk.QuantileSketch()
+    assert sketch.quantile(0.5) == None
+    assert sketch.median() == None
+    assert sketch.iqr() == None
+
+def test_quantile_sketch_exact_small():
+    x = [3, 6, 1, 10, 7, 4, 9, 2, 5, 8]
+    sketch = sk.QuantileSketch().update_many(x)
+    for p in [0.1, 0.25, 0.5, 0.6, 0.75]:
+        assert sketch.quantile(p) == s.quantile(x, p)
+    assert sketch.iqr() == s.iqr(x)
+
+def test_quantile_sketch_bounded_memory():
+    sketch = sk.QuantileSketch(k=100, seed=0).update_many(range(100000))
+    retained = sum(len(c) for c in sketch._compactors)
+    assert sketch.count == 100000
+    assert retained < 1000
+
+def test_quantile_sketch_accuracy():
+    rng = random.Random(1)
+    x = [rng.gauss(0, 1) for _ in range(50000)]
+    sketch = sk.QuantileSketch(seed=2).update_many(x)
+    ordered = sorted(x)
+    for p in [0.01, 0.25, 0.5, 0.9, 0.99]:
+        assert _rank_error(ordered, sketch.quantile(p), p) < 0.02
+
+def test_quantile_sketch_merge():
+    rng = random.Random(3)
+    x = [rng.random() for _ in range(40000)]
+    left = sk.QuantileSketch(seed=4).update_many(x[:10000])
+    right = sk.QuantileSketch(seed=5).update_many(x[10000:])
+    merged = sk.QuantileSketch(seed=6).merge(left).merge(right)
+    ordered = sorted(x)
+    assert merged.count == 40000
+    for p in [0.1, 0.5, 0.9]:
+        assert _rank_error(ordered, merged.quantile(p), p) < 0.02
+
+def test_quantile_sketch_quantiles_order():
+    sketch = sk.QuantileSketch().update_many(range(100))
+    assert sketch.quantiles([0.9, 0.1, 0.5]) == [90, 10, 50]
+
+def test_quantile_sketch_median():
+    # Even counts average the two middle values, like stats.median
+    assert sk.QuantileSketch().update_many(range(100)).median() == 49.5 == s.median(range(100))
+    assert sk.QuantileSketch().update_many([5, 1, 3]).median() == 3
+
+def test_quantile_sketch_small_k():
+    with pytest.raises(AssertionError, match=r'.*at least 2.*'):
+        sk.QuantileSketch(k=1)
+
+
+# TEST FREQUENCY_SKETCH
+def test_frequency_sketch_empty():
+    sketch = sk.FrequencySketch()
+    assert sketch.mode() == None
+    assert sketch.top_k() == []
+    assert sketch.estimate('a') == 0
+
+def test_frequency_sketch_exact_under_capacity():
+    x = ['a', 'b', 'b', 'c', 'c', 'c', 'd']
+    sketch = sk.FrequencySketch(capacity=4).update_many(x)
+    assert sketch.top_k(2) == [('c', 3), ('b', 2)]
+    assert sketch.mode() == s.mode(x)
+    assert sketch.estimate('a') == 1
+    assert sketch.error('a') == 0
+    assert sketch.estimate('e') == 0
+
+def test_frequency_sketch_update():
+    sketch = sk.FrequencySketch(capacity=2)
+    for xi in [1, 1, 2, 3]:
+        sketch.update(xi)
+    # 3 replaces 2 and inherits its count as error
+    assert sketch.top_k() == [(1, 2), (3, 2)]
+    assert sketch.error(3) == 1
+    assert sketch.count == 4
+
+def test_frequency_sketch_bounds():
+    rng = random.Random(0)
+    x = [int(rng.paretovariate(1.2)) for _ in range(20000)]
+    counts = Counter(x)
+    sketch = sk.FrequencySketch(capacity=20).update_many(x)
+    assert len(sketch.top_k()) == 20
+    for xi, estimate in sketch.top_k():
+        assert estimate - sketch.error(xi) <= counts[xi] <= estimate
+        assert estimate - counts[xi] <= len(x) / 20
+    assert sketch.top_k(3) == counts.most_common(3)
+    assert set(sketch.heavy_hitters(0.05)) >= {xi for xi, c in counts.items() if c > 0.05 * len(x)}
+
+def test_frequency_sketch_merge():
+    rng = random.Random(1)
+    x = [int(rng.paretovariate(1.2)) for _ in range(20000)]
+    counts = Counter(x)
+    left = sk.FrequencySketch(capacity=20).update_many(x[:5000])
+    right = sk.FrequencySketch(capacity=20).update_many(x[5000:])
+    merged = left.merge(right)
+    assert merged.count == 20000
+    for xi, estimate in merged.top_k():
+        assert estimate - merged.error(xi) <= counts[xi] <= estimate
+    assert merged.mode() == s.mode(x)
+
+def test_frequency_sketch_mode_tie_order():
+    # Ties come out in first-seen order, like stats.mode, whatever the hash
+    # seed; with 20 tied strings a hash ordered union would scramble them
+    words = [f'word{i}' for i in range(20, 0, -1)]
+    x = words + words[::-1] + ['rare']
+    assert sk.approx_mode(x) == s.mode(x) == words
+    left = sk.FrequencySketch().update_many(x[:25])
+    right = sk.FrequencySketch().update_many(x[25:])
+    assert left.merge(right).mode() == s.mode(x)
+    assert sk.approx_mode(['b', 'b', 'a', 'a', 'c']) == ['b', 'a']
+
+def test_frequency_sketch_small_capacity():
+    with pytest.raises(AssertionError, match=r'.*at least 1.*'):
+        sk.FrequencySketch(capacity=0)
+
+
+# TEST APPROX_QUANTILE
+def test_approx_quantile_stream():
+    assert sk.approx_quantile((i for i in range(100)), 0.5) == 50
+
+def test_approx_quantile_sketch():
+    sketch = sk.QuantileSketch().update_many(range(100))
+    assert sk.approx_quantile(sketch, 0.25) == 25
+
+
+# TEST APPROX_IQR
+def test_approx_iqr():
+    x = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+    assert sk.approx_iqr(x) == s.iqr(x)
+
+
+# TEST APPROX_MODE
+def test_approx_mode():
+    x = [1, 2, 2, 3, 3, 4]
+    assert sk.approx_mode(x) == s.mode(x)
+    assert sk.approx_mode(iter(x), capacity=3) == [2, 3]
+
+
+if __name__ == '__main__':
+    pass
@@ -1,5 +1,7 @@
+import random
 import pytest
 
+from src.wizardml.math.linear_algebra import matrix as m
 from src.wizardml.math.stats import stats as s
 
 
@@ -117,6 +119,53 @@ def test_quantile_unordered_ten_two():
     x = [3, 6, 1, 10, 7, 4, 9, 2, 5, 8]
     p = 0.1
     assert s.quantile(x, p) == 2
+
+def test_quantile_matches_sort():
+    rng = random.Random(1)
+    x = [rng.randint(0, 50) for _ in range(1000)]
+    for p in [0, 0.01, 0.25, 0.5, 0.9, 0.999]:
+        assert s.quantile(x, p) == sorted(x)[int(len(x) * p)]
+
+def test_quantile_leaves_input():
+    x = [3, 6, 1, 10, 7, 4, 9, 2, 5, 8] * 10
+    before = list(x)
+    s.quantile(x, 0.3)
+    assert x == before
+
+def test_quantile_keeps_random_state():
+    x = [float(i) for i in range(100, 0, -1)]
+    random.seed(3)
+    expected_result = random.random()
+    random.seed(3)
+    s.quantile(x, 0.5)
+    assert random.random() == expected_result
+
+def test_median_matches_sort():
+    rng = random.Random(2)
+    for n in [99, 100]:
+        x = [rng.random() for _ in range(n)]
+        ordered = sorted(x)
+        expected_result = ordered[n // 2] if n % 2 else (ordered[n // 2 - 1] + ordered[n // 2]) / 2
+        assert s.median(x) == expected_result
+
+
+# TEST QUANTILES
+def test_quantiles_null():
+    assert s.quantiles([], [0.5]) == None
+
+def test_quantiles_unordered_ten():
+    x = [3, 6, 1, 10, 7, 4, 9, 2, 5, 8]
+    assert s.quantiles(x, [0.6, 0.1, 0.6]) == [7, 2, 7]
+
+def test_quantiles_match_quantile():
+    rng = random.Random(3)
+    x = [rng.gauss(0, 1) for _ in range(5000)]
+    ps = [0.5, 0.9, 0.99, 0.01]
+    assert s.quantiles(x, ps) == [s.quantile(x, p) for p in ps]
+
+def test_quantiles_duplicates():
+    x = [1] * 500 + [2] * 500 + [0]
+    assert s.quantiles(x, [0, 0.25, 0.5, 0.75]) == [0, 1, 1, 2]
     
 
 # TEST MODE
@@ -287,5 +336,40 @@ def test_correlation_real():
     assert s.corr(x, y) == pytest.approx(0.901611)
 
 
+# TEST COV_MATRIX
+def test_cov_matrix_null():
+    assert s.cov_matrix([]) == None
+
+def test_cov_matrix_pairs():
+    rng = random.Random(3)
+    matrix = [[rng.random(), rng.gauss(5, 2), rng.randrange(4)] for _ in range(40)]
+    columns = [list(column) for column in zip(*matrix)]
+    result = s.cov_matrix(matrix)
+    for i in range(3):
+        for j in range(3):
+            assert result[i][j] == pytest.approx(s.cov(columns[i], columns[j]))
+
+def test_cov_matrix_dense():
+    matrix = m.DenseMatrix.from_rows([[0, 0], [2, 1], [3, 5], [4, 10]])
+    result = s.cov_matrix(matrix)
+    assert isinstance(result, m.DenseMatrix)
+    assert result[0, 1] == pytest.approx(7)
+    assert result[1, 0] == pytest.approx(7)
+
+
+# TEST CORR_MATRIX
+def test_corr_matrix_null():
+    assert s.corr_matrix([]) == None
+
+def test_corr_matrix_pairs():
+    matrix = [[0, 10, 1], [2, 9, 1], [3, 8, 1], [4, 7, 1]]
+    result = s.corr_matrix(matrix)
+    assert result[0][0] == pytest.approx(1)
+    assert result[0][1] == pytest.approx(s.corr([0, 2, 3, 4], [10, 9, 8, 7]))
+    assert result[1][0] == result[0][1]
+    # Correlations with a constant column are zero
+    assert result[2] == [0, 0, 0]
+
+
 if __name__ == '__main__':
     pass
\ No newline at end of file
@@ -0,0 +1,73 @@
+import random
+import pytest
+
+from src.wizardml.math.linear_algebra import matrix as m
+from src.wizardml.math.stats import stats as s
+from src.wizardml.math.stats import moments as mo
+from src.wizardml.math.stats import summary as su
+
+
+def _columns(matrix):
+    return [list(column) for column in zip(*matrix)]
+
+
+# TEST DESCRIBE
+def test_describe_null():
+    assert su.describe([]) == None
+
+def test_describe_no_columns():
+    assert su.describe([[]]) == None
+    assert su.describe([[], []]) == None
+    assert su.describe(m.DenseMatrix(3, 0)) == None
+
+def test_describe_matches_stats():
+    matrix = [[1, 10], [4, 3], [2, 7], [8, 1], [5, 6], [3, 2]]
+    summary = su.describe(matrix)
+    for j, x in enumerate(_columns(matrix)):
+        column = summary.column(j)
+        assert column['count'] == len(x)
+        assert pytest.approx(column['mean']) == s.mean(x)
+        assert pytest.approx(column['std']) == s.std(x)
+        assert column['min'] == min(x)
+        assert column['max'] == max(x)
+        assert column['q1'] == s.quantile(x, 0.25)
+        assert column['median'] == s.median(x)
+        assert column['q3'] == s.quantile(x, 0.75)
+        assert column['range'] == s.range(x)
+        assert column['iqr'] == s.iqr(x)
+
+def test_describe_dense():
+    rng = random.Random(0)
+    matrix = [[rng.gauss(0, 1), rng.random(), rng.randrange(10)] for _ in range(101)]
+    summary = su.describe(m.DenseMatrix.from_rows(matrix))
+    assert summary.columns == 3
+    assert summary['median'] == [s.median(x) for x in _columns(matrix)]
+    assert summary['iqr'] == [s.iqr(x) for x in _columns(matrix)]
+    assert summary['std'] == pytest.approx([s.std(x) for x in _columns(matrix)])
+
+def test_describe_chunked(monkeypatch):
+    monkeypatch.setattr(mo, 'CHUNK_SIZE', 4)
+    monkeypatch.setattr(su, 'CHUNK_SIZE', 4)
+    matrix = [[i, (i * 7) % 11] for i in range(13)]
+    for data in [matrix, m.DenseMatrix.from_rows(matrix)]:
+        summary = su.describe(data)
+        assert summary['mean'] == pytest.approx([s.mean(x) for x in _columns(matrix)])
+        assert summary['std'] == pytest.approx([s.std(x) for x in _columns(matrix)])
+        assert summary['median'] == [s.median(x) for x in _columns(matrix)]
+
+def test_describe_single_row():
+    summary = su.describe([[3, 4]])
+    assert summary['std'] == [0, 0]
+    assert summary['median'] == [3, 4]
+
+def test_describe_to_dict():
+    summary = su.describe([[1], [2], [3]])
+    table = summary.to_dict()
+    assert list(table) == list(su.STATISTICS)
+    assert table['mean'] == [2]
+    with pytest.raises(KeyError):
+        summary['mode']
+
+
+if __name__ == '__main__':
+    pass
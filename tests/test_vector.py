@@ -262,5 +262,69 @@ def test_distance_float():
     assert v.distance(a, b) == math.sqrt(1.25)
 
 
+
+# TEST ARRAY VECTORS
+def test_as_array_float():
+    a = v.as_array([1, 2, 3])
+    assert len(a) == 3
+    assert list(a) == [1.0, 2.0, 3.0]
+
+def test_add_array():
+    a = v.as_array([1, 2])
+    b = v.as_array([3, 4])
+    result = v.add(a, b)
+    assert type(result) == type(a)
+    assert list(result) == [4, 6]
+
+def test_add_array_unequal():
+    a = v.as_array([1, 2])
+    b = v.as_array([1])
+    with pytest.raises(AssertionError, match=r'.*equal size.*'):
+        v.add(a, b)
+
+def test_subtract_array():
+    a = v.as_array([-1, 2])
+    b = v.as_array([3, -4])
+    result = v.subtract(a, b)
+    assert type(result) == type(a)
+    assert list(result) == [-4, 6]
+
+def test_vector_sum_array():
+    a = v.as_array([1, 1, 1])
+    b = v.as_array([2, 3, 4])
+    d = v.as_array([-1, -1, -1])
+    result = v.vector_sum([a, b, d])
+    assert type(result) == type(a)
+    assert list(result) == [2, 3, 4]
+
+def test_multiply_array():
+    a = v.as_array([1, 2])
+    result = v.scalar_multiply(a, -2)
+    assert type(result) == type(a)
+    assert list(result) == [-2, -4]
+
+def test_vector_mean_array():
+    a = v.as_array([1, 2])
+    b = v.as_array([0, 0])
+    assert list(v.vector_mean([a, b])) == [0.5, 1]
+
+def test_dot_array():
+    a = v.as_array([-1, 2])
+    b = v.as_array([3, -4])
+    assert v.dot(a, b) == -11
+
+def test_distance_array():
+    a = v.as_array([-1, -2, -3])
+    b = v.as_array([3, 2, 1])
+    assert v.distance(a, b) == math.sqrt(48)
+
+def test_array_matches_list_long():
+    a = [0.1 * i for i in range(10000)]
+    b = [1.0 / (i + 1) for i in range(10000)]
+    expected = v.dot(a, b)
+    assert pytest.approx(v.dot(v.as_array(a), v.as_array(b))) == expected
+    assert pytest.approx(list(v.add(v.as_array(a), v.as_array(b)))) == v.add(a, b)
+
+
 if __name__ == '__main__':
     pass
\ No newline at end of file